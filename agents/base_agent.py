@@ -3,8 +3,10 @@ Base agent class for LLC formation assistance.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from config.api_config import APIConfig
+from core.provider_router import get_router
+from core.rate_limiter import Priority
 
 class BaseAgent(ABC):
     """Base class for specialized agents."""
@@ -25,6 +27,9 @@ class BaseAgent(ABC):
             
             # Initialize capabilities based on available API keys
             self.capabilities = self._initialize_capabilities()
+            
+            # LLM providers in preference order, used for failover and hedging
+            self.providers = self._initialize_providers()
         
         except Exception as e:
             raise Exception(f"Failed to initialize agent: {str(e)}")
@@ -37,6 +42,45 @@ class BaseAgent(ABC):
             'data_lookup': bool(self.google_key)
         }
     
+    def _initialize_providers(self) -> List[str]:
+        """Initialize the ordered list of LLM providers with configured API keys."""
+        keys = [
+            ('openai', self.openai_key),
+            ('anthropic', self.anthropic_key),
+            ('cohere', self.cohere_key)
+        ]
+        return [provider for provider, key in keys if key]
+    
+    async def _call_llm(
+        self,
+        request: Callable[[str], Awaitable[Any]],
+        tokens: int = 0,
+        priority: Priority = Priority.INTERACTIVE,
+        hedge: Optional[bool] = None,
+        models: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        Send an LLM request through the shared provider router.
+        
+        Args:
+            request: Coroutine function called with the provider name
+            tokens: Estimated prompt plus completion tokens
+            priority: Scheduling priority for the rate limit governor
+            hedge: Override for whether slow calls are hedged to a second provider
+            models: Model used with each provider, so per-model rate limits apply
+            
+        Returns:
+            The first successful provider response
+        """
+        return await get_router().call(
+            request,
+            self.providers,
+            hedge=hedge,
+            tokens=tokens,
+            priority=priority,
+            models=models
+        )
+    
     def has_capability(self, capability: str) -> bool:
         """
         Check if agent has a specific capability.
@@ -3,6 +3,9 @@ Conversation Manager for handling user interactions and agent delegation.
 """
 
 from typing import Dict, List, Optional, Tuple
+from core.config import Config
+from core.knowledge_index import get_knowledge_index
+from core.rate_limiter import BackpressureLevel, get_governor
 from .agent_manager import AgentManager
 from .nlp.enhanced_processor import EnhancedNLPProcessor, Intent
 from .nlp.conversation_state import ConversationState, Stage
@@ -17,6 +20,12 @@ class ConversationManager:
             self.nlp_processor = EnhancedNLPProcessor()
             self.state = ConversationState()
             
+            # Track provider backpressure reported by the shared governor; the
+            # governor holds the listener weakly and replays current levels
+            self.governor = get_governor()
+            self._backpressure: Dict[str, BackpressureLevel] = {}
+            self.governor.add_backpressure_listener(self._on_backpressure)
+            
             # Initialize consultation flow
             self._consultation_flow = {
                 Stage.INITIAL: {
@@ -110,21 +119,54 @@ class ConversationManager:
                         self.state.update_stage(next_stage)
                         self.state.set_agent(self._consultation_flow[next_stage]['agent'])
                         
-                        return {
+                        return self._with_backpressure({
                             'message': response.get('message', ''),
                             'next_stage': next_stage.name,
                             'delegate_to': self.state.current_agent,
                             'context': self.state.collected_info
-                        }
+                        })
                     
-                    return response
+                    return self._with_backpressure(response)
             
             # Generate response based on intent
-            return self._get_intent_response(intent, confidence, user_input)
+            return self._with_backpressure(
+                self._get_intent_response(intent, confidence, user_input)
+            )
         
         except Exception as e:
             raise Exception(f"Error processing input: {str(e)}")
     
+    def close(self) -> None:
+        """Stop listening for provider backpressure."""
+        self.governor.remove_backpressure_listener(self._on_backpressure)
+        self._backpressure.clear()
+    
+    def _on_backpressure(self, provider: str, model: str, level: BackpressureLevel) -> None:
+        """Record a backpressure change reported by the rate limit governor."""
+        key = f"{provider}/{model}"
+        if level == BackpressureLevel.NORMAL:
+            self._backpressure.pop(key, None)
+        else:
+            self._backpressure[key] = level
+    
+    def get_backpressure(self) -> BackpressureLevel:
+        """Get the highest backpressure level currently reported by any provider."""
+        return max(self._backpressure.values(), default=BackpressureLevel.NORMAL)
+    
+    def _with_backpressure(self, response: Dict) -> Dict:
+        """Attach a backpressure signal to a response while providers are under load."""
+        level = self.get_backpressure()
+        if level == BackpressureLevel.NORMAL:
+            return response
+        
+        return {
+            **response,
+            'backpressure': {
+                'level': level.name,
+                'providers': sorted(self._backpressure)
+            }
+        }
+    
     def _is_global_command(self, user_input: str) -> bool:
         """Check if input is a global command."""
         global_commands = ['help', 'status', 'restart', 'back']
@@ -224,9 +266,31 @@ class ConversationManager:
             'message': "We're already at the beginning! What would you like to know about forming an LLC?"
         }
     
+    def _get_grounded_response(self, user_input: str) -> Optional[Dict]:
+        """Answer from the local knowledge index, if it has a good match."""
+        min_score = Config.KNOWLEDGE_INDEX['min_score']
+        results = [
+            result for result in get_knowledge_index().search(user_input, k=3)
+            if result.score >= min_score
+        ]
+        if not results:
+            return None
+        
+        sections = []
+        for result in results:
+            lines = "\n".join(f"  {line}" for line in result.snippet.splitlines())
+            sections.append(f"• {result.title}\n{lines}")
+        return {
+            'message': "Here's what I found:\n\n" + "\n\n".join(sections),
+            'references': [result.doc_id for result in results]
+        }
+    
     def _get_intent_response(self, intent: Intent, confidence: float, user_input: str) -> Dict:
         """Generate response based on intent."""
         if confidence < 0.3:
+            grounded = self._get_grounded_response(user_input)
+            if grounded:
+                return grounded
             return {
                 'message': (
                     "I'm not quite sure what you're asking. Could you rephrase that? "
@@ -350,8 +414,11 @@ class ConversationManager:
             }
         }
         
-        # Default to help response if intent not found
-        return responses.get(intent, {
+        if intent in responses:
+            return responses[intent]
+        
+        # Answer from local knowledge, defaulting to help response
+        return self._get_grounded_response(user_input) or {
             'message': (
                 "I'm here to help you form your LLC! You can ask me about:\n\n"
                 "• Formation process and requirements\n"
@@ -364,4 +431,4 @@ class ConversationManager:
                 {'text': 'Formation Process'},
                 {'text': 'Ask Question'}
             ]
-        })
+        }
@@ -4,6 +4,8 @@ Evaluation Analyst Agent for analyzing and evaluating business formation decisio
 
 from typing import Dict, Any, List
 from states.state_factory import StateFactory
+from core.cost_optimizer import BusinessProfile, get_cost_optimizer
+from core.refinement import FORMATION_STEPS
 from ..job_descriptions import JobDescriptionGenerator
 
 class EvaluationAnalystAgent:
@@ -55,11 +57,43 @@ class EvaluationAnalystAgent:
                 "next_steps": self._generate_next_steps(context),
                 "warnings": self._generate_warnings(context)
             }
-            
+        
         except Exception as e:
             context["errors"].append(f"Analysis error: {str(e)}")
             return self._generate_error_response(context)
     
+    def evaluate_package(self, workflow_state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate the output of every formation step.
+        
+        A step fails if its output is missing, has status "error" or lists
+        errors. Each issue names the step it belongs to, so refinement can
+        re-run only the failing steps and their dependents.
+        
+        Args:
+            workflow_state: Step outputs keyed by step name
+            
+        Returns:
+            Dictionary with is_valid, invalid_steps and issues
+        """
+        issues = []
+        for step in FORMATION_STEPS:
+            output = workflow_state.get(step.name)
+            if not output:
+                issues.append({"step": step.name, "issue": "Missing output"})
+                continue
+            if output.get("status") == "error" and not output.get("errors"):
+                issues.append({"step": step.name, "issue": "Step reported an error"})
+            for error in output.get("errors", []):
+                issues.append({"step": step.name, "issue": str(error)})
+        
+        invalid_steps = list(dict.fromkeys(issue["step"] for issue in issues))
+        return {
+            "is_valid": not issues,
+            "invalid_steps": invalid_steps,
+            "issues": issues
+        }
+    
     def get_required_job_roles(self) -> List[Dict[str, Any]]:
         """Get required job roles for evaluation and analysis operations."""
         return self.job_generator.create_evaluation_analyst_jobs()
@@ -129,22 +163,29 @@ class EvaluationAnalystAgent:
     def _analyze_cost_benefit(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze costs and benefits."""
         state = StateFactory.get_state(context["request"].state_code)
+        filing_fees = state.get_filing_fees()
+        registered_agent = state.get_registered_agent_fees()
+        legal_services = self._estimate_legal_costs(context)
+        annual_fees = state.get_annual_fees()
+        compliance = self._estimate_compliance_costs(context)
+        professional_services = self._estimate_service_costs(context)
         
         return {
             "costs": {
                 "initial": {
-                    "filing_fees": state.get_filing_fees(),
-                    "registered_agent": state.get_registered_agent_fees(),
-                    "legal_services": self._estimate_legal_costs(context),
-                    "total": self._calculate_total_initial_costs(context)
+                    "filing_fees": filing_fees,
+                    "registered_agent": registered_agent,
+                    "legal_services": legal_services,
+                    "total": filing_fees + registered_agent + legal_services
                 },
                 "ongoing": {
-                    "annual_fees": state.get_annual_fees(),
-                    "compliance": self._estimate_compliance_costs(context),
-                    "professional_services": self._estimate_service_costs(context),
-                    "total": self._calculate_total_ongoing_costs(context)
+                    "annual_fees": annual_fees,
+                    "compliance": compliance,
+                    "professional_services": professional_services,
+                    "total": annual_fees + compliance + professional_services
                 }
             },
+            "state_comparison": self._compare_state_costs(context),
             "benefits": {
                 "primary": [
                     "Limited liability protection",
@@ -308,6 +349,14 @@ class EvaluationAnalystAgent:
                 self._estimate_compliance_costs(context) +
                 self._estimate_service_costs(context))
     
+    def _compare_state_costs(self, context: Dict[str, Any], top_k: int = 5) -> Dict[str, Any]:
+        """Rank all states by total cost of ownership for this business."""
+        profile = BusinessProfile.from_details(context["request"])
+        return {
+            "horizon_years": profile.horizon_years,
+            "lowest_cost_states": get_cost_optimizer().rank(profile, top_k=top_k)
+        }
+    
     def _estimate_financial_benefits(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Estimate financial benefits."""
         return {
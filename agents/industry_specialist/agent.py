@@ -4,6 +4,7 @@ Industry Specialist Agent for handling industry-specific LLC formation requireme
 
 from typing import Dict, List, Optional
 from ..base_agent import BaseAgent, AgentCapability
+from .industry_data import GENERIC_INDUSTRY, INDUSTRY_DATA
 from rich.table import Table
 from rich.panel import Panel
 
@@ -141,60 +142,7 @@ class IndustrySpecialistAgent(BaseAgent):
     
     def _get_industry_info(self, industry_type: str) -> Dict:
         """Get detailed information for specific industry."""
-        industry_data = {
-            'tech_startup': {
-                'name': 'Technology Startup',
-                'requirements': [
-                    ('IP Protection', 'Essential', 'Patents, Trademarks, NDAs'),
-                    ('Data Privacy', 'Required', 'GDPR, CCPA Compliance'),
-                    ('Tech Insurance', 'Required', 'Cyber Liability Coverage'),
-                    ('Dev Contracts', 'Essential', 'Contractor Agreements')
-                ],
-                'timeline': [
-                    'Business Plan & MVP Definition',
-                    'IP Protection Setup',
-                    'Technical Infrastructure',
-                    'Privacy Compliance',
-                    'Funding Structure',
-                    'Launch Preparation'
-                ]
-            },
-            'ecommerce': {
-                'name': 'E-commerce Business',
-                'requirements': [
-                    ('Payment Processing', 'Required', 'PCI Compliance'),
-                    ('Sales Tax', 'Required', 'Multi-state Registration'),
-                    ('Shipping', 'Essential', 'Logistics Setup'),
-                    ('Returns Policy', 'Required', 'Consumer Protection')
-                ],
-                'timeline': [
-                    'Platform Selection',
-                    'Payment Gateway Setup',
-                    'Tax Registration',
-                    'Shipping Integration',
-                    'Inventory System',
-                    'Launch Preparation'
-                ]
-            },
-            # Add more industries here
-        }
-        
-        return industry_data.get(industry_type, {
-            'name': 'Generic Business',
-            'requirements': [
-                ('Business License', 'Required', 'State Registration'),
-                ('Insurance', 'Required', 'General Liability'),
-                ('Permits', 'Varies', 'Local Requirements'),
-                ('Compliance', 'Required', 'Industry Standards')
-            ],
-            'timeline': [
-                'Business Planning',
-                'Registration',
-                'Licensing',
-                'Setup Operations',
-                'Launch Preparation'
-            ]
-        })
+        return INDUSTRY_DATA.get(industry_type, GENERIC_INDUSTRY)
     
     def _create_requirements_table(self, industry_info: Dict) -> Table:
         """Create a requirements table for the industry."""
@@ -0,0 +1,59 @@
+"""
+Industry-specific requirements and formation timelines.
+"""
+
+INDUSTRY_DATA = {
+    'tech_startup': {
+        'name': 'Technology Startup',
+        'requirements': [
+            ('IP Protection', 'Essential', 'Patents, Trademarks, NDAs'),
+            ('Data Privacy', 'Required', 'GDPR, CCPA Compliance'),
+            ('Tech Insurance', 'Required', 'Cyber Liability Coverage'),
+            ('Dev Contracts', 'Essential', 'Contractor Agreements')
+        ],
+        'timeline': [
+            'Business Plan & MVP Definition',
+            'IP Protection Setup',
+            'Technical Infrastructure',
+            'Privacy Compliance',
+            'Funding Structure',
+            'Launch Preparation'
+        ]
+    },
+    'ecommerce': {
+        'name': 'E-commerce Business',
+        'requirements': [
+            ('Payment Processing', 'Required', 'PCI Compliance'),
+            ('Sales Tax', 'Required', 'Multi-state Registration'),
+            ('Shipping', 'Essential', 'Logistics Setup'),
+            ('Returns Policy', 'Required', 'Consumer Protection')
+        ],
+        'timeline': [
+            'Platform Selection',
+            'Payment Gateway Setup',
+            'Tax Registration',
+            'Shipping Integration',
+            'Inventory System',
+            'Launch Preparation'
+        ]
+    },
+    # Add more industries here
+}
+
+# Used for industries without specific guidance
+GENERIC_INDUSTRY = {
+    'name': 'Generic Business',
+    'requirements': [
+        ('Business License', 'Required', 'State Registration'),
+        ('Insurance', 'Required', 'General Liability'),
+        ('Permits', 'Varies', 'Local Requirements'),
+        ('Compliance', 'Required', 'Industry Standards')
+    ],
+    'timeline': [
+        'Business Planning',
+        'Registration',
+        'Licensing',
+        'Setup Operations',
+        'Launch Preparation'
+    ]
+}
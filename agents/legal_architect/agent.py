@@ -4,6 +4,7 @@ Legal Architect Agent for LLC formation.
 
 from typing import Dict, Any, List, Tuple
 from states.state_factory import StateFactory
+from core.foreign_qualification import get_foreign_qualification_planner
 from ..job_descriptions import JobDescriptionGenerator
 
 class LegalArchitectAgent:
@@ -70,6 +71,14 @@ class LegalArchitectAgent:
                 "job_roles": self.get_required_job_roles()
             }
             
+            # Plan foreign registrations in the other states the business operates in
+            operating_states = getattr(context["request"], "operating_states", None)
+            if operating_states:
+                results["foreign_qualification"] = get_foreign_qualification_planner().plan(
+                    context["request"].state_code,
+                    operating_states
+                )
+            
             return results
             
         except Exception as e:
@@ -1,100 +1,167 @@
 import os
+import uuid
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
-from agents.legal_architect.agent import LegalArchitect
-from agents.hr_strategist.agent import HRStrategist
-from agents.financial_expert.agent import FinancialExpert
-from agents.governance_officer.agent import GovernanceOfficer
-from agents.pmo_director.agent import PMODirector
-from agents.evaluation_analyst.agent import EvaluationAnalyst
+from agents.legal_architect.agent import LegalArchitectAgent
+from agents.hr_strategist.agent import HRStrategistAgent
+from agents.financial_expert.agent import FinancialExpertAgent
+from agents.governance_officer.agent import GovernanceOfficerAgent
+from agents.pmo_director.agent import PMODirectorAgent
+from agents.evaluation_analyst.agent import EvaluationAnalystAgent
+from core.checkpoint import CheckpointStore
+from core.refinement import (
+    FORMATION_STEPS,
+    RefinementEngine,
+    StepRunner,
+    WorkflowStep,
+    build_step_input
+)
 
 class AgentManager:
     """Orchestrates the interaction between different AI agents in the LLC Generator system."""
     
-    def __init__(self):
+    def __init__(self, checkpoint_store: Optional[CheckpointStore] = None):
         load_dotenv()
         self.agents = self._initialize_agents()
-        self.workflow_state: Dict = {}
+        self.checkpoints = checkpoint_store or CheckpointStore()
     
     def _initialize_agents(self) -> Dict:
         """Initialize all specialized AI agents."""
         return {
-            "legal": LegalArchitect(api_key=os.getenv("OPENAI_API_KEY")),
-            "hr": HRStrategist(api_key=os.getenv("ANTHROPIC_API_KEY")),
-            "financial": FinancialExpert(api_key=os.getenv("GROQ_API_KEY")),
-            "governance": GovernanceOfficer(api_key=os.getenv("GOOGLE_API_KEY")),
-            "pmo": PMODirector(api_key=os.getenv("COHERE_API_KEY")),
-            "evaluation": EvaluationAnalyst(api_key=os.getenv("EMERGENCEAI_API_KEY"))
+            "legal": LegalArchitectAgent(api_key=os.getenv("OPENAI_API_KEY")),
+            "hr": HRStrategistAgent(api_key=os.getenv("ANTHROPIC_API_KEY")),
+            "financial": FinancialExpertAgent(api_key=os.getenv("GROQ_API_KEY")),
+            "governance": GovernanceOfficerAgent(api_key=os.getenv("GOOGLE_API_KEY")),
+            "pmo": PMODirectorAgent(api_key=os.getenv("COHERE_API_KEY")),
+            "evaluation": EvaluationAnalystAgent(api_key=os.getenv("EMERGENCEAI_API_KEY"))
         }
     
-    async def process_llc_formation(self, business_details: Dict) -> Dict:
+    async def process_llc_formation(
+        self,
+        business_details: Dict,
+        formation_id: Optional[str] = None
+    ) -> Dict:
         """
         Orchestrate the LLC formation process through all agents.
         
+        Each completed step is checkpointed, and steps already checkpointed
+        for the same formation and inputs are skipped. Workflow state is kept
+        per run, so several formations can be processed concurrently.
+        
         Args:
             business_details: Dictionary containing business information
+            formation_id: Identifier used to checkpoint and resume the run
             
         Returns:
             Dict containing the complete LLC formation package
         """
-        # Step 1: Legal Structure and Compliance
-        legal_structure = await self.agents["legal"].process(business_details)
-        self.workflow_state["legal"] = legal_structure
-        
-        # Step 2: HR Setup and EIN Assignment
-        hr_setup = await self.agents["hr"].process({
-            **business_details,
-            "legal_structure": legal_structure
-        })
-        self.workflow_state["hr"] = hr_setup
-        
-        # Step 3: Financial Setup
-        financial_setup = await self.agents["financial"].process({
-            **business_details,
-            "legal_structure": legal_structure,
-            "hr_setup": hr_setup
-        })
-        self.workflow_state["financial"] = financial_setup
+        formation_id = formation_id or uuid.uuid4().hex
+        input_hash = self.checkpoints.start(formation_id, business_details)
+        workflow_state = self.checkpoints.load_steps(formation_id, input_hash)
+        run_step = self._checkpointed_runner(formation_id, input_hash)
         
-        # Step 4: Governance Framework
-        governance_framework = await self.agents["governance"].process({
-            **business_details,
-            "legal_structure": legal_structure,
-            "hr_setup": hr_setup,
-            "financial_setup": financial_setup
-        })
-        self.workflow_state["governance"] = governance_framework
-        
-        # Step 5: Project Management Setup
-        pmo_setup = await self.agents["pmo"].process({
-            **business_details,
-            **self.workflow_state
-        })
-        self.workflow_state["pmo"] = pmo_setup
+        # Steps 1-5: Legal, HR, Financial, Governance and PMO setup
+        for step in FORMATION_STEPS:
+            if step.name not in workflow_state:
+                workflow_state[step.name] = await run_step(step, business_details, workflow_state)
         
         # Step 6: Final Evaluation and Validation
-        evaluation_result = await self.agents["evaluation"].process(self.workflow_state)
+        evaluation_result = await self._evaluate_package(workflow_state)
         
         if not evaluation_result["is_valid"]:
             # Trigger refinement loop
-            return await self._handle_validation_failure(evaluation_result)
+            package = await self._handle_validation_failure(
+                business_details, workflow_state, evaluation_result, run_step
+            )
+        else:
+            package = self._prepare_final_package(workflow_state, evaluation_result)
         
-        return self._prepare_final_package(evaluation_result)
+        return {"formation_id": formation_id, **package}
     
-    async def _handle_validation_failure(self, evaluation_result: Dict) -> Dict:
+    async def resume(self, formation_id: str) -> Dict:
+        """
+        Resume a formation from its checkpoints, skipping completed steps.
+        
+        Args:
+            formation_id: Identifier of a previously started formation
+            
+        Returns:
+            Dict containing the complete LLC formation package
+            
+        Raises:
+            KeyError: If no checkpoints exist for the formation
+        """
+        manifest = self.checkpoints.load_manifest(formation_id)
+        if manifest is None:
+            raise KeyError(f"Unknown formation id: {formation_id}")
+        return await self.process_llc_formation(manifest["business_details"], formation_id)
+    
+    def _checkpointed_runner(self, formation_id: str, input_hash: str) -> StepRunner:
+        """Create a step runner that checkpoints each step output."""
+        async def run_step(
+            step: WorkflowStep,
+            business_details: Dict,
+            workflow_state: Dict,
+            feedback: Optional[Dict] = None
+        ) -> Dict:
+            output = await self.agents[step.name].process(
+                build_step_input(step, business_details, workflow_state, feedback)
+            )
+            self.checkpoints.save_step(formation_id, input_hash, step.name, output)
+            return output
+        
+        return run_step
+    
+    async def _evaluate_package(self, workflow_state: Dict) -> Dict:
+        """
+        Evaluate step outputs, localizing failures to the steps that caused them.
+        
+        Step-level checks run first so refinement can re-run just the failing
+        steps; the full evaluation report is only produced once every step
+        output passes them.
+        """
+        evaluator = self.agents["evaluation"]
+        result = evaluator.evaluate_package(workflow_state)
+        if not result["is_valid"]:
+            return result
+        return await evaluator.process(workflow_state)
+    
+    async def _handle_validation_failure(
+        self,
+        business_details: Dict,
+        workflow_state: Dict,
+        evaluation_result: Dict,
+        run_step: StepRunner
+    ) -> Dict:
         """Handle cases where the LLC formation package fails validation."""
-        # Implement refinement loop logic here
-        pass
+        engine = RefinementEngine(
+            run_step=run_step,
+            evaluate=self._evaluate_package
+        )
+        refinement = await engine.refine(business_details, workflow_state, evaluation_result)
+        
+        if refinement["is_valid"]:
+            return self._prepare_final_package(workflow_state, refinement["evaluation_result"])
+        
+        return {
+            "is_valid": False,
+            "evaluation_report": refinement["evaluation_result"].get("report"),
+            "refinement_iterations": refinement["iterations"],
+            "rerun_steps": refinement["rerun_steps"],
+            "unresolved_steps": list(engine.identify_invalid_steps(
+                refinement["evaluation_result"], workflow_state
+            ))
+        }
     
-    def _prepare_final_package(self, evaluation_result: Dict) -> Dict:
+    def _prepare_final_package(self, workflow_state: Dict, evaluation_result: Dict) -> Dict:
         """Prepare the final LLC formation package for delivery."""
         return {
-            "legal_documents": self.workflow_state["legal"]["documents"],
-            "hr_package": self.workflow_state["hr"]["package"],
-            "financial_setup": self.workflow_state["financial"]["setup"],
-            "governance_framework": self.workflow_state["governance"]["framework"],
-            "pmo_setup": self.workflow_state["pmo"]["setup"],
+            "legal_documents": workflow_state["legal"]["documents"],
+            "hr_package": workflow_state["hr"]["package"],
+            "financial_setup": workflow_state["financial"]["setup"],
+            "governance_framework": workflow_state["governance"]["framework"],
+            "pmo_setup": workflow_state["pmo"]["setup"],
             "evaluation_report": evaluation_result["report"],
             "next_steps": self._generate_next_steps()
         }
@@ -3,11 +3,13 @@ Main application module for the LLC Builder.
 """
 
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 from datetime import datetime
 from pathlib import Path
 
+from core.batch_runner import run_batch
 from core.document_generator import DocumentGenerator
+from core.fee_engine import SERVICE_ALIASES, get_fee_engine
 from core.business_validator import BusinessValidator
 from core.utils import (
     calculate_fees,
@@ -61,7 +63,10 @@ class LLCBuilder:
         
         try:
             # Generate formation documents
-            results["documents"] = self.document_generator.generate_formation_documents(business_details)
+            results["documents"] = self.document_generator.generate_formation_documents(
+                business_details,
+                business_details.get("as_of")
+            )
             
             # Generate HR documents if requested
             if business_details.get("generate_hr_documents", False):
@@ -76,7 +81,8 @@ class LLCBuilder:
             # Calculate fees
             results["fees"] = calculate_fees(
                 business_details["state"],
-                business_details.get("requested_services", [])
+                business_details.get("requested_services", []),
+                business_details.get("as_of")
             )
             
             # Generate filing checklist
@@ -86,13 +92,33 @@ class LLCBuilder:
             )
             
             results["success"] = True
-            
+        
         except Exception as e:
             results["success"] = False
             results["issues"].append(str(e))
         
         return results
     
+    def create_llcs(
+        self,
+        records: Iterable[Dict[str, Any]],
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Create LLCs in bulk across a process pool.
+        
+        Args:
+            records: Iterable of business detail dictionaries
+            workers: Number of worker processes (defaults to the CPU count)
+            max_in_flight: Maximum records in progress at once
+            
+        Returns:
+            Iterator of create_llc results tagged with the record index,
+            yielded in completion order
+        """
+        return run_batch(records, self.output_dir, workers=workers, max_in_flight=max_in_flight)
+    
     def get_state_requirements(self, state_code: str) -> Dict[str, Any]:
         """
         Get requirements for a specific state.
@@ -102,23 +128,43 @@ class LLCBuilder:
             
         Returns:
             Dictionary containing state requirements
+            
+        Raises:
+            KeyError: If state code is invalid
         """
-        if state_code not in self.state_data:
+        record = self.state_data.get(state_code.upper())
+        if record is None:
             raise KeyError(f"Invalid state code: {state_code}")
-        return self.state_data[state_code]
+        return record.as_dict()
     
-    def estimate_costs(self, state_code: str, services: List[str]) -> Dict[str, float]:
+    def estimate_costs(
+        self,
+        state_code: str,
+        services: List[str],
+        as_of: Any = None
+    ) -> Dict[str, float]:
         """
         Estimate costs for LLC formation.
         
         Args:
             state_code: Two-letter state code
-            services: List of requested services
+            services: List of requested services; unknown services are ignored
+            as_of: Date whose fee schedule applies (defaults to today)
             
         Returns:
-            Dictionary containing cost breakdown
+            Dictionary with formation, expedited, registered_agent,
+            additional_services (every other requested or required fee) and total
         """
-        return calculate_fees(state_code, services)
+        known = [service for service in services if service.lower() in SERVICE_ALIASES]
+        quote = get_fee_engine(as_of).quote_state(state_code, known)
+        costs = {
+            "formation": quote["formation"],
+            "expedited": quote["expedited"],
+            "registered_agent": quote["registered_agent"]
+        }
+        costs["additional_services"] = round(quote["total"] - sum(costs.values()), 2)
+        costs["total"] = quote["total"]
+        return costs
     
     def get_formation_checklist(self, state_code: str, business_type: str) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,250 @@
+"""
+Bulk LLC formation across a process pool.
+
+Usage:
+    python -m core.batch_runner customers.jsonl --output-dir output --report report.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Per-process builder, created once by the pool initializer
+_builder = None
+_builder_error: Optional[str] = None
+
+def _parse_csv_value(value: str) -> Any:
+    """Decode JSON-looking CSV cells (objects, arrays, booleans, numbers)."""
+    stripped = value.strip()
+    if stripped[:1] in ("{", "[") or stripped in ("true", "false", "null"):
+        try:
+            return json.loads(stripped)
+        except ValueError:
+            return value
+    return value
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream business detail records from a JSONL or CSV file.
+    
+    Args:
+        path: Path to a .jsonl/.ndjson or .csv file
+        
+    Returns:
+        Iterator of business detail dictionaries. Lines that cannot be parsed
+        are yielded as {"_parse_error": message} so they are reported, not lost.
+    """
+    suffix = Path(path).suffix.lower()
+    
+    with open(path, "r", newline="") as f:
+        if suffix == ".csv":
+            for row in csv.DictReader(f):
+                yield {key: _parse_csv_value(value) for key, value in row.items() if value}
+            return
+        
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield {"_parse_error": f"Line {line_number}: {str(e)}"}
+
+def _init_worker(output_dir: str) -> None:
+    """Create the LLC builder used by this worker process."""
+    global _builder, _builder_error
+    from core.application import LLCBuilder
+    try:
+        _builder = LLCBuilder(output_dir)
+    except Exception as e:
+        # Reported per record instead of breaking the pool
+        _builder_error = f"Failed to initialize LLC builder: {str(e)}"
+
+def _process_record(index: int, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Create one LLC, isolating any failure to this record."""
+    try:
+        if _builder is None:
+            raise RuntimeError(_builder_error or "LLC builder not initialized")
+        result = _builder.create_llc(record)
+    except Exception as e:
+        result = {"success": False, "issues": [str(e)]}
+    
+    return {"index": index, "business_name": record.get("business_name"), **result}
+
+def _error_result(index: int, record: Dict[str, Any], message: str) -> Dict[str, Any]:
+    """Build the report entry for a record that could not be processed."""
+    return {
+        "index": index,
+        "business_name": record.get("business_name"),
+        "success": False,
+        "issues": [message]
+    }
+
+def _new_pool(workers: int, output_dir: str) -> ProcessPoolExecutor:
+    """Start a worker pool with an LLC builder per process."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(output_dir,)
+    )
+
+def run_batch(
+    records: Iterable[Dict[str, Any]],
+    output_dir: str,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Create LLCs for a stream of records across a process pool.
+    
+    At most `max_in_flight` records are submitted at a time, so memory stays
+    flat regardless of input size. Results are yielded as they complete and
+    carry the record's input `index`.
+    
+    If a worker process dies (e.g. a segfault or OOM kill), the pool is
+    restarted and the records that were in flight are re-run one at a time,
+    so only the record that crashes a worker again is reported as failed.
+    
+    The state pack is built once here, before the pool starts; workers
+    only read it.
+    
+    Args:
+        records: Iterable of business detail dictionaries
+        output_dir: Directory for generated documents
+        workers: Number of worker processes (defaults to the CPU count)
+        max_in_flight: Maximum records submitted but not yet finished
+        
+    Returns:
+        Iterator of per-record results
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    pool = _new_pool(workers, output_dir)
+    in_flight: Dict[Future, Tuple[int, Dict[str, Any]]] = {}
+    
+    def restart() -> None:
+        nonlocal pool
+        pool.shutdown(wait=False, cancel_futures=True)
+        pool = _new_pool(workers, output_dir)
+    
+    def isolate(suspects: List[Tuple[int, Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """Re-run records lost to a crashed worker one at a time."""
+        for index, record in suspects:
+            try:
+                yield pool.submit(_process_record, index, record).result()
+            except BrokenProcessPool:
+                restart()
+                yield _error_result(index, record, "Worker process crashed on this record")
+            except Exception as e:
+                yield _error_result(index, record, f"Worker error: {str(e)}")
+    
+    def collect(futures: Iterable[Future]) -> Iterator[Dict[str, Any]]:
+        """Yield finished results, recovering from a broken pool."""
+        suspects = []
+        for future in futures:
+            index, record = in_flight.pop(future)
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                suspects.append((index, record))
+            except Exception as e:
+                yield _error_result(index, record, f"Worker error: {str(e)}")
+        
+        if suspects:
+            # The pool fails every record in flight; settle them all before restarting
+            done, _ = wait(list(in_flight))
+            yield from collect(done)
+            restart()
+            yield from isolate(suspects)
+    
+    try:
+        for index, record in enumerate(records):
+            if "_parse_error" in record:
+                yield _error_result(index, record, record["_parse_error"])
+                continue
+            
+            while len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+            
+            try:
+                future = pool.submit(_process_record, index, record)
+            except BrokenProcessPool:
+                broken = pool
+                done, _ = wait(list(in_flight))
+                yield from collect(done)
+                if pool is broken:
+                    restart()
+                future = pool.submit(_process_record, index, record)
+            in_flight[future] = (index, record)
+        
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            yield from collect(done)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def write_report(results: Iterable[Dict[str, Any]], report_path: str) -> Dict[str, int]:
+    """
+    Stream results to a JSONL report.
+    
+    Args:
+        results: Iterable of per-record results
+        report_path: Path of the JSONL report to write
+        
+    Returns:
+        Dictionary with total, succeeded and failed counts
+    """
+    summary = {"total": 0, "succeeded": 0, "failed": 0}
+    
+    with open(report_path, "w") as f:
+        for result in results:
+            f.write(json.dumps(result, default=str) + "\n")
+            f.flush()
+            summary["total"] += 1
+            summary["succeeded" if result.get("success") else "failed"] += 1
+    
+    return summary
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Create LLCs in bulk from a CSV or JSONL file.")
+    parser.add_argument("input", help="Path to a .csv or .jsonl file of business details")
+    parser.add_argument("--output-dir", default="output", help="Directory for generated documents")
+    parser.add_argument(
+        "--report",
+        default="formation_report.jsonl",
+        help="Path of the JSONL report"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="Maximum records in progress"
+    )
+    args = parser.parse_args()
+    
+    os.makedirs(args.output_dir, exist_ok=True)
+    results = run_batch(
+        iter_records(args.input),
+        args.output_dir,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight
+    )
+    summary = write_report(results, args.report)
+    
+    print(
+        f"Processed {summary['total']} records: "
+        f"{summary['succeeded']} succeeded, {summary['failed']} failed. "
+        f"Report written to {args.report}"
+    )
+
+if __name__ == "__main__":
+    main()
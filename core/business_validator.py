@@ -10,6 +10,7 @@ from core.utils import (
     validate_email,
     validate_date
 )
+from core.name_suggestions import suggest_names
 
 class BusinessValidator:
     """Class for validating business information and requirements."""
@@ -56,6 +57,14 @@ class BusinessValidator:
         if not name_validation["valid"]:
             results["valid"] = False
             results["issues"].extend(name_validation["issues"])
+            results["name_suggestions"] = [
+                suggestion["name"]
+                for suggestion in suggest_names(
+                    details["business_name"],
+                    details["state"],
+                    details.get("industry")
+                )["suggestions"]
+            ]
         
         # Validate EIN if provided
         if "ein" in details and details["ein"]:
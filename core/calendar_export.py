@@ -0,0 +1,382 @@
+"""
+Streaming iCalendar and CSV export of portfolio compliance calendars.
+
+Usage:
+    python -m core.calendar_export portfolio.jsonl --format ics --output compliance.ics
+"""
+
+import argparse
+import csv
+import re
+import sys
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from core.batch_runner import iter_records
+from core.config import Config
+from core.deadline_engine import Recurrence, get_state_obligations, parse_recurrence
+from core.state_tax_requirements import STATE_TAX_REQUIREMENTS
+from states.rule_history import AsOf, get_rule_history, parse_as_of
+
+PRODID = "-//Agentic LLC Builder//Compliance Calendar//EN"
+
+CSV_FIELDS = [
+    "entity_id",
+    "name",
+    "state_code",
+    "type",
+    "category",
+    "due_date",
+    "due_rule",
+    "fee"
+]
+
+# RFC 5545 content lines are at most 75 octets, excluding the line break
+_MAX_LINE_OCTETS = 75
+
+_TEXT_ESCAPES = re.compile(r"([\\;,])")
+
+# Number of (state, rule epoch) event lists kept, least recently used dropped first
+MAX_CACHED_EVENTS = 512
+
+StateEvents = Tuple[Tuple[str, str, Recurrence, str, Any], ...]
+
+_events: "OrderedDict[Tuple[str, Tuple[int, int]], StateEvents]" = OrderedDict()
+_events_lock = threading.Lock()
+
+def _tax_title(key: str) -> str:
+    return key.replace("_", " ").title()
+
+def get_state_events(state_code: str, as_of: AsOf = None) -> StateEvents:
+    """
+    Get the dated compliance and tax obligations of a state.
+    
+    Tax due dates from STATE_TAX_REQUIREMENTS are added unless a compliance
+    obligation of the same type already covers them. Rules without a
+    computable annual date (e.g. monthly sales tax) are left out. Results
+    are cached per state and rule epoch.
+    
+    Args:
+        state_code: Two-letter state code
+        as_of: Date whose requirements apply (defaults to today)
+        
+    Returns:
+        Tuples of (type, category, rule, due rule text, fee)
+        
+    Raises:
+        KeyError: If state code is invalid
+    """
+    cache_key = (state_code, get_rule_history().epoch(as_of))
+    with _events_lock:
+        cached = _events.get(cache_key)
+        if cached is not None:
+            _events.move_to_end(cache_key)
+            return cached
+    
+    events = [
+        (obligation["type"], "Compliance", obligation["rule"], obligation["due_rule"],
+         obligation["fee"])
+        for obligation in get_state_obligations(state_code, as_of)
+        if obligation["rule"] is not None
+    ]
+    covered = {event[0] for event in events}
+    
+    tax = STATE_TAX_REQUIREMENTS.get(state_code, {})
+    due_dates = tax.get("filing_requirements", {}).get("due_dates", {})
+    for key, due_rule in due_dates.items():
+        rule = parse_recurrence(due_rule)
+        if rule is None or _tax_title(key) in covered:
+            continue
+        details = tax.get("tax_structure", {}).get(key, {})
+        events.append((_tax_title(key), "Tax", rule, due_rule, details.get("minimum")))
+    
+    result = tuple(events)
+    with _events_lock:
+        _events[cache_key] = result
+        for stale in [cached for cached in _events if cached[1][0] != cache_key[1][0]]:
+            del _events[stale]
+        while len(_events) > MAX_CACHED_EVENTS:
+            _events.popitem(last=False)
+    return result
+
+def _field(entity: Any, name: str, default: Any = None) -> Any:
+    if isinstance(entity, dict):
+        return entity.get(name, default)
+    return getattr(entity, name, default)
+
+def iter_events(
+    entities: Iterable[Any],
+    start: AsOf = None,
+    horizon_days: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the compliance events of a portfolio of LLCs.
+    
+    Entities are consumed one at a time, so memory use does not grow with
+    the size of the portfolio. Events are ordered by date within an entity.
+    
+    Args:
+        entities: Records (dicts or objects) with entity_id, state_code,
+            formation_date and optionally name
+        start: First day of the exported period (defaults to today)
+        horizon_days: Length of the exported period in days
+        
+    Returns:
+        Iterator of events with entity_id, name, state_code, type, category,
+        due_date, due_rule and fee
+        
+    Raises:
+        KeyError: If an entity's state code is invalid
+    """
+    start = parse_as_of(start)
+    if horizon_days is None:
+        horizon_days = Config.CALENDAR_EXPORT["horizon_days"]
+    end = start + timedelta(days=horizon_days)
+    before_start = start - timedelta(days=1)
+    
+    for entity in entities:
+        entity_id = str(_field(entity, "entity_id"))
+        state_code = str(_field(entity, "state_code")).upper()
+        formation_date = parse_as_of(_field(entity, "formation_date"))
+        name = _field(entity, "name") or entity_id
+        
+        occurrences = []
+        for obligation_type, category, rule, due_rule, fee in get_state_events(state_code, start):
+            due = rule.next_after(before_start, formation_date)
+            while due <= end:
+                occurrences.append((due, obligation_type, category, due_rule, fee))
+                due = rule.next_after(due, formation_date)
+        occurrences.sort(key=lambda occurrence: (occurrence[0], occurrence[1]))
+        
+        for due, obligation_type, category, due_rule, fee in occurrences:
+            yield {
+                "entity_id": entity_id,
+                "name": name,
+                "state_code": state_code,
+                "type": obligation_type,
+                "category": category,
+                "due_date": due,
+                "due_rule": due_rule,
+                "fee": fee
+            }
+
+def escape_text(value: Any) -> str:
+    """
+    Escape a value for an iCalendar TEXT property.
+    
+    Args:
+        value: Property value
+        
+    Returns:
+        Value with backslashes, semicolons, commas and newlines escaped
+    """
+    text = _TEXT_ESCAPES.sub(r"\\\1", str(value))
+    return text.replace("\r\n", "\\n").replace("\n", "\\n")
+
+def fold_line(line: str) -> str:
+    """
+    Fold a content line to 75 octets per RFC 5545.
+    
+    Args:
+        line: Unfolded content line without a line break
+        
+    Returns:
+        Folded line terminated by CRLF; continuation lines start with a space
+        and multi-byte characters are never split
+    """
+    if len(line.encode("utf-8")) <= _MAX_LINE_OCTETS:
+        return line + "\r\n"
+    
+    parts = []
+    current = []
+    size = 0
+    limit = _MAX_LINE_OCTETS
+    for char in line:
+        octets = len(char.encode("utf-8"))
+        if size + octets > limit:
+            parts.append("".join(current))
+            current = []
+            size = 0
+            # Continuation lines lose one octet to the leading space
+            limit = _MAX_LINE_OCTETS - 1
+        current.append(char)
+        size += octets
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+def _event_uid(event: Dict[str, Any]) -> str:
+    obligation = re.sub(r"[^a-z0-9]+", "-", event["type"].lower()).strip("-")
+    return f"{event['entity_id']}-{obligation}-{event['due_date']:%Y%m%d}@agentic-llc-builder"
+
+def _describe(event: Dict[str, Any]) -> str:
+    description = (
+        f"{event['state_code']} {event['category'].lower()} filing due {event['due_rule']}"
+    )
+    if event["fee"] is not None:
+        description += f". Fee: {event['fee']}"
+    return description
+
+def iter_ical(
+    events: Iterable[Dict[str, Any]],
+    reminder_days: Optional[int] = None,
+    calendar_name: str = "LLC Compliance Calendar"
+) -> Iterator[str]:
+    """
+    Stream events as an iCalendar (RFC 5545) document.
+    
+    Args:
+        events: Events from iter_events()
+        reminder_days: Days before the due date to alert (0 disables alarms)
+        calendar_name: Display name of the calendar
+        
+    Returns:
+        Iterator of CRLF-terminated chunks: the calendar header, one chunk
+        per event and the footer
+    """
+    if reminder_days is None:
+        reminder_days = Config.CALENDAR_EXPORT["reminder_days"]
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    
+    yield "".join(fold_line(line) for line in [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(calendar_name)}"
+    ])
+    # The obligation-specific tail of an event is the same for every entity
+    tails: Dict[Tuple[str, str], str] = {}
+    for event in events:
+        due: date = event["due_date"]
+        tail_key = (event["state_code"], event["type"])
+        if tail_key not in tails:
+            lines = [
+                f"DESCRIPTION:{escape_text(_describe(event))}",
+                f"CATEGORIES:{escape_text(event['category'])}",
+                "TRANSP:TRANSPARENT"
+            ]
+            if reminder_days:
+                lines += [
+                    "BEGIN:VALARM",
+                    "ACTION:DISPLAY",
+                    f"DESCRIPTION:{escape_text(event['type'])} due",
+                    f"TRIGGER:-P{reminder_days}D",
+                    "END:VALARM"
+                ]
+            lines.append("END:VEVENT")
+            tails[tail_key] = "".join(fold_line(line) for line in lines)
+        
+        yield "".join([
+            "BEGIN:VEVENT\r\n",
+            fold_line(f"UID:{_event_uid(event)}"),
+            f"DTSTAMP:{stamp}\r\n",
+            f"DTSTART;VALUE=DATE:{due:%Y%m%d}\r\n",
+            f"DTEND;VALUE=DATE:{due + timedelta(days=1):%Y%m%d}\r\n",
+            fold_line(f"SUMMARY:{escape_text(event['name'])}: {escape_text(event['type'])}"),
+            tails[tail_key]
+        ])
+    yield fold_line("END:VCALENDAR")
+
+class _Echo:
+    """File-like object returning what is written, for row-by-row CSV output."""
+    
+    def write(self, value: str) -> str:
+        return value
+
+def iter_csv(events: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Stream events as CSV.
+    
+    Args:
+        events: Events from iter_events()
+        
+    Returns:
+        Iterator of CSV lines, starting with the header
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_FIELDS)
+    for event in events:
+        yield writer.writerow([
+            event["due_date"].isoformat() if field == "due_date" else
+            ("" if event[field] is None else event[field])
+            for field in CSV_FIELDS
+        ])
+
+def export_calendar(
+    entities: Iterable[Any],
+    output: Any,
+    export_format: str = "ics",
+    start: AsOf = None,
+    horizon_days: Optional[int] = None,
+    reminder_days: Optional[int] = None
+) -> int:
+    """
+    Write the compliance calendar of a portfolio to a file.
+    
+    Args:
+        entities: Records accepted by iter_events()
+        output: Path or writable text file
+        export_format: "ics" or "csv"
+        start: First day of the exported period (defaults to today)
+        horizon_days: Length of the exported period in days
+        reminder_days: Days before the due date to alert (iCalendar only)
+        
+    Returns:
+        Number of events written
+        
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if export_format not in ("ics", "csv"):
+        raise ValueError(f"Unknown export format: {export_format}")
+    
+    count = 0
+    
+    def counted(events: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        nonlocal count
+        for event in events:
+            count += 1
+            yield event
+    
+    events = counted(iter_events(entities, start, horizon_days))
+    chunks = iter_ical(events, reminder_days) if export_format == "ics" else iter_csv(events)
+    
+    if hasattr(output, "write"):
+        output.writelines(chunks)
+    else:
+        with open(output, "w", encoding="utf-8", newline="") as f:
+            f.writelines(chunks)
+    return count
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Export the compliance calendar of a portfolio of LLCs."
+    )
+    parser.add_argument(
+        "input",
+        help="Path to a .csv or .jsonl file of entity_id, state_code, formation_date, name"
+    )
+    parser.add_argument("--format", choices=["ics", "csv"], default="ics", help="Output format")
+    parser.add_argument("--output", default=None, help="Output path (defaults to stdout)")
+    parser.add_argument("--start", default=None, help="First day of the period (YYYY-MM-DD)")
+    parser.add_argument("--horizon-days", type=int, default=None, help="Length of the period")
+    parser.add_argument("--reminder-days", type=int, default=None, help="Alarm lead time")
+    args = parser.parse_args()
+    
+    count = export_calendar(
+        iter_records(args.input),
+        args.output or sys.stdout,
+        export_format=args.format,
+        start=args.start,
+        horizon_days=args.horizon_days,
+        reminder_days=args.reminder_days
+    )
+    if args.output:
+        print(f"Exported {count} events to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Local checkpoint store for LLC formation workflows.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.config import Config
+
+class CheckpointStore:
+    """
+    Persists completed formation steps so a workflow can resume after a crash.
+    
+    Layout::
+    
+        <root>/<formation_id>/manifest.json
+        <root>/<formation_id>/<input_hash>/<step>.json
+        
+    Step outputs are keyed by a hash of the business details, so changed
+    inputs never reuse stale results.
+    """
+    
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize the checkpoint store.
+        
+        Args:
+            root: Directory for checkpoint files
+        """
+        self.root = Path(root or Config.get_path("checkpoints"))
+    
+    @staticmethod
+    def hash_inputs(business_details: Dict[str, Any]) -> str:
+        """
+        Hash business details into a stable key.
+        
+        Args:
+            business_details: Dictionary containing business information
+            
+        Returns:
+            Hex digest identifying the inputs
+        """
+        payload = json.dumps(business_details, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    
+    def start(self, formation_id: str, business_details: Dict[str, Any]) -> str:
+        """
+        Record the inputs of a formation run.
+        
+        Args:
+            formation_id: Identifier of the formation
+            business_details: Dictionary containing business information
+            
+        Returns:
+            Hash of the inputs, used to key step checkpoints
+        """
+        input_hash = self.hash_inputs(business_details)
+        manifest = self.load_manifest(formation_id)
+        if manifest is None or manifest["input_hash"] != input_hash:
+            self._write_json(self._formation_dir(formation_id) / "manifest.json", {
+                "formation_id": formation_id,
+                "input_hash": input_hash,
+                "business_details": business_details,
+                "created_at": datetime.now().isoformat()
+            })
+        return input_hash
+    
+    def load_manifest(self, formation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the manifest of a formation.
+        
+        Args:
+            formation_id: Identifier of the formation
+            
+        Returns:
+            Manifest dictionary, or None if the formation is unknown
+        """
+        path = self._formation_dir(formation_id) / "manifest.json"
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+    
+    def save_step(
+        self,
+        formation_id: str,
+        input_hash: str,
+        step_name: str,
+        output: Dict[str, Any]
+    ) -> None:
+        """
+        Checkpoint the output of a completed step.
+        
+        Args:
+            formation_id: Identifier of the formation
+            input_hash: Hash returned by start()
+            step_name: Name of the completed step
+            output: Output of the step's agent
+        """
+        path = self._formation_dir(formation_id) / input_hash / f"{step_name}.json"
+        self._write_json(path, output)
+    
+    def load_steps(self, formation_id: str, input_hash: str) -> Dict[str, Any]:
+        """
+        Load all checkpointed step outputs for a formation.
+        
+        Args:
+            formation_id: Identifier of the formation
+            input_hash: Hash returned by start()
+            
+        Returns:
+            Mapping of step name to output
+        """
+        step_dir = self._formation_dir(formation_id) / input_hash
+        if not step_dir.is_dir():
+            return {}
+        
+        steps = {}
+        for path in step_dir.glob("*.json"):
+            with open(path, "r") as f:
+                steps[path.stem] = json.load(f)
+        return steps
+    
+    def clear(self, formation_id: str) -> None:
+        """
+        Delete all checkpoints of a formation.
+        
+        Args:
+            formation_id: Identifier of the formation
+        """
+        shutil.rmtree(self._formation_dir(formation_id), ignore_errors=True)
+    
+    def _formation_dir(self, formation_id: str) -> Path:
+        """Get the checkpoint directory of a formation."""
+        if not re.fullmatch(r"[\w.-]+", formation_id) or formation_id.startswith("."):
+            raise ValueError(f"Invalid formation id: {formation_id}")
+        return self.root / formation_id
+    
+    def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
+        """Write JSON atomically so a crash never leaves a partial checkpoint."""
+        os.makedirs(path.parent, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,224 @@
+"""
+Precompiled compliance requirement matrix for vectorized portfolio audits.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from states.rule_history import AsOf, get_rule_history
+from states.state_table import STATE_TABLE
+
+# Requirement section -> (entity column listing satisfied requirements, issue prefix)
+SECTIONS = {
+    "initial_requirements": ("completed_requirements", "Missing"),
+    "ongoing_requirements": ("maintained_requirements", "Non-compliant with"),
+    "employment_requirements": ("employment_compliance", "Missing")
+}
+
+# String values of has_employees read as True; other strings (e.g. "no") are False
+TRUE_STRINGS = {"true", "yes", "y", "1"}
+
+# Number of compiled matrices kept, least recently used dropped first
+MAX_CACHED_MATRICES = 8
+
+def _is_required(section: str, details: Any) -> bool:
+    """Check whether a requirement applies to every LLC (or every employer)."""
+    if not isinstance(details, dict):
+        return False
+    if section == "employment_requirements":
+        return details.get("required") == "All employers"
+    return details.get("required") is True
+
+def _as_flag(value: Any) -> bool:
+    """Interpret a has_employees value, parsing strings such as "no" and "false"."""
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+    if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+        return False
+    return bool(value)
+
+def _to_frame(entities: Any) -> pd.DataFrame:
+    """Accept a DataFrame, an Arrow table or a list of records."""
+    if isinstance(entities, pd.DataFrame):
+        return entities
+    if hasattr(entities, "to_pandas"):
+        return entities.to_pandas()
+    return pd.DataFrame(list(entities))
+
+class ComplianceMatrix:
+    """
+    States x requirement types matrix of the requirements every LLC must meet.
+    
+    Columns are (section, requirement type) pairs across all states. A bulk
+    audit turns each entity's satisfied requirements into a boolean row of
+    the same shape, so missing requirements are one mask expression over
+    the whole portfolio.
+    """
+    
+    def __init__(self, as_of: AsOf = None):
+        """
+        Compile the matrix.
+        
+        Args:
+            as_of: Date whose requirements apply (defaults to today)
+        """
+        history = get_rule_history()
+        self.state_codes = [
+            code for code in sorted(STATE_TABLE) if history.has_rules("state_compliance", code)
+        ]
+        snapshots = {
+            code: history.snapshot("state_compliance", code, as_of) for code in self.state_codes
+        }
+        
+        # Columns follow SECTIONS order, then the order requirements appear in the data
+        self.requirements: List[Tuple[str, str]] = list(dict.fromkeys(
+            (section, req_type)
+            for section in SECTIONS
+            for snapshot in snapshots.values()
+            for req_type in snapshot.get(section, {})
+        ))
+        self._columns: Dict[str, Dict[str, int]] = {section: {} for section in SECTIONS}
+        for column, (section, req_type) in enumerate(self.requirements):
+            self._columns[section][req_type] = column
+        
+        self.messages = np.array([
+            f"{SECTIONS[section][1]} {req_type}" for section, req_type in self.requirements
+        ], dtype=object)
+        self.employment = np.array([
+            section == "employment_requirements" for section, _ in self.requirements
+        ], dtype=bool)
+        
+        # Issues of each state are reported in its own source order
+        self.required = np.zeros((len(self.state_codes), len(self.requirements)), dtype=bool)
+        self.order = np.tile(np.arange(len(self.requirements)), (len(self.state_codes), 1))
+        for row, code in enumerate(self.state_codes):
+            position = 0
+            for section in SECTIONS:
+                for req_type, details in snapshots[code].get(section, {}).items():
+                    column = self._columns[section][req_type]
+                    self.order[row, column] = position
+                    position += 1
+                    if _is_required(section, details):
+                        self.required[row, column] = True
+        self._index = pd.Index(self.state_codes)
+    
+    def _membership(self, values: pd.Series, section: str) -> np.ndarray:
+        """
+        Mark the requirements each entity lists as satisfied.
+        
+        Args:
+            values: Lists (or comma-separated strings) of requirement types
+            section: Requirement section the values belong to
+            
+        Returns:
+            Boolean array of shape (entities, requirements)
+        """
+        member = np.zeros((len(values), len(self.requirements)), dtype=bool)
+        values = pd.Series(values.to_numpy(), dtype=object)
+        if values.map(type).eq(str).any():
+            split = values.str.split(",")
+            values = split.where(split.notna(), values)
+        
+        exploded = values.explode().dropna()
+        if exploded.empty:
+            return member
+        # Requirement names repeat across entities, so resolve each distinct one once
+        codes, names = pd.factorize(exploded)
+        lookup = np.array(
+            [self._columns[section].get(str(name).strip(), -1) for name in names],
+            dtype=int
+        )
+        columns = lookup[codes]
+        found = columns >= 0
+        member[exploded.index.to_numpy()[found], columns[found]] = True
+        return member
+    
+    def evaluate(self, entities: Any) -> pd.DataFrame:
+        """
+        Audit the compliance of many entities at once.
+        
+        Args:
+            entities: DataFrame, Arrow table or list of records with a
+                state_code column and optionally completed_requirements,
+                maintained_requirements, employment_compliance (lists or
+                comma-separated strings) and has_employees (booleans, or
+                strings such as "yes"/"no")
+                
+        Returns:
+            DataFrame with the input's index and columns compliant,
+            issue_count and issues; entities in states without compliance
+            data get an "Invalid state code" issue
+        """
+        frame = _to_frame(entities)
+        count = len(frame)
+        state_codes, names = pd.factorize(frame["state_code"]) if count else ([], [])
+        names = [str(name).upper() for name in names]
+        # Null state codes factorize to -1, which picks the appended "unknown" row
+        rows = np.append(self._index.get_indexer(names), -1)[state_codes]
+        known = rows >= 0
+        
+        required = np.zeros((count, len(self.requirements)), dtype=bool)
+        required[known] = self.required[rows[known]]
+        if "has_employees" in frame:
+            has_employees = np.array(
+                [_as_flag(value) for value in frame["has_employees"]], dtype=bool
+            )
+            required[:, self.employment] &= has_employees[:, np.newaxis]
+        else:
+            required[:, self.employment] = False
+        
+        satisfied = np.zeros_like(required)
+        for section, (column, _) in SECTIONS.items():
+            if column in frame:
+                satisfied |= self._membership(frame[column], section)
+        missing = required & ~satisfied
+        
+        issue_rows, issue_columns = np.nonzero(missing)
+        positions = self.order[rows[issue_rows], issue_columns]
+        sequence = np.lexsort((positions, issue_rows))
+        issue_rows, issue_columns = issue_rows[sequence], issue_columns[sequence]
+        issues: List[List[str]] = [[] for _ in range(count)]
+        for row, message in zip(issue_rows.tolist(), self.messages[issue_columns].tolist()):
+            issues[row].append(message)
+        for row in np.flatnonzero(~known).tolist():
+            state_code = frame["state_code"].iat[row]
+            issues[row].append(f"Invalid state code: {None if pd.isna(state_code) else state_code}")
+        
+        issue_count = missing.sum(axis=1) + ~known
+        return pd.DataFrame({
+            "compliant": issue_count == 0,
+            "issue_count": issue_count,
+            "issues": issues
+        }, index=frame.index)
+
+_matrices: "OrderedDict[Tuple[int, int], ComplianceMatrix]" = OrderedDict()
+_matrices_lock = threading.Lock()
+
+def get_compliance_matrix(as_of: AsOf = None) -> ComplianceMatrix:
+    """
+    Get the compliance matrix for a date, compiling it on first use.
+    
+    At most MAX_CACHED_MATRICES are kept, and matrices compiled from an
+    older revision of the rule history are dropped.
+    
+    Args:
+        as_of: Date whose requirements apply (defaults to today)
+        
+    Returns:
+        Compiled compliance matrix
+    """
+    epoch = get_rule_history().epoch(as_of)
+    with _matrices_lock:
+        matrix = _matrices.get(epoch)
+        if matrix is None:
+            matrix = _matrices[epoch] = ComplianceMatrix(as_of)
+            for stale in [key for key in _matrices if key[0] != epoch[0]]:
+                del _matrices[stale]
+            while len(_matrices) > MAX_CACHED_MATRICES:
+                _matrices.popitem(last=False)
+        _matrices.move_to_end(epoch)
+        return matrix
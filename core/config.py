@@ -27,6 +27,79 @@ class Config:
         "evaluation_analyst": "emergence-latest"
     }
     
+    # Provider Configuration
+    PROVIDERS = {
+        "legal_architect": "openai",
+        "hr_strategist": "anthropic",
+        "financial_expert": "groq",
+        "governance_officer": "google",
+        "pmo_director": "cohere",
+        "evaluation_analyst": "emergence"
+    }
+    
+    # Rate Limit Settings (per provider, optionally overridden per model)
+    RATE_LIMITS = {
+        "default": {
+            "requests_per_minute": 60,
+            "tokens_per_minute": 20000,
+            "max_concurrency": 4,
+            "queue_high_water": 20
+        },
+        "openai": {
+            "requests_per_minute": 500,
+            "tokens_per_minute": 30000,
+            "max_concurrency": 8,
+            "models": {
+                "gpt-4": {
+                    "requests_per_minute": 200,
+                    "tokens_per_minute": 10000
+                }
+            }
+        },
+        "anthropic": {
+            "requests_per_minute": 50,
+            "tokens_per_minute": 40000,
+            "max_concurrency": 5
+        },
+        "groq": {
+            "requests_per_minute": 30,
+            "tokens_per_minute": 6000,
+            "max_concurrency": 4
+        },
+        "google": {
+            "requests_per_minute": 60,
+            "tokens_per_minute": 32000,
+            "max_concurrency": 4
+        },
+        "cohere": {
+            "requests_per_minute": 100,
+            "tokens_per_minute": 40000,
+            "max_concurrency": 4
+        },
+        "emergence": {
+            "requests_per_minute": 60,
+            "tokens_per_minute": 20000,
+            "max_concurrency": 4
+        }
+    }
+    
+    # Hedging Settings
+    HEDGING = {
+        "enabled": False,
+        "percentile": 95,
+        "min_samples": 20,
+        "default_delay_seconds": 2.0,
+        "latency_window": 200
+    }
+    
+    # Circuit Breaker Settings
+    CIRCUIT_BREAKER = {
+        "window": 20,
+        "min_calls": 5,
+        "error_rate_threshold": 0.5,
+        "cooldown_seconds": 30
+    }
+    
     # System Paths
     PATHS = {
         "templates": "templates",
@@ -34,7 +107,41 @@ class Config:
         "hr_templates": "templates/hr",
         "financial_templates": "templates/financial",
         "governance_templates": "templates/governance",
-        "pmo_templates": "templates/pmo"
+        "pmo_templates": "templates/pmo",
+        "checkpoints": "checkpoints",
+        "reminders": "data/reminders.db",
+        "knowledge_index": "data/knowledge_index.db"
+    }
+    
+    # Name Suggestion Settings
+    NAME_SUGGESTIONS = {
+        "count": 10,
+        "budget_ms": 50,
+        "batch_size": 256,
+        "max_pool": 5000
+    }
+    
+    # Compliance Calendar Export Settings
+    CALENDAR_EXPORT = {
+        "horizon_days": 365,
+        "reminder_days": 14
+    }
+    
+    # Deadline Reminder Scheduler Settings
+    REMINDERS = {
+        "lead_days": [30, 7, 1],
+        "send_hour": 9,
+        "retry_seconds": 300,
+        "max_attempts": 5,
+        "batch_size": 500
+    }
+    
+    # Local Knowledge Index Settings (BM25)
+    KNOWLEDGE_INDEX = {
+        "k1": 1.5,
+        "b": 0.75,
+        "top_k": 5,
+        "min_score": 2.0
     }
     
     # Validation Settings
@@ -54,6 +161,7 @@ class Config:
     # Processing Settings
     PROCESSING = {
         "max_retries": 3,
+        "max_refinement_iterations": 2,
         "timeout_seconds": 300,
         "batch_size": 10
     }
@@ -68,6 +176,22 @@ class Config:
         """Get model name for a specific agent type."""
         return cls.MODELS.get(agent_type, "gpt-4")
     
+    @classmethod
+    def get_provider(cls, agent_type: str) -> str:
+        """Get provider name for a specific agent type."""
+        return cls.PROVIDERS.get(agent_type, "openai")
+    
+    @classmethod
+    def get_rate_limits(cls, provider: str, model: str = "default") -> Dict[str, Any]:
+        """Get rate limits for a provider, with any model-specific overrides applied."""
+        provider_limits = cls.RATE_LIMITS.get(provider, {})
+        limits = {
+            **cls.RATE_LIMITS["default"],
+            **{k: v for k, v in provider_limits.items() if k != "models"}
+        }
+        limits.update(provider_limits.get("models", {}).get(model, {}))
+        return limits
+    
     @classmethod
     def get_path(cls, path_type: str) -> str:
         """Get system path for a specific type."""
@@ -0,0 +1,252 @@
+"""
+Total-cost-of-ownership optimizer ranking every state for a business profile.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from states.state_metrics import StateMetricsTable, get_metrics_table
+from states.state_table import STATE_TABLE
+
+# Values used where the state tables have no data (BaseState defaults)
+DEFAULT_COSTS = {
+    "formation_fee": 100.0,
+    "expedited_fee": 50.0,
+    "annual_report_fee": 50.0,
+    "franchise_tax_min": 0.0,
+    "publication_cost": 200.0,
+    "registered_agent_fee": 120.0
+}
+
+COST_COMPONENTS = [
+    "filing",
+    "registered_agent",
+    "annual_reports",
+    "franchise_tax",
+    "publication",
+    "foreign_qualification"
+]
+
+@dataclass
+class BusinessProfile:
+    """Business characteristics that drive multi-year formation costs."""
+    annual_revenue: float = 0.0
+    home_state: Optional[str] = None
+    operating_states: List[str] = field(default_factory=list)
+    horizon_years: int = 3
+    expedited: bool = False
+    
+    @classmethod
+    def from_details(cls, details: Any) -> "BusinessProfile":
+        """
+        Build a profile from business details or a formation request.
+        
+        Args:
+            details: Dictionary of business details or an object with the same attributes
+            
+        Returns:
+            Business profile
+        """
+        def value(name: str, default: Any = None) -> Any:
+            if isinstance(details, dict):
+                return details.get(name, default)
+            return getattr(details, name, default)
+        
+        return cls(
+            annual_revenue=float(value("annual_revenue", 0.0) or 0.0),
+            home_state=value("home_state") or value("state_code"),
+            operating_states=list(value("operating_states", []) or []),
+            horizon_years=int(value("horizon_years", 3) or 3),
+            expedited=bool(value("expedited", False))
+        )
+
+class CostOptimizer:
+    """
+    Computes N-year costs of forming in every state at once.
+    
+    Every cost component is an array over the states of the metrics table,
+    so ranking all states, or all states across a revenue sweep, is a
+    handful of array operations.
+    """
+    
+    def __init__(self, table: Optional[StateMetricsTable] = None):
+        """
+        Initialize the optimizer.
+        
+        Args:
+            table: State metrics table (defaults to the process-wide table)
+        """
+        self.table = table or get_metrics_table()
+        self.state_codes = self.table.state_codes
+        self._index = {str(code): i for i, code in enumerate(self.state_codes)}
+        
+        def filled(column: str, default: float) -> np.ndarray:
+            values = self.table.column(column)
+            return np.where(np.isnan(values), default, values)
+        
+        self._formation_fee = filled("formation_fee", DEFAULT_COSTS["formation_fee"])
+        self._expedited_fee = filled("expedited_fee", DEFAULT_COSTS["expedited_fee"])
+        self._annual_report_fee = filled("annual_report_fee", DEFAULT_COSTS["annual_report_fee"])
+        self._franchise_tax_min = filled("franchise_tax_min", DEFAULT_COSTS["franchise_tax_min"])
+        self._franchise_tax_threshold = filled("franchise_tax_threshold", 0.0)
+        # States without their own registration fee charge the formation fee, as in the fee engine
+        foreign_fee = self.table.column("foreign_qualification_fee")
+        self._foreign_fee = np.where(np.isnan(foreign_fee), self._formation_fee, foreign_fee)
+        publication_required = self.table.column("publication_required") == 1.0
+        publication_estimates = np.array(
+            [self._publication_estimate(str(code)) for code in self.state_codes],
+            dtype=float
+        )
+        self._publication_cost = np.where(
+            publication_required,
+            np.where(
+                np.isnan(publication_estimates),
+                DEFAULT_COSTS["publication_cost"],
+                publication_estimates
+            ),
+            0.0
+        )
+        self._estimated = np.isnan(np.stack([
+            self.table.column(name)
+            for name in ("formation_fee", "annual_report_fee", "franchise_tax_min")
+        ])).any(axis=0) | (publication_required & np.isnan(publication_estimates))
+    
+    @staticmethod
+    def _publication_estimate(state_code: str) -> float:
+        """Get the estimated publication cost of a state, or NaN if it is unknown."""
+        requirements = STATE_TABLE.get(state_code, {}).get("publication_requirements") or {}
+        try:
+            return float(requirements["estimated_cost"])
+        except (KeyError, TypeError, ValueError):
+            return np.nan
+    
+    def compute_costs(
+        self,
+        profile: BusinessProfile,
+        revenues: Optional[Iterable[float]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute cost components for every state.
+        
+        Args:
+            profile: Business profile
+            revenues: Annual revenues to evaluate (defaults to the profile's revenue)
+            
+        Returns:
+            Mapping of component name (plus "total") to an array of shape
+            (len(revenues), number of states), plus "estimated", a boolean
+            array over the states marking totals that rely on default values
+        """
+        years = profile.horizon_years
+        revenues = np.asarray(
+            list(revenues) if revenues is not None else [profile.annual_revenue],
+            dtype=float
+        )[:, np.newaxis]
+        
+        filing = self._formation_fee + (self._expedited_fee if profile.expedited else 0.0)
+        registered_agent = np.full(
+            len(self.state_codes), DEFAULT_COSTS["registered_agent_fee"] * years
+        )
+        annual_reports = self._annual_report_fee * years
+        
+        # Franchise minimums apply unless revenue is below a no-tax threshold
+        owes_franchise_tax = revenues >= self._franchise_tax_threshold
+        franchise_tax = np.where(owes_franchise_tax, self._franchise_tax_min * years, 0.0)
+        
+        # Foreign qualification (fee plus upkeep) in every other state the business operates in
+        operating = {code.upper() for code in profile.operating_states}
+        if profile.home_state:
+            operating.add(profile.home_state.upper())
+        rows = [self._index[code] for code in operating if code in self._index]
+        per_state = self._foreign_fee + (
+            self._annual_report_fee + DEFAULT_COSTS["registered_agent_fee"]
+        ) * years
+        foreign_qualification = np.full(len(self.state_codes), per_state[rows].sum())
+        foreign_qualification[rows] -= per_state[rows]
+        
+        # A row is estimated if it, or any state it would qualify in, relies on defaults
+        foreign_estimated = np.zeros(len(self.state_codes), dtype=int)
+        foreign_estimated[rows] = self._estimated[rows]
+        estimated_elsewhere = foreign_estimated.sum() - foreign_estimated
+        
+        components = {
+            "filing": filing,
+            "registered_agent": registered_agent,
+            "annual_reports": annual_reports,
+            "franchise_tax": franchise_tax,
+            "publication": self._publication_cost,
+            "foreign_qualification": foreign_qualification
+        }
+        shape = (len(revenues), len(self.state_codes))
+        components = {name: np.broadcast_to(values, shape) for name, values in components.items()}
+        components["total"] = sum(components[name] for name in COST_COMPONENTS)
+        components["estimated"] = self._estimated | (estimated_elsewhere > 0)
+        return components
+    
+    def rank(self, profile: BusinessProfile, top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Rank states by total cost over the profile's horizon.
+        
+        Args:
+            profile: Business profile
+            top_k: Number of states to return
+            
+        Returns:
+            Cheapest states first, each with its total, cost breakdown and
+            "estimated" flag; states with sourced costs rank ahead of
+            estimated ones
+        """
+        return self._rankings(self.compute_costs(profile), 0, top_k)
+    
+    def sensitivity(
+        self,
+        profile: BusinessProfile,
+        revenues: Iterable[float],
+        top_k: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank states across a range of annual revenues.
+        
+        Args:
+            profile: Business profile
+            revenues: Annual revenues to evaluate
+            top_k: Number of states to return per revenue
+            
+        Returns:
+            One entry per revenue with its rankings
+        """
+        revenues = list(revenues)
+        costs = self.compute_costs(profile, revenues)
+        return [
+            {"annual_revenue": revenue, "rankings": self._rankings(costs, row, top_k)}
+            for row, revenue in enumerate(revenues)
+        ]
+    
+    def _rankings(self, costs: Dict[str, np.ndarray], row: int, top_k: int) -> List[Dict[str, Any]]:
+        """Select the top-k cheapest states of one revenue row, sourced costs first."""
+        totals = costs["total"][row]
+        estimated = costs["estimated"]
+        ordered = np.lexsort((self.state_codes, totals, estimated))[:top_k]
+        
+        return [
+            {
+                "state_code": str(self.state_codes[i]),
+                "total": round(float(totals[i]), 2),
+                "breakdown": {
+                    name: round(float(costs[name][row][i]), 2) for name in COST_COMPONENTS
+                },
+                "estimated": bool(estimated[i])
+            }
+            for i in ordered
+        ]
+
+_optimizer: Optional[CostOptimizer] = None
+
+def get_cost_optimizer() -> CostOptimizer:
+    """Get the process-wide cost optimizer."""
+    global _optimizer
+    if _optimizer is None:
+        _optimizer = CostOptimizer()
+    return _optimizer
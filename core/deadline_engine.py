@@ -0,0 +1,435 @@
+"""
+Compliance deadline recurrence rules and a portfolio-wide deadline calendar.
+"""
+
+import calendar
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from states.rule_history import AsOf, get_rule_history, parse_as_of
+from states.state_table import STATE_TABLE
+
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+
+_FIXED_DATE = re.compile(r"\b(" + "|".join(_MONTHS) + r")\s+(\d{1,2})\b")
+
+@dataclass(frozen=True)
+class Recurrence:
+    """
+    A recurring due date, either fixed or relative to the formation date.
+    
+    Attributes:
+        month: Due month, or None for the formation (anniversary) month
+        day: Due day of month; 0 is the last day and None the formation day
+        interval_years: Years between occurrences (2 for biennial filings)
+    """
+    month: Optional[int] = None
+    day: Optional[int] = None
+    interval_years: int = 1
+    
+    def _due_in(self, year: int, formation_date: date) -> date:
+        """Get the due date falling in a given year."""
+        month = self.month or formation_date.month
+        last_day = calendar.monthrange(year, month)[1]
+        if self.day is None:
+            day = min(formation_date.day, last_day)
+        else:
+            day = last_day if self.day == 0 else min(self.day, last_day)
+        return date(year, month, day)
+    
+    def next_after(self, after: date, formation_date: date) -> date:
+        """
+        Get the first due date strictly after a date.
+        
+        Occurrences start after the formation date; multi-year intervals are
+        counted from the formation year.
+        
+        Args:
+            after: Date after which to look
+            formation_date: Date the LLC was formed
+            
+        Returns:
+            Next due date
+        """
+        after = max(after, formation_date)
+        year = after.year
+        offset = (year - formation_date.year) % self.interval_years
+        if offset:
+            year += self.interval_years - offset
+        due = self._due_in(year, formation_date)
+        while due <= after:
+            year += self.interval_years
+            due = self._due_in(year, formation_date)
+        return due
+
+def parse_recurrence(text: Optional[str], frequency: Optional[str] = None) -> Optional[Recurrence]:
+    """
+    Parse a free-text due date rule.
+    
+    Understands fixed dates ("March 15"), anniversary rules ("Anniversary of
+    formation", "First day of anniversary month", "End of formation month")
+    and biennial variants.
+    
+    Args:
+        text: Due date text from the state tables
+        frequency: Optional frequency text (e.g. "Biennial")
+        
+    Returns:
+        Recurrence, or None if the rule depends on data not in the tables
+        (e.g. "Based on issue date")
+    """
+    if not text:
+        return None
+    rule = text.lower()
+    interval = 2 if "biennial" in rule or "biennial" in (frequency or "").lower() else 1
+    
+    match = _FIXED_DATE.search(rule)
+    if match:
+        return Recurrence(_MONTHS[match.group(1)], int(match.group(2)), interval)
+    if "first day of" in rule and ("anniversary" in rule or "formation" in rule):
+        return Recurrence(None, 1, interval)
+    if ("end of" in rule and "month" in rule) or "anniversary month" in rule:
+        return Recurrence(None, 0, interval)
+    if "anniversary" in rule:
+        return Recurrence(None, None, interval)
+    return None
+
+def _title(key: str) -> str:
+    return key.replace("_", " ").title()
+
+# Number of (state, rule epoch) obligation lists kept, least recently used dropped first
+MAX_CACHED_OBLIGATIONS = 512
+
+_obligations: "OrderedDict[Tuple[str, Tuple[int, int]], List[Dict[str, Any]]]" = OrderedDict()
+_obligations_lock = threading.Lock()
+
+def get_state_obligations(state_code: str, as_of: AsOf = None) -> List[Dict[str, Any]]:
+    """
+    Get the recurring compliance obligations of a state.
+    
+    Args:
+        state_code: Two-letter state code
+        as_of: Date whose requirements apply (defaults to today)
+        
+    Returns:
+        Obligations, each with type, rule (a Recurrence, or None if the due
+        date cannot be computed), due_rule text and fee
+        
+    Raises:
+        KeyError: If state code is invalid
+    """
+    if state_code not in STATE_TABLE:
+        raise KeyError(f"Invalid state code: {state_code}")
+    
+    history = get_rule_history()
+    key = (state_code, history.epoch(as_of))
+    with _obligations_lock:
+        cached = _obligations.get(key)
+        if cached is not None:
+            _obligations.move_to_end(key)
+            return cached
+    
+    obligations: Dict[str, Dict[str, Any]] = {}
+    if history.has_rules("state_compliance", state_code):
+        ongoing = history.snapshot("state_compliance", state_code, as_of).get(
+            "ongoing_requirements", {}
+        )
+        for name, details in ongoing.items():
+            if not isinstance(details, dict) or details.get("required", True) is False:
+                continue
+            due_rule = details.get("due_date")
+            obligations[_title(name)] = {
+                "type": _title(name),
+                "rule": parse_recurrence(due_rule, details.get("frequency")),
+                "due_rule": due_rule or details.get("frequency") or "Varies",
+                "fee": details.get("fee", details.get("minimum_fee"))
+            }
+    
+    if history.has_rules("state_data", state_code):
+        annual_report = history.snapshot("state_data", state_code, as_of).get("annual_report")
+        if isinstance(annual_report, dict) and annual_report.get("required"):
+            obligations.setdefault("Annual Report", {
+                "type": "Annual Report",
+                "rule": parse_recurrence(annual_report.get("due")),
+                "due_rule": annual_report.get("due") or "Varies",
+                "fee": annual_report.get("fee")
+            })
+    
+    result = list(obligations.values())
+    with _obligations_lock:
+        _obligations[key] = result
+        # Lists compiled from an older revision of the rule history are never requested again
+        for stale in [cached for cached in _obligations if cached[1][0] != key[1][0]]:
+            del _obligations[stale]
+        while len(_obligations) > MAX_CACHED_OBLIGATIONS:
+            _obligations.popitem(last=False)
+    return result
+
+def get_next_deadlines(
+    state_code: str,
+    formation_date: AsOf,
+    as_of: AsOf = None
+) -> List[Dict[str, Any]]:
+    """
+    Get the next due date of each obligation of one LLC.
+    
+    Args:
+        state_code: Two-letter state code
+        formation_date: Date the LLC was formed
+        as_of: Date from which to look ahead (defaults to today)
+        
+    Returns:
+        Deadlines ordered by due date; obligations without a computable date
+        come last with due_date None
+    """
+    formation_date = parse_as_of(formation_date)
+    start = parse_as_of(as_of) - timedelta(days=1)
+    deadlines = []
+    for obligation in get_state_obligations(state_code, as_of):
+        rule = obligation["rule"]
+        deadlines.append({
+            "type": obligation["type"],
+            "due_date": rule.next_after(start, formation_date) if rule else None,
+            "due_rule": obligation["due_rule"],
+            "fee": obligation["fee"]
+        })
+    deadlines.sort(key=lambda d: (d["due_date"] is None, d["due_date"] or date.max, d["type"]))
+    return deadlines
+
+class DeadlineCalendar:
+    """
+    Next due date of every obligation of every LLC in a portfolio.
+    
+    Occurrences are kept in one sorted index of (date ordinal, entity,
+    obligation) keys, so window queries are a binary search plus the
+    matches, and adding an entity or recording a filing only touches that
+    entity's keys.
+    """
+    
+    def __init__(self):
+        """Initialize an empty calendar."""
+        self._index: List[Tuple[int, str, str]] = []
+        self._entities: Dict[str, Dict[str, Any]] = {}
+        self._due: Dict[Tuple[str, str], Tuple[int, str, str]] = {}
+        self._unscheduled: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._entities
+    
+    def _schedule(self, entity_id: str, obligation_type: str, due: date) -> None:
+        """Insert (or move) the next occurrence of an obligation."""
+        self._unschedule(entity_id, obligation_type)
+        key = (due.toordinal(), entity_id, obligation_type)
+        insort(self._index, key)
+        self._due[(entity_id, obligation_type)] = key
+    
+    def _unschedule(self, entity_id: str, obligation_type: str) -> None:
+        """Remove the scheduled occurrence of an obligation, if any."""
+        key = self._due.pop((entity_id, obligation_type), None)
+        if key is not None:
+            del self._index[bisect_left(self._index, key)]
+    
+    def add_entity(
+        self,
+        entity_id: str,
+        state_code: str,
+        formation_date: AsOf,
+        name: Optional[str] = None,
+        filed_through: AsOf = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Add (or replace) an LLC and schedule its next deadlines.
+        
+        Args:
+            entity_id: Unique identifier of the LLC
+            state_code: Two-letter state code
+            formation_date: Date the LLC was formed
+            name: Display name of the LLC
+            filed_through: Occurrences on or before this date are treated as
+                filed (defaults to the day before today)
+                
+        Returns:
+            The entity's scheduled deadlines
+        """
+        formation_date = parse_as_of(formation_date)
+        if filed_through is None:
+            filed_through = date.today() - timedelta(days=1)
+        filed_through = parse_as_of(filed_through)
+        obligations = get_state_obligations(state_code)
+        
+        with self._lock:
+            self.remove_entity(entity_id)
+            self._entities[entity_id] = {
+                "entity_id": entity_id,
+                "name": name or entity_id,
+                "state_code": state_code,
+                "formation_date": formation_date,
+                "scheduled": []
+            }
+            self._unscheduled[entity_id] = []
+            for obligation in obligations:
+                if obligation["rule"] is None:
+                    self._unscheduled[entity_id].append(obligation)
+                else:
+                    due = obligation["rule"].next_after(filed_through, formation_date)
+                    self._schedule(entity_id, obligation["type"], due)
+                    self._entities[entity_id]["scheduled"].append(obligation["type"])
+            return self.entity_deadlines(entity_id)
+    
+    def remove_entity(self, entity_id: str) -> bool:
+        """
+        Remove an LLC, e.g. after dissolution.
+        
+        Args:
+            entity_id: Identifier of the LLC
+            
+        Returns:
+            True if the LLC was in the calendar
+        """
+        with self._lock:
+            if entity_id not in self._entities:
+                return False
+            for obligation_type in self._entities[entity_id]["scheduled"]:
+                self._unschedule(entity_id, obligation_type)
+            del self._entities[entity_id]
+            self._unscheduled.pop(entity_id, None)
+            return True
+    
+    def record_filing(self, entity_id: str, obligation_type: str) -> date:
+        """
+        Record that an LLC's currently due filing was made.
+        
+        Args:
+            entity_id: Identifier of the LLC
+            obligation_type: Obligation filed (e.g. "Annual Report")
+            
+        Returns:
+            Next due date of the obligation
+            
+        Raises:
+            KeyError: If the LLC or obligation is not scheduled, or the
+                state's current rules no longer define its due date
+        """
+        with self._lock:
+            key = self._due.get((entity_id, obligation_type))
+            if key is None:
+                raise KeyError(f"No scheduled {obligation_type} for entity: {entity_id}")
+            entity = self._entities[entity_id]
+            rule = next(
+                (
+                    obligation["rule"]
+                    for obligation in get_state_obligations(entity["state_code"])
+                    if obligation["type"] == obligation_type and obligation["rule"] is not None
+                ),
+                None
+            )
+            if rule is None:
+                raise KeyError(
+                    f"No due date rule for {obligation_type} in state: {entity['state_code']}"
+                )
+            due = rule.next_after(date.fromordinal(key[0]), entity["formation_date"])
+            self._schedule(entity_id, obligation_type, due)
+            return due
+    
+    def _item(self, key: Tuple[int, str, str], as_of: date) -> Dict[str, Any]:
+        """Describe one scheduled occurrence."""
+        ordinal, entity_id, obligation_type = key
+        entity = self._entities[entity_id]
+        return {
+            "entity_id": entity_id,
+            "name": entity["name"],
+            "state_code": entity["state_code"],
+            "type": obligation_type,
+            "due_date": date.fromordinal(ordinal),
+            "days_until_due": ordinal - as_of.toordinal()
+        }
+    
+    def due_within(
+        self,
+        days: int,
+        as_of: AsOf = None,
+        include_overdue: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Get everything due across the portfolio in the next N days.
+        
+        Args:
+            days: Size of the window in days
+            as_of: Start of the window (defaults to today)
+            include_overdue: Also return occurrences due before as_of
+            
+        Returns:
+            Deadlines ordered by due date
+        """
+        as_of = parse_as_of(as_of)
+        with self._lock:
+            start = 0 if include_overdue else bisect_left(self._index, (as_of.toordinal(),))
+            end = bisect_left(self._index, (as_of.toordinal() + days + 1,))
+            return [self._item(key, as_of) for key in self._index[start:end]]
+    
+    def iter_due(self, as_of: AsOf = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over scheduled deadlines, earliest first.
+        
+        Args:
+            as_of: Date days_until_due is counted from (defaults to today)
+            
+        Returns:
+            Iterator of deadlines
+        """
+        as_of = parse_as_of(as_of)
+        for key in list(self._index):
+            yield self._item(key, as_of)
+    
+    def entity_deadlines(self, entity_id: str, as_of: AsOf = None) -> List[Dict[str, Any]]:
+        """
+        Get the scheduled and unscheduled deadlines of one LLC.
+        
+        Args:
+            entity_id: Identifier of the LLC
+            as_of: Date days_until_due is counted from (defaults to today)
+            
+        Returns:
+            Deadlines ordered by due date; unscheduled obligations come last
+            with due_date None
+        """
+        as_of = parse_as_of(as_of)
+        with self._lock:
+            scheduled = sorted(
+                (
+                    self._item(self._due[(entity_id, obligation_type)], as_of)
+                    for obligation_type in self._entities[entity_id]["scheduled"]
+                ),
+                key=lambda item: (item["due_date"], item["type"])
+            )
+            entity = self._entities[entity_id]
+            unscheduled = [
+                {
+                    "entity_id": entity_id,
+                    "name": entity["name"],
+                    "state_code": entity["state_code"],
+                    "type": obligation["type"],
+                    "due_date": None,
+                    "due_rule": obligation["due_rule"]
+                }
+                for obligation in self._unscheduled.get(entity_id, [])
+            ]
+            return scheduled + unscheduled
+
+_calendar: Optional[DeadlineCalendar] = None
+
+def get_deadline_calendar() -> DeadlineCalendar:
+    """Get the process-wide portfolio deadline calendar."""
+    global _calendar
+    if _calendar is None:
+        _calendar = DeadlineCalendar()
+    return _calendar
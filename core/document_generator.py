@@ -4,9 +4,9 @@ Module for generating legal and business documents.
 
 import os
 from typing import Dict, Any, List, Optional
-from datetime import datetime
 from pathlib import Path
 from core.utils import generate_document_from_template, generate_file_name, save_document
+from states.rule_history import get_rule_history, parse_as_of
 
 class DocumentGenerator:
     """Class for generating various business and legal documents."""
@@ -21,12 +21,17 @@ class DocumentGenerator:
         self.output_dir = output_dir
         self.template_dir = Path(__file__).parent.parent / "templates"
     
-    def generate_formation_documents(self, business_details: Dict[str, Any]) -> Dict[str, str]:
+    def generate_formation_documents(
+        self,
+        business_details: Dict[str, Any],
+        as_of: Any = None
+    ) -> Dict[str, str]:
         """
         Generate all necessary formation documents.
         
         Args:
             business_details: Dictionary containing business information
+            as_of: Date whose state rules and dates apply (defaults to today)
             
         Returns:
             Dictionary mapping document types to file paths
@@ -34,11 +39,11 @@ class DocumentGenerator:
         documents = {}
         
         # Generate Articles of Organization
-        articles = self.generate_articles_of_organization(business_details)
+        articles = self.generate_articles_of_organization(business_details, as_of)
         documents["articles_of_organization"] = articles
         
         # Generate Operating Agreement
-        agreement = self.generate_operating_agreement(business_details)
+        agreement = self.generate_operating_agreement(business_details, as_of)
         documents["operating_agreement"] = agreement
         
         # Generate additional documents based on business type
@@ -50,12 +55,17 @@ class DocumentGenerator:
         
         return documents
     
-    def generate_articles_of_organization(self, business_details: Dict[str, Any]) -> str:
+    def generate_articles_of_organization(
+        self,
+        business_details: Dict[str, Any],
+        as_of: Any = None
+    ) -> str:
         """
         Generate Articles of Organization.
         
         Args:
             business_details: Dictionary containing business information
+            as_of: Date whose state rules and dates apply (defaults to today)
             
         Returns:
             Path to generated document
@@ -63,8 +73,20 @@ class DocumentGenerator:
         state_code = business_details["state"]
         template_path = self.template_dir / "legal" / "state_specific" / "articles_of_organization.md"
         
+        # Filing details in effect on the document date
+        filing_details = {}
+        try:
+            state_rules = get_rule_history().snapshot("state_data", state_code, as_of)
+            filing_details = {
+                "filing_agency": state_rules.get("filing_agency"),
+                "filing_fee": state_rules.get("formation_fee")
+            }
+        except KeyError:
+            pass
+        
         # Add state-specific context
         context = {
+            **filing_details,
             **business_details,
             "state_code_is_ny": state_code == "NY",
             "state_code_is_ca": state_code == "CA",
@@ -72,7 +94,7 @@ class DocumentGenerator:
             "state_code_is_fl": state_code == "FL",
             "state_code_is_tx": state_code == "TX",
             "state_code_is_az": state_code == "AZ",
-            "execution_date": datetime.now().strftime("%B %d, %Y")
+            "execution_date": parse_as_of(as_of).strftime("%B %d, %Y")
         }
         
         content = generate_document_from_template(str(template_path), context)
@@ -80,12 +102,17 @@ class DocumentGenerator:
         
         return save_document(content, self.output_dir, f"{filename}.md")
     
-    def generate_operating_agreement(self, business_details: Dict[str, Any]) -> str:
+    def generate_operating_agreement(
+        self,
+        business_details: Dict[str, Any],
+        as_of: Any = None
+    ) -> str:
         """
         Generate Operating Agreement.
         
         Args:
             business_details: Dictionary containing business information
+            as_of: Effective date of the agreement (defaults to today)
             
         Returns:
             Path to generated document
@@ -95,7 +122,7 @@ class DocumentGenerator:
         # Add agreement-specific context
         context = {
             **business_details,
-            "effective_date": datetime.now().strftime("%B %d, %Y"),
+            "effective_date": parse_as_of(as_of).strftime("%B %d, %Y"),
             "single_member": len(business_details.get("members", [])) == 1,
             "member_managed": business_details.get("management_type") == "member"
         }
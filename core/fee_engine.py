@@ -0,0 +1,335 @@
+"""
+Precompiled state fee schedules with batch multi-state quoting.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.cost_optimizer import DEFAULT_COSTS
+from states.data_driven_state import DataDrivenState
+from states.rule_history import AsOf, get_rule_history
+from states.state_factory import StateFactory
+from states.state_table import STATE_TABLE
+
+FEE_COMPONENTS = [
+    "formation",
+    "expedited",
+    "name_reservation",
+    "certified_copy",
+    "certificate_of_good_standing",
+    "foreign_qualification",
+    "publication",
+    "annual_report",
+    "registered_agent"
+]
+
+# Service names accepted by quote(), mapped to fee components
+SERVICE_ALIASES = {
+    "expedited": "expedited",
+    "expedite": "expedited",
+    "name_reservation": "name_reservation",
+    "reserve_name": "name_reservation",
+    "certified_copy": "certified_copy",
+    "certified_copies": "certified_copy",
+    "certificate_of_good_standing": "certificate_of_good_standing",
+    "good_standing": "certificate_of_good_standing",
+    "foreign_qualification": "foreign_qualification",
+    "publication": "publication",
+    "annual_report": "annual_report",
+    "registered_agent": "registered_agent"
+}
+
+# Fees of states without itemized data
+DEFAULT_FEES = {
+    "formation": DEFAULT_COSTS["formation_fee"],
+    "expedited": DEFAULT_COSTS["expedited_fee"],
+    "name_reservation": 0.0,
+    "certified_copy": 25.0,
+    "certificate_of_good_standing": 25.0,
+    "publication": DEFAULT_COSTS["publication_cost"],
+    "annual_report": DEFAULT_COSTS["annual_report_fee"],
+    "registered_agent": DEFAULT_COSTS["registered_agent_fee"]
+}
+
+# Number of compiled engines kept, least recently used dropped first
+MAX_CACHED_ENGINES = 8
+
+_COLUMN = {component: i for i, component in enumerate(FEE_COMPONENTS)}
+
+def get_fee_schedule(state: Any) -> Dict[str, float]:
+    """
+    Get the itemized fee schedule of a state object.
+    
+    Args:
+        state: State implementation from StateFactory
+        
+    Returns:
+        Mapping of fee name to amount
+    """
+    if hasattr(state, "get_fee_schedule"):
+        return state.get_fee_schedule()
+    fees = state.get_filing_fees()
+    return fees if isinstance(fees, dict) else {"formation": fees}
+
+def _first_number(*values: Any) -> Optional[float]:
+    """Get the first numeric value, or None if there is none; numeric strings count."""
+    for value in values:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                continue
+    return None
+
+Services = Union[Sequence[str], Sequence[Sequence[str]], None]
+
+def _resolve_services(services: Services) -> List[List[str]]:
+    """Normalize services into a list of service combinations."""
+    if not services:
+        return [[]]
+    if isinstance(services[0], str):
+        return [list(services)]
+    return [list(combination) for combination in services]
+
+class FeeEngine:
+    """
+    Fee components of every state compiled into one matrix.
+    
+    Rows are states and columns are FEE_COMPONENTS. A quote multiplies
+    a (combinations x components) selection matrix into the fee rows of
+    the requested states, so any number of states and service combinations
+    are priced in one array operation.
+    """
+    
+    def __init__(self, as_of: AsOf = None):
+        """
+        Compile the fee matrix.
+        
+        Args:
+            as_of: Date whose fee schedules apply (defaults to today)
+        """
+        self.state_codes = sorted(STATE_TABLE)
+        self._rows = {code: i for i, code in enumerate(self.state_codes)}
+        self.fees = np.zeros((len(self.state_codes), len(FEE_COMPONENTS)))
+        self.estimated = np.zeros((len(self.state_codes), len(FEE_COMPONENTS)), dtype=bool)
+        self.publication_required = np.zeros(len(self.state_codes), dtype=bool)
+        
+        history = get_rule_history()
+        for row, code in enumerate(self.state_codes):
+            data = {}
+            if history.has_rules("state_data", code):
+                data = history.snapshot("state_data", code, as_of)
+            fees = {}
+            if history.has_rules("state_requirements", code):
+                fees = (
+                    history.snapshot("state_requirements", code, as_of)
+                    .get("formation_requirements", {})
+                    .get("fees", {})
+                )
+            for component, (value, estimated) in self._compile_state(code, data, fees).items():
+                self.fees[row, _COLUMN[component]] = value
+                self.estimated[row, _COLUMN[component]] = estimated
+            self.publication_required[row] = bool(data.get("publication_required"))
+    
+    @staticmethod
+    def _compile_state(
+        state_code: str,
+        data: Dict[str, Any],
+        fees: Dict[str, Any]
+    ) -> Dict[str, Tuple[float, bool]]:
+        """Resolve each fee component of one state, flagging defaulted values."""
+        state = StateFactory.get_state(state_code)
+        schedule = get_fee_schedule(state)
+        annual_report = data.get("annual_report")
+        publication = STATE_TABLE[state_code]["publication_requirements"] or {}
+        
+        sources = {
+            "formation": (data.get("formation_fee"), fees.get("formation")),
+            "expedited": (data.get("expedited_fee"), fees.get("expedited")),
+            "name_reservation": (data.get("name_reservation_fee"), fees.get("name_reservation")),
+            "certified_copy": (fees.get("certified_copy"),),
+            "certificate_of_good_standing": (fees.get("certificate_of_good_standing"),),
+            "publication": (publication.get("estimated_cost"),),
+            "annual_report": (
+                annual_report.get("fee") if isinstance(annual_report, dict) else None,
+                0.0 if annual_report is False else None,
+                fees.get("annual_report")
+            ),
+            "registered_agent": ()
+        }
+        compiled = {}
+        for component, values in sources.items():
+            value = _first_number(*values)
+            if value is None and component in schedule and not isinstance(state, DataDrivenState):
+                # Hand-written state classes carry their own itemized fees
+                value = _first_number(schedule[component])
+            compiled[component] = (
+                value if value is not None else DEFAULT_FEES[component],
+                value is None
+            )
+        
+        foreign_fee = None
+        if not isinstance(state, DataDrivenState):
+            foreign_fee = _first_number(schedule.get("foreign_qualification"))
+        compiled["foreign_qualification"] = (
+            foreign_fee if foreign_fee else compiled["formation"][0],
+            compiled["formation"][1] and not foreign_fee
+        )
+        return compiled
+    
+    def rows(self, state_codes: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        Get the matrix rows of states.
+        
+        Args:
+            state_codes: State codes (defaults to every state)
+            
+        Returns:
+            Integer row indices
+            
+        Raises:
+            KeyError: If a state code is invalid
+        """
+        if state_codes is None:
+            return np.arange(len(self.state_codes))
+        rows = []
+        for code in state_codes:
+            if code.upper() not in self._rows:
+                raise KeyError(f"Invalid state code: {code}")
+            rows.append(self._rows[code.upper()])
+        return np.array(rows, dtype=int)
+    
+    def selection(
+        self,
+        combinations: List[List[str]],
+        quantities: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        Build the component weights of service combinations.
+        
+        Args:
+            combinations: Service combinations; formation is always included
+            quantities: Count per component, e.g. {"certified_copy": 3}
+            
+        Returns:
+            Array of shape (combinations, components)
+            
+        Raises:
+            ValueError: If a service is unknown
+        """
+        weights = np.zeros((len(combinations), len(FEE_COMPONENTS)))
+        weights[:, _COLUMN["formation"]] = 1.0
+        for i, combination in enumerate(combinations):
+            for service in combination:
+                component = SERVICE_ALIASES.get(service.lower())
+                if component is None:
+                    raise ValueError(f"Unknown service: {service}")
+                weights[i, _COLUMN[component]] = (quantities or {}).get(component, 1.0)
+        return weights
+    
+    def quote(
+        self,
+        states: Optional[Iterable[str]] = None,
+        services: Services = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Price service combinations in many states at once.
+        
+        Args:
+            states: State codes (defaults to every state)
+            services: One service combination (list of names) or several
+                (list of lists)
+            options: Quote options:
+                include_required: Add publication where a state requires it
+                    (default True)
+                quantities: Count per component, e.g. {"certified_copy": 3}
+                
+        Returns:
+            Dictionary with states, combinations, components, a breakdown
+            array of shape (combinations, states, components), totals of
+            shape (combinations, states) and the estimated flags per state
+        """
+        options = options or {}
+        rows = self.rows(states)
+        combinations = _resolve_services(services)
+        weights = np.broadcast_to(
+            self.selection(combinations, options.get("quantities"))[:, np.newaxis, :],
+            (len(combinations), len(rows), len(FEE_COMPONENTS))
+        ).copy()
+        
+        if options.get("include_required", True):
+            column = _COLUMN["publication"]
+            weights[:, :, column] = np.maximum(
+                weights[:, :, column],
+                self.publication_required[rows][np.newaxis, :]
+            )
+        
+        breakdown = weights * self.fees[rows][np.newaxis, :, :]
+        return {
+            "states": [self.state_codes[row] for row in rows],
+            "combinations": combinations,
+            "components": list(FEE_COMPONENTS),
+            "breakdown": breakdown,
+            "totals": breakdown.sum(axis=2),
+            "estimated": ((weights > 0) & self.estimated[rows][np.newaxis, :, :]).any(axis=2)
+        }
+    
+    def quote_state(
+        self,
+        state_code: str,
+        services: Sequence[str],
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, float]:
+        """
+        Price one service combination in one state.
+        
+        Args:
+            state_code: Two-letter state code
+            services: Requested services
+            options: Quote options (see quote())
+            
+        Returns:
+            Dictionary with one amount per fee component plus the total
+        """
+        quote = self.quote([state_code], [list(services)], options)
+        breakdown = {
+            component: round(float(amount), 2)
+            for component, amount in zip(FEE_COMPONENTS, quote["breakdown"][0, 0])
+        }
+        breakdown["total"] = round(float(quote["totals"][0, 0]), 2)
+        return breakdown
+
+_engines: "OrderedDict[Tuple[int, int], FeeEngine]" = OrderedDict()
+_engines_lock = threading.Lock()
+
+def get_fee_engine(as_of: AsOf = None) -> FeeEngine:
+    """
+    Get the fee engine for a date, compiling it on first use.
+    
+    Engines are shared between dates on which the same rules are in effect.
+    At most MAX_CACHED_ENGINES are kept, and engines compiled from an older
+    revision of the rule history are dropped.
+    
+    Args:
+        as_of: Date whose fee schedules apply (defaults to today)
+        
+    Returns:
+        Compiled fee engine
+    """
+    epoch = get_rule_history().epoch(as_of)
+    with _engines_lock:
+        engine = _engines.get(epoch)
+        if engine is None:
+            engine = _engines[epoch] = FeeEngine(as_of)
+            for stale in [key for key in _engines if key[0] != epoch[0]]:
+                del _engines[stale]
+            while len(_engines) > MAX_CACHED_ENGINES:
+                _engines.popitem(last=False)
+        _engines.move_to_end(epoch)
+        return engine
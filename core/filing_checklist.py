@@ -0,0 +1,122 @@
+"""
+Precompiled filing checklists memoized per state and business type.
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from states.state_record import get_state_records
+
+Checklist = Tuple[Mapping[str, Any], ...]
+
+_checklists: Dict[Tuple[str, str], Checklist] = {}
+_checklists_records: Optional[Mapping[str, Any]] = None
+_checklists_lock = threading.Lock()
+
+def compile_checklist(state_code: str, business_type: str) -> Checklist:
+    """
+    Build the filing checklist of a state from its state record.
+    
+    Args:
+        state_code: Two-letter state code
+        business_type: Type of business (e.g., 'profit', 'non-profit')
+        
+    Returns:
+        Immutable tuple of read-only checklist items
+        
+    Raises:
+        KeyError: If state code is invalid
+    """
+    record = get_state_records().get(state_code)
+    requirements = record.requirements if record else None
+    compliance = record.compliance if record else None
+    if requirements is None or compliance is None:
+        raise KeyError(f"Invalid state code: {state_code}")
+    
+    checklist = []
+    
+    # Add formation documents
+    filing = requirements["formation_requirements"].get("filing_requirements", {})
+    if filing.get("articles_of_organization"):
+        checklist.append({
+            "item": "Articles of Organization",
+            "required": True,
+            "deadline": "Before operations",
+            "notes": "Must be filed with Secretary of State"
+        })
+    
+    # Add compliance requirements
+    for req_type, details in compliance["initial_requirements"].items():
+        required = details.get("required")
+        if required is True or (isinstance(required, str) and required != "Varies"):
+            checklist.append({
+                "item": req_type.replace("_", " ").title(),
+                "required": True,
+                "deadline": "Before operations",
+                "notes": f"File with {details.get('agency', 'appropriate agency')}"
+            })
+    
+    return tuple(MappingProxyType(item) for item in checklist)
+
+def _current_checklists() -> Dict[Tuple[str, str], Checklist]:
+    """Get the checklist cache, dropping it if the state records were rebuilt."""
+    global _checklists_records
+    records = get_state_records()
+    if records is not _checklists_records:
+        with _checklists_lock:
+            if records is not _checklists_records:
+                _checklists.clear()
+                _checklists_records = records
+    return _checklists
+
+def _lookup(
+    cache: Dict[Tuple[str, str], Checklist],
+    state_code: str,
+    business_type: str
+) -> Checklist:
+    """Get a checklist from the cache, compiling it on first use."""
+    key = (state_code.upper(), (business_type or "").lower())
+    checklist = cache.get(key)
+    if checklist is None:
+        checklist = compile_checklist(*key)
+        with _checklists_lock:
+            checklist = cache.setdefault(key, checklist)
+    return checklist
+
+def get_filing_checklist(state_code: str, business_type: str) -> Checklist:
+    """
+    Get the filing checklist of a state and business type.
+    
+    The checklist is compiled once per (state, business type) until the
+    state records are invalidated; later calls return the same immutable
+    tuple.
+    
+    Args:
+        state_code: Two-letter state code
+        business_type: Type of business (e.g., 'profit', 'non-profit')
+        
+    Returns:
+        Immutable tuple of read-only checklist items
+        
+    Raises:
+        KeyError: If state code is invalid
+    """
+    return _lookup(_current_checklists(), state_code, business_type)
+
+def get_filing_checklists(entities: Iterable[Tuple[str, str]]) -> List[Checklist]:
+    """
+    Get the filing checklists of many entities.
+    
+    Args:
+        entities: (state_code, business_type) pairs
+        
+    Returns:
+        Checklists in input order; entities of the same state and business
+        type share one tuple
+        
+    Raises:
+        KeyError: If a state code is invalid
+    """
+    cache = _current_checklists()
+    return [_lookup(cache, state_code, business_type) for state_code, business_type in entities]
@@ -0,0 +1,245 @@
+"""
+Multi-state foreign qualification planner.
+"""
+
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.cost_optimizer import DEFAULT_COSTS
+from core.fee_engine import get_fee_schedule
+from states.requirements.foreign_llc import FOREIGN_LLC_REQUIREMENTS
+from states.state_factory import StateFactory
+from states.state_metrics import derive_state_metrics
+from states.state_table import STATE_TABLE
+
+# Readable names of the maintenance requirements in FOREIGN_LLC_REQUIREMENTS
+OBLIGATION_NAMES = {
+    "annual_report": "Annual Report",
+    "biennial_report": "Biennial Report",
+    "registered_agent_maintenance": "Maintain Registered Agent",
+    "state_tax_registration": "State Tax Registration",
+    "local_business_license": "Local Business License",
+    "franchise_tax": "Franchise Tax"
+}
+
+# Forms required by a registration requirement flag
+REGISTRATION_FORMS = {
+    "certificate_of_good_standing": "Certificate of Good Standing from home state",
+    "statement_of_information": "Statement of Information",
+    "tax_clearance": "Tax Clearance Letter",
+    "publication": "Affidavit of Publication"
+}
+
+DEFAULT_REGISTRATION_FORM = "Application for Registration of Foreign LLC"
+
+def _value(value: float, default: float) -> float:
+    """Replace an unknown (NaN) metric with a default."""
+    return default if math.isnan(value) else value
+
+def _requires_certificate(profile: Dict[str, Any]) -> bool:
+    """Check whether a state asks for a certificate of good standing from the home state."""
+    return REGISTRATION_FORMS["certificate_of_good_standing"] in profile["forms"]
+
+class ForeignQualificationPlanner:
+    """
+    Plans foreign registrations for every state a business operates in.
+    
+    Each state's requirements are resolved once into a profile and reused
+    across plans, so a plan covering all states is a merge of cached
+    profiles plus the aggregation.
+    """
+    
+    def __init__(self):
+        """Initialize the planner with an empty profile cache."""
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get_state_profile(self, state_code: str) -> Dict[str, Any]:
+        """
+        Get the foreign qualification requirements of one state.
+        
+        Args:
+            state_code: Two-letter state code
+            
+        Returns:
+            Dictionary with fees, forms, processing days, registered agent
+            needs and annual obligations
+            
+        Raises:
+            KeyError: If state code is invalid
+        """
+        profile = self._profiles.get(state_code)
+        if profile is not None:
+            return profile
+        
+        if state_code not in STATE_TABLE:
+            raise KeyError(f"Invalid state code: {state_code}")
+        
+        with self._lock:
+            if state_code not in self._profiles:
+                self._profiles[state_code] = self._build_profile(state_code)
+            return self._profiles[state_code]
+    
+    def _build_profile(self, state_code: str) -> Dict[str, Any]:
+        """Resolve the foreign qualification requirements of one state."""
+        state = StateFactory.get_state(state_code)
+        record = STATE_TABLE[state_code]
+        metrics = derive_state_metrics(state_code)
+        requirements = FOREIGN_LLC_REQUIREMENTS.get(state_code, FOREIGN_LLC_REQUIREMENTS["default"])
+        registration = requirements.get("registration_requirements", {})
+        maintenance = requirements.get("maintenance_requirements", {})
+        
+        schedule = get_fee_schedule(state)
+        formation_fee = _value(metrics["formation_fee"], DEFAULT_COSTS["formation_fee"])
+        filing_fee = schedule.get("foreign_qualification") or formation_fee
+        
+        publication_fee = 0.0
+        if registration.get("publication"):
+            estimate = (record["publication_requirements"] or {}).get("estimated_cost")
+            publication_fee = float(estimate or DEFAULT_COSTS["publication_cost"])
+        
+        forms = [DEFAULT_REGISTRATION_FORM]
+        formation_requirements = state.get_formation_requirements()
+        if isinstance(formation_requirements.get("foreign_qualification"), dict):
+            forms = list(formation_requirements["foreign_qualification"].get("forms", forms))
+        forms += [form for flag, form in REGISTRATION_FORMS.items() if registration.get(flag)]
+        
+        annual_fee = _value(metrics["annual_report_fee"], DEFAULT_COSTS["annual_report_fee"])
+        franchise_tax = _value(metrics["franchise_tax_min"], DEFAULT_COSTS["franchise_tax_min"])
+        obligations = [
+            {
+                "name": OBLIGATION_NAMES.get(key, key.replace("_", " ").title()),
+                "required": required
+            }
+            for key, required in maintenance.items() if required
+        ]
+        
+        processing_days = metrics["processing_days"]
+        if math.isnan(processing_days):
+            processing_days = state.get_processing_time()
+        
+        return {
+            "state_code": state_code,
+            "state_name": record["state_name"],
+            "filing_agency": record["filing_agency"],
+            "fees": {
+                "registration": float(filing_fee),
+                "publication": publication_fee
+            },
+            "forms": forms,
+            "processing_days": int(processing_days),
+            "certificate_age_limit": registration.get("certificate_age_limit"),
+            "registered_agent": {
+                "required": bool(registration.get("registered_agent", True)),
+                "local_office_required": bool(registration.get("local_office", False)),
+                "estimated_annual_fee": DEFAULT_COSTS["registered_agent_fee"]
+            },
+            "annual_obligations": obligations,
+            "annual_fees": {
+                "annual_report": annual_fee,
+                "franchise_tax": franchise_tax,
+                "registered_agent": DEFAULT_COSTS["registered_agent_fee"]
+            },
+            "publication": requirements.get("publication_requirements"),
+            "additional_requirements": requirements.get("additional_requirements", {}),
+            "estimated": any(
+                math.isnan(metrics[name]) for name in ("formation_fee", "annual_report_fee")
+            )
+        }
+    
+    def plan(self, home_state: str, operating_states: Iterable[str]) -> Dict[str, Any]:
+        """
+        Plan foreign qualification in every state a business operates in.
+        
+        Args:
+            home_state: State of formation
+            operating_states: States the business operates in; the home state
+                is skipped
+                
+        Returns:
+            Dictionary with one entry per state plus the aggregated budget
+            and timeline
+            
+        Raises:
+            KeyError: If a state code is invalid
+        """
+        home_state = home_state.upper()
+        if home_state not in STATE_TABLE:
+            raise KeyError(f"Invalid state code: {home_state}")
+        home_fees = get_fee_schedule(StateFactory.get_state(home_state))
+        certificate_fee = float(home_fees.get("certificate_of_good_standing", 0.0))
+        
+        codes = sorted({code.upper() for code in operating_states} - {home_state})
+        states = []
+        for code in codes:
+            profile = self.get_state_profile(code)
+            fees = dict(profile["fees"])
+            if _requires_certificate(profile):
+                fees["certificate_of_good_standing"] = certificate_fee
+            one_time = sum(fees.values())
+            annual = sum(profile["annual_fees"].values())
+            states.append({
+                **profile,
+                "fees": fees,
+                "one_time_total": round(one_time, 2),
+                "annual_total": round(annual, 2)
+            })
+        
+        return {
+            "home_state": home_state,
+            "states": states,
+            "budget": self._budget(states),
+            "timeline": self._timeline(home_state, states)
+        }
+    
+    @staticmethod
+    def _budget(states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregate one-time and recurring costs."""
+        one_time = sum(state["one_time_total"] for state in states)
+        annual = sum(state["annual_total"] for state in states)
+        return {
+            "one_time": round(one_time, 2),
+            "annual": round(annual, 2),
+            "first_year": round(one_time + annual, 2),
+            "registered_agents_needed": sum(
+                1 for state in states if state["registered_agent"]["required"]
+            ),
+            "estimated": any(state["estimated"] for state in states)
+        }
+    
+    @staticmethod
+    def _timeline(home_state: str, states: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregate processing times and certificate validity."""
+        if not states:
+            return {"estimated_completion_days": 0, "critical_path": [], "filing_windows": []}
+        
+        longest = max(state["processing_days"] for state in states)
+        limits = sorted({
+            state["certificate_age_limit"] for state in states if state["certificate_age_limit"]
+        })
+        # Certificates of good standing expire, so file within the strictest limit
+        windows = [
+            {
+                "certificate_age_limit": limit,
+                "states": [s["state_code"] for s in states if s["certificate_age_limit"] == limit]
+            }
+            for limit in limits
+        ]
+        return {
+            "certificates_to_order": sum(1 for state in states if _requires_certificate(state)),
+            "certificate_issuer": home_state,
+            "file_within_days": limits[0] if limits else None,
+            "filing_windows": windows,
+            "estimated_completion_days": longest,
+            "critical_path": [s["state_code"] for s in states if s["processing_days"] == longest]
+        }
+
+_planner: Optional[ForeignQualificationPlanner] = None
+
+def get_foreign_qualification_planner() -> ForeignQualificationPlanner:
+    """Get the process-wide foreign qualification planner."""
+    global _planner
+    if _planner is None:
+        _planner = ForeignQualificationPlanner()
+    return _planner
@@ -0,0 +1,465 @@
+"""
+Offline BM25 retrieval index over the state tables, templates and agent knowledge.
+
+The index is persisted to SQLite. Each source is fingerprinted from its
+files, so a refresh re-collects only the sources that changed since the
+last build.
+
+Usage:
+    python -m core.knowledge_index "annual report fee alabama" --k 5
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.config import Config
+
+# Bump when tokenize() or the schema changes, so existing index files are rebuilt
+INDEX_FORMAT = 1
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Terms too common to rank by; "llc" appears in nearly every document
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i if in is it llc me my of on or "
+    "our so that the their them there this to was what when where which who will "
+    "with you your".split()
+)
+
+@dataclass
+class Document:
+    """A unit of retrievable knowledge."""
+    doc_id: str
+    source: str
+    title: str
+    text: str
+    keywords: str = ""
+
+@dataclass
+class SearchResult:
+    """A document matching a query."""
+    doc_id: str
+    source: str
+    title: str
+    score: float
+    snippet: str
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms.
+    
+    Args:
+        text: Text to tokenize
+        
+    Returns:
+        Lowercase terms without stopwords; plural "s" endings are dropped
+    """
+    terms = []
+    for token in _TOKEN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+def _humanize(key: Any) -> str:
+    return str(key).replace("_", " ")
+
+def _flatten(value: Any, prefix: str = "") -> Iterator[str]:
+    """Render nested data as one "path: value" line per leaf."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _flatten(item, f"{prefix} {_humanize(key)}".strip())
+    elif isinstance(value, (list, tuple)):
+        if all(not isinstance(item, (dict, list, tuple)) for item in value):
+            yield f"{prefix}: {', '.join(str(item) for item in value)}"
+        else:
+            for item in value:
+                yield from _flatten(item, prefix)
+    elif value is not None and value != "":
+        yield f"{prefix}: {value}"
+
+def _hash_modules(*module_names: str) -> str:
+    """Hash the source files of modules without importing them."""
+    digest = hashlib.sha256()
+    for module_name in module_names:
+        spec = importlib.util.find_spec(module_name)
+        digest.update(module_name.encode("utf-8"))
+        with open(spec.origin, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def _template_files() -> List[Path]:
+    return sorted(Path(Config.get_path("templates")).rglob("*.md"))
+
+def _fingerprint_templates() -> str:
+    digest = hashlib.sha256()
+    for path in _template_files():
+        digest.update(str(path).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+_STATE_MODULES = (
+    "core.state_compliance",
+    "core.state_requirements",
+    "core.state_tax_requirements",
+    "states.requirements.foreign_llc",
+    "states.requirements.professional_llc",
+    "states.requirements.regulated_professions",
+    "states.requirements.tax",
+    "states.state_data",
+    "states.state_table"
+)
+
+def _collect_states() -> Iterator[Document]:
+    """One document per state and state table section."""
+    from states.state_record import get_state_records
+    
+    for state_code, record in get_state_records().items():
+        name = f"{record.state_name} ({state_code})"
+        for section, data in record.as_dict().items():
+            if section in ("state_code", "state_name", "sources") or not data:
+                continue
+            yield Document(
+                doc_id=f"state:{state_code}:{section}",
+                source="states",
+                title=f"{name} {_humanize(section)}",
+                text="\n".join(_flatten(data)),
+                keywords=state_code
+            )
+
+def _collect_templates() -> Iterator[Document]:
+    """One document per Markdown template."""
+    root = Path(Config.get_path("templates"))
+    for path in _template_files():
+        text = path.read_text(encoding="utf-8")
+        heading = re.search(r"^#+\s*(.+)$", text, re.MULTILINE)
+        relative = path.relative_to(root).as_posix()
+        yield Document(
+            doc_id=f"template:{relative}",
+            source="templates",
+            title=heading.group(1).strip() if heading else _humanize(path.stem).title(),
+            text=text,
+            keywords=_humanize(relative)
+        )
+
+def _collect_iso_standards() -> Iterator[Document]:
+    """One document per ISO standard."""
+    from agents.iso_agent.agent import ISOAgent
+    
+    for standard_id, standard in ISOAgent()._standards.items():
+        yield Document(
+            doc_id=f"iso:{standard_id}",
+            source="iso_standards",
+            title=f"ISO {standard.code} {standard.name}",
+            text="\n".join([
+                standard.description,
+                *_flatten(standard.requirements, "requirements"),
+                *_flatten(standard.applicability, "applicability"),
+                *_flatten(standard.documentation_required, "documentation required")
+            ])
+        )
+
+def _collect_industries() -> Iterator[Document]:
+    """One document per industry profile."""
+    from agents.industry_specialist.industry_data import GENERIC_INDUSTRY, INDUSTRY_DATA
+    
+    for industry, info in {**INDUSTRY_DATA, "generic": GENERIC_INDUSTRY}.items():
+        yield Document(
+            doc_id=f"industry:{industry}",
+            source="industries",
+            title=f"{info['name']} requirements",
+            text="\n".join([
+                *(f"{name}: {status}, {details}" for name, status, details in info["requirements"]),
+                *_flatten(info["timeline"], "timeline")
+            ])
+        )
+
+def _collect_job_descriptions() -> Iterator[Document]:
+    """One document per job description."""
+    from agents.job_descriptions import JobDescriptionGenerator
+    
+    for attribute in sorted(vars(JobDescriptionGenerator)):
+        if not (attribute.startswith("create_") and attribute.endswith("_jobs")):
+            continue
+        area = attribute[len("create_"):-len("_jobs")]
+        for job in getattr(JobDescriptionGenerator, attribute)():
+            details = {key: value for key, value in job.items() if key != "title"}
+            yield Document(
+                doc_id=f"job:{area}:{job['title']}",
+                source="job_descriptions",
+                title=f"{job['title']} ({_humanize(area)})",
+                text="\n".join(_flatten(details))
+            )
+
+# Source name -> (fingerprint, collector)
+KNOWLEDGE_SOURCES: Dict[str, Tuple[Callable[[], str], Callable[[], Iterable[Document]]]] = {
+    "states": (lambda: _hash_modules(*_STATE_MODULES), _collect_states),
+    "templates": (_fingerprint_templates, _collect_templates),
+    "iso_standards": (lambda: _hash_modules("agents.iso_agent.agent"), _collect_iso_standards),
+    "industries": (
+        lambda: _hash_modules("agents.industry_specialist.industry_data"),
+        _collect_industries
+    ),
+    "job_descriptions": (
+        lambda: _hash_modules("agents.job_descriptions"),
+        _collect_job_descriptions
+    )
+}
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, fingerprint TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS documents ("
+    "doc_id TEXT PRIMARY KEY, source TEXT NOT NULL, title TEXT NOT NULL, "
+    "text TEXT NOT NULL, length INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS documents_source ON documents (source)",
+    "CREATE TABLE IF NOT EXISTS postings ("
+    "term TEXT NOT NULL, doc_id TEXT NOT NULL, tf INTEGER NOT NULL, "
+    "PRIMARY KEY (term, doc_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id)"
+]
+
+class KnowledgeIndex:
+    """
+    BM25 index persisted to SQLite and held in memory as posting arrays.
+    
+    refresh() brings the file up to date with the sources; search() scores
+    only the postings of the query terms, so queries take well under a
+    millisecond for the size of this knowledge base.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the index.
+        
+        Args:
+            path: Path of the index file (defaults to Config.PATHS["knowledge_index"])
+        """
+        self.path = path or Config.get_path("knowledge_index")
+        self.k1 = Config.KNOWLEDGE_INDEX["k1"]
+        self.b = Config.KNOWLEDGE_INDEX["b"]
+        self._lock = threading.Lock()
+        self._doc_ids: List[str] = []
+        self._documents: Dict[str, Tuple[str, str, str]] = {}
+        self._lengths = np.zeros(0)
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+    
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        row = None
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+        except sqlite3.Error:
+            pass
+        if row is not None and row[0] != str(INDEX_FORMAT):
+            conn.close()
+            os.unlink(self.path)
+            conn = sqlite3.connect(self.path)
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('format', ?)", (str(INDEX_FORMAT),)
+        )
+        return conn
+    
+    def refresh(self, force: bool = False) -> List[str]:
+        """
+        Re-index changed sources and load the index into memory.
+        
+        Args:
+            force: Re-index every source
+            
+        Returns:
+            Names of the sources that were re-indexed
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                stored = dict(conn.execute("SELECT name, fingerprint FROM sources"))
+                rebuilt = []
+                for name, (fingerprint, collect) in KNOWLEDGE_SOURCES.items():
+                    current = fingerprint()
+                    if not force and stored.get(name) == current:
+                        continue
+                    with conn:
+                        self._index_source(conn, name, collect())
+                        conn.execute(
+                            "INSERT OR REPLACE INTO sources (name, fingerprint) VALUES (?, ?)",
+                            (name, current)
+                        )
+                    rebuilt.append(name)
+                
+                removed = set(stored) - set(KNOWLEDGE_SOURCES)
+                if removed:
+                    with conn:
+                        for name in removed:
+                            self._index_source(conn, name, [])
+                            conn.execute("DELETE FROM sources WHERE name = ?", (name,))
+                self._load(conn)
+            finally:
+                conn.close()
+            return rebuilt
+    
+    @staticmethod
+    def _index_source(conn: sqlite3.Connection, source: str, documents: Iterable[Document]) -> None:
+        """Replace the documents and postings of one source."""
+        conn.execute(
+            "DELETE FROM postings WHERE doc_id IN (SELECT doc_id FROM documents WHERE source = ?)",
+            (source,)
+        )
+        conn.execute("DELETE FROM documents WHERE source = ?", (source,))
+        for document in documents:
+            terms = Counter(
+                tokenize(f"{document.title}\n{document.keywords}\n{document.text}")
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO documents (doc_id, source, title, text, length) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (document.doc_id, source, document.title, document.text, sum(terms.values()))
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                ((term, document.doc_id, tf) for term, tf in terms.items())
+            )
+    
+    def _load(self, conn: sqlite3.Connection) -> None:
+        """Read the index file into posting arrays."""
+        rows = conn.execute(
+            "SELECT doc_id, source, title, text, length FROM documents ORDER BY doc_id"
+        ).fetchall()
+        positions = {row[0]: position for position, row in enumerate(rows)}
+        
+        grouped: Dict[str, Tuple[List[int], List[int]]] = {}
+        for term, doc_id, tf in conn.execute("SELECT term, doc_id, tf FROM postings"):
+            docs, tfs = grouped.setdefault(term, ([], []))
+            docs.append(positions[doc_id])
+            tfs.append(tf)
+        
+        self._doc_ids = [row[0] for row in rows]
+        self._documents = {row[0]: (row[1], row[2], row[3]) for row in rows}
+        self._lengths = np.array([row[4] for row in rows], dtype=float)
+        self._postings = {
+            term: (np.array(docs, dtype=np.int64), np.array(tfs, dtype=float))
+            for term, (docs, tfs) in grouped.items()
+        }
+    
+    def search(
+        self,
+        query: str,
+        k: Optional[int] = None,
+        sources: Optional[Iterable[str]] = None
+    ) -> List[SearchResult]:
+        """
+        Find the documents that best match a query.
+        
+        Args:
+            query: Free-text query
+            k: Maximum number of results (defaults to Config.KNOWLEDGE_INDEX["top_k"])
+            sources: Only return documents from these sources
+            
+        Returns:
+            Results ordered by descending BM25 score
+        """
+        if k is None:
+            k = Config.KNOWLEDGE_INDEX["top_k"]
+        count = len(self._doc_ids)
+        terms = [term for term in dict.fromkeys(tokenize(query)) if term in self._postings]
+        if not count or not terms or k <= 0:
+            return []
+        
+        average = self._lengths.mean() or 1.0
+        norms = self.k1 * (1 - self.b + self.b * self._lengths / average)
+        scores = np.zeros(count)
+        for term in terms:
+            docs, tfs = self._postings[term]
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norms[docs])
+        
+        if sources is not None:
+            allowed = set(sources)
+            for position, doc_id in enumerate(self._doc_ids):
+                if self._documents[doc_id][0] not in allowed:
+                    scores[position] = 0.0
+        
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) > k:
+            matched = matched[np.argpartition(-scores[matched], k)[:k]]
+        matched = matched[np.argsort(-scores[matched], kind="stable")]
+        
+        results = []
+        for position in matched.tolist():
+            doc_id = self._doc_ids[position]
+            source, title, text = self._documents[doc_id]
+            results.append(SearchResult(
+                doc_id=doc_id,
+                source=source,
+                title=title,
+                score=float(scores[position]),
+                snippet=_snippet(text, set(terms))
+            ))
+        return results
+
+def _snippet(text: str, terms: set, max_lines: int = 3) -> str:
+    """Pick the lines of a document that mention the most query terms."""
+    ranked = []
+    for index, line in enumerate(text.splitlines()):
+        hits = len(terms.intersection(tokenize(line)))
+        if hits:
+            ranked.append((-hits, index, line.strip(" #*-")))
+    best = sorted(ranked)[:max_lines]
+    return "\n".join(line for _, _, line in sorted(best, key=lambda item: item[1]))
+
+_index: Optional[KnowledgeIndex] = None
+_index_lock = threading.Lock()
+
+def get_knowledge_index() -> KnowledgeIndex:
+    """Get the process-wide knowledge index, refreshing it on first use."""
+    global _index
+    if _index is not None:
+        return _index
+    with _index_lock:
+        if _index is None:
+            index = KnowledgeIndex()
+            index.refresh()
+            _index = index
+        return _index
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Search the local knowledge index.")
+    parser.add_argument("query", nargs="?", default=None, help="Free-text query")
+    parser.add_argument("--k", type=int, default=None, help="Maximum number of results")
+    parser.add_argument("--source", action="append", default=None, help="Restrict to a source")
+    parser.add_argument("--rebuild", action="store_true", help="Re-index every source")
+    args = parser.parse_args()
+    
+    index = KnowledgeIndex()
+    rebuilt = index.refresh(force=args.rebuild)
+    if rebuilt:
+        print(f"Indexed {', '.join(rebuilt)} ({len(index)} documents)")
+    if args.query:
+        for result in index.search(args.query, k=args.k, sources=args.source):
+            print(f"{result.score:6.2f}  {result.title}  [{result.doc_id}]")
+            for line in result.snippet.splitlines():
+                print(f"        {line}")
+
+if __name__ == "__main__":
+    main()
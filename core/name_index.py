@@ -0,0 +1,506 @@
+"""
+Name distinguishability index over registered entity names.
+"""
+
+import csv
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+import numpy as np
+
+# Entity designators ignored when comparing names, longest first
+DESIGNATORS = [
+    "limited liability company",
+    "ltd liability company",
+    "limited liability co",
+    "ltd liability co",
+    "limited company",
+    "professional limited liability company",
+    "l l c",
+    "p l l c",
+    "llc",
+    "pllc",
+    "lc",
+    "incorporated",
+    "corporation",
+    "company",
+    "limited",
+    "corp",
+    "inc",
+    "ltd",
+    "co"
+]
+
+# Query trigrams scanned beyond the minimal prefix; each one raises the
+# number of prefix hits a candidate needs, pruning most before verification
+EXTRA_PREFIX_GRAMS = 2
+
+IGNORED_WORDS = {"the", "a", "an", "and", "of"}
+
+NUMBER_WORDS = {
+    "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
+    "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9",
+    "ten": "10", "eleven": "11", "twelve": "12", "thirteen": "13",
+    "fourteen": "14", "fifteen": "15", "sixteen": "16", "seventeen": "17",
+    "eighteen": "18", "nineteen": "19", "twenty": "20", "thirty": "30",
+    "forty": "40", "fifty": "50", "sixty": "60", "seventy": "70",
+    "eighty": "80", "ninety": "90", "hundred": "100", "thousand": "1000",
+    "first": "1st", "second": "2nd", "third": "3rd"
+}
+
+_DESIGNATOR_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(d) for d in sorted(DESIGNATORS, key=len, reverse=True)) + r")\b"
+)
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]|_")
+
+def normalize_name(name: str) -> str:
+    """
+    Reduce a business name to the form used for distinguishability checks.
+    
+    Case, punctuation, entity designators, articles and "and"/"&" are
+    ignored, and number words are treated the same as digits.
+    
+    Args:
+        name: Business name
+        
+    Returns:
+        Normalized name
+    """
+    text = _PUNCTUATION_PATTERN.sub(" ", name.lower().replace("&", " and "))
+    text = _DESIGNATOR_PATTERN.sub(" ", text)
+    words = [NUMBER_WORDS.get(word, word) for word in text.split() if word not in IGNORED_WORDS]
+    return " ".join(words)
+
+def trigrams(normalized: str) -> Set[str]:
+    """
+    Get the character trigrams of a normalized name, ignoring spaces.
+    
+    Args:
+        normalized: Name returned by normalize_name()
+        
+    Returns:
+        Set of trigrams (short names yield their padded form)
+    """
+    compact = f"  {normalized.replace(' ', '')} "
+    return {compact[i:i + 3] for i in range(len(compact) - 2)}
+
+class _Column:
+    """
+    Append-only uint32 array that readers can slice without holding a lock.
+    
+    Growing allocates a new buffer instead of resizing in place, and stored
+    values are never rewritten, so a snapshot taken under the writer's lock
+    stays valid after the lock is released.
+    """
+    __slots__ = ("data", "size")
+    
+    def __init__(self, capacity: int = 4):
+        self.data = np.empty(capacity, dtype=np.uint32)
+        self.size = 0
+    
+    def append(self, value: int) -> None:
+        size = self.size
+        data = self.data
+        if size == len(data):
+            data = np.empty(2 * size, dtype=np.uint32)
+            data[:size] = self.data
+            self.data = data
+        data[size] = value
+        self.size = size + 1
+    
+    def snapshot(self) -> np.ndarray:
+        """Get a read-only view of the values stored so far."""
+        view = self.data[:self.size]
+        view.flags.writeable = False
+        return view
+
+class NameIndex:
+    """
+    Trigram inverted index of the entity names registered in one state.
+    
+    Postings are append-only integer arrays. Lookups scan only the rarest query
+    trigrams needed to guarantee every candidate above the similarity
+    threshold is found, drop candidates whose trigram count rules them out,
+    then verify the rest exactly.
+    """
+    
+    def __init__(self, threshold: float = 0.8):
+        """
+        Initialize an empty index.
+        
+        Args:
+            threshold: Default Jaccard similarity at which names conflict
+        """
+        self.threshold = threshold
+        self._names: List[str] = []
+        self._normalized: List[str] = []
+        self._gram_counts = _Column(1024)
+        self._exact: Dict[str, List[int]] = {}
+        self._postings: Dict[str, _Column] = {}
+        self._removed: Set[int] = set()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._names) - len(self._removed)
+    
+    def __contains__(self, name: str) -> bool:
+        return any(i not in self._removed for i in self._exact.get(normalize_name(name), ()))
+    
+    def add(self, name: str) -> bool:
+        """
+        Add a registered entity name.
+        
+        Args:
+            name: Registered entity name
+            
+        Returns:
+            True if the name was added, False if it was already indexed
+        """
+        name = name.strip()
+        normalized = normalize_name(name)
+        if not normalized:
+            return False
+        
+        with self._lock:
+            for entity_id in self._exact.get(normalized, ()):
+                if self._names[entity_id] == name:
+                    if entity_id not in self._removed:
+                        return False
+                    self._removed.discard(entity_id)
+                    return True
+            
+            entity_id = len(self._names)
+            self._names.append(name)
+            self._normalized.append(normalized)
+            self._exact.setdefault(normalized, []).append(entity_id)
+            grams = trigrams(normalized)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = _Column()
+                postings.append(entity_id)
+            return True
+    
+    def add_many(self, names: Iterable[str]) -> int:
+        """
+        Add many names, e.g. from a new registry dump.
+        
+        Args:
+            names: Registered entity names
+            
+        Returns:
+            Number of names newly added
+        """
+        return sum(1 for name in names if self.add(name))
+    
+    def remove(self, name: str) -> bool:
+        """
+        Remove a name, e.g. when an entity is dissolved.
+        
+        Args:
+            name: Registered entity name
+            
+        Returns:
+            True if the name was indexed
+        """
+        name = name.strip()
+        with self._lock:
+            for entity_id in self._exact.get(normalize_name(name), ()):
+                if self._names[entity_id] == name and entity_id not in self._removed:
+                    self._removed.add(entity_id)
+                    return True
+        return False
+    
+    def find_similar(
+        self,
+        name: str,
+        threshold: Optional[float] = None,
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Find registered names similar to a proposed name.
+        
+        Args:
+            name: Proposed name
+            threshold: Minimum Jaccard similarity of trigram sets
+            limit: Maximum number of matches
+            
+        Returns:
+            Matches, most similar first, each with name, normalized and similarity
+        """
+        return self.find_similar_many([name], threshold, limit)[0]
+    
+    def find_similar_many(
+        self,
+        names: Iterable[str],
+        threshold: Optional[float] = None,
+        limit: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Find registered names similar to each of many proposed names.
+        
+        The lock is taken once for the whole batch, and the candidates of
+        every name are filtered and verified together in array operations.
+        
+        Args:
+            names: Proposed names
+            threshold: Minimum Jaccard similarity of trigram sets
+            limit: Maximum number of matches per name
+            
+        Returns:
+            Matches of each name in input order, most similar first, each
+            with name, normalized and similarity
+        """
+        threshold = self.threshold if threshold is None else threshold
+        normalized = [normalize_name(name) for name in names]
+        queries = [trigrams(text) if text else set() for text in normalized]
+        results: List[List[Dict[str, Any]]] = [[] for _ in normalized]
+        grams = set().union(*queries)
+        
+        # Only views are taken under the lock; the lookup reads them afterwards
+        with self._lock:
+            postings = {
+                gram: self._postings[gram].snapshot() for gram in grams if gram in self._postings
+            }
+            gram_counts = self._gram_counts.snapshot()
+        rarity = {gram: len(postings[gram]) if gram in postings else 0 for gram in grams}
+        
+        # Any name with Jaccard >= threshold shares at least min_overlap
+        # trigrams, so it misses at most len(query) - min_overlap of them and
+        # appears at least extra + 1 times among the postings of the rarest
+        # len(query) - min_overlap + 1 + extra query trigrams
+        parts = []
+        part_queries = []
+        min_hits = EXTRA_PREFIX_GRAMS + 1
+        for position, (text, query) in enumerate(zip(normalized, queries)):
+            if not text:
+                continue
+            min_overlap = max(1, math.ceil(threshold * len(query)))
+            extra = min(EXTRA_PREFIX_GRAMS, min_overlap - 1)
+            prefix = sorted(query, key=rarity.__getitem__)[:len(query) - min_overlap + 1 + extra]
+            parts.extend(postings[gram] for gram in prefix if gram in postings)
+            part_queries.extend([position] * (len(parts) - len(part_queries)))
+            min_hits = min(min_hits, extra + 1)
+        if not parts:
+            return results
+        
+        # (query, candidate) keys; a pair with enough prefix hits fills that
+        # many consecutive slots once sorted. The smallest requirement of the
+        # batch is applied to every query, which only lets extra pairs through
+        # to the exact check
+        stride = len(gram_counts)
+        key_type = np.uint32 if len(queries) * stride <= np.iinfo(np.uint32).max else np.uint64
+        keys = np.repeat(
+            np.array(part_queries, dtype=key_type), [len(part) for part in parts]
+        ) * stride + np.concatenate(parts)
+        keys.sort()
+        keys = keys[min_hits - 1:][keys[min_hits - 1:] == keys[:len(keys) - min_hits + 1]]
+        if not len(keys):
+            return results
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        pair_queries, candidates = np.divmod(keys, stride)
+        
+        # Jaccard >= threshold also bounds the candidate's trigram count
+        sizes = np.array([len(query) for query in queries], dtype=float)[pair_queries]
+        counts = gram_counts[candidates]
+        keep = (counts >= threshold * sizes) & (counts <= sizes / threshold)
+        pair_queries, candidates = pair_queries[keep], candidates[keep]
+        sizes, counts = sizes[keep], counts[keep]
+        
+        # Exact overlap: one binary search per trigram over every pair whose
+        # query contains it (postings are sorted)
+        bounds = np.searchsorted(pair_queries, np.arange(len(queries) + 1))
+        pairs_by_gram: Dict[str, List[np.ndarray]] = {}
+        for position in np.flatnonzero(np.diff(bounds)).tolist():
+            pairs = np.arange(bounds[position], bounds[position + 1])
+            for gram in queries[position]:
+                if gram in postings:
+                    pairs_by_gram.setdefault(gram, []).append(pairs)
+        overlap = np.zeros(len(candidates), dtype=np.uint32)
+        for gram, gram_pairs in pairs_by_gram.items():
+            pairs = np.concatenate(gram_pairs)
+            gram_postings = postings[gram]
+            positions = np.minimum(
+                np.searchsorted(gram_postings, candidates[pairs]), len(gram_postings) - 1
+            )
+            overlap[pairs] += gram_postings[positions] == candidates[pairs]
+        similarity = overlap / (sizes + counts - overlap)
+        
+        for position, entity_id, score in zip(
+            pair_queries.tolist(), candidates.tolist(), similarity.tolist()
+        ):
+            if entity_id in self._removed:
+                continue
+            if self._normalized[entity_id] == normalized[position]:
+                score = 1.0
+            if score >= threshold:
+                results[position].append({
+                    "name": self._names[entity_id],
+                    "normalized": self._normalized[entity_id],
+                    "similarity": round(score, 4)
+                })
+        
+        for matches in results:
+            matches.sort(key=lambda match: (-match["similarity"], match["name"]))
+            del matches[limit:]
+        return results
+    
+    def check_name(self, name: str, threshold: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Check whether a proposed name is distinguishable from registered names.
+        
+        Args:
+            name: Proposed name
+            threshold: Minimum similarity treated as a conflict
+            
+        Returns:
+            Dictionary with distinguishable, exact_match and similar names
+        """
+        matches = self.find_similar(name, threshold)
+        exact = [match for match in matches if match["similarity"] == 1.0]
+        return {
+            "distinguishable": not matches,
+            "exact_match": exact[0]["name"] if exact else None,
+            "similar_names": matches
+        }
+
+def iter_names_from_csv(
+    path: str,
+    name_column: str = "name",
+    state_column: Optional[str] = None
+) -> Iterator[Dict[str, str]]:
+    """
+    Stream entity names from a CSV registry dump.
+    
+    Args:
+        path: Path of the CSV file
+        name_column: Column holding the entity name
+        state_column: Column holding the state code, if the dump covers several states
+        
+    Returns:
+        Iterator of {"name", "state"} dictionaries
+    """
+    with open(path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            name = row.get(name_column)
+            if name:
+                yield {"name": name, "state": row.get(state_column) if state_column else None}
+
+def iter_names_from_parquet(
+    path: str,
+    name_column: str = "name",
+    state_column: Optional[str] = None,
+    batch_size: int = 100000
+) -> Iterator[Dict[str, str]]:
+    """
+    Stream entity names from a Parquet registry dump in record batches.
+    
+    Requires pyarrow.
+    
+    Args:
+        path: Path of the Parquet file
+        name_column: Column holding the entity name
+        state_column: Column holding the state code, if the dump covers several states
+        batch_size: Rows read per batch
+        
+    Returns:
+        Iterator of {"name", "state"} dictionaries
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow is required to load Parquet registry dumps")
+    
+    columns = [name_column] + ([state_column] if state_column else [])
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+        data = batch.to_pydict()
+        states = data[state_column] if state_column else [None] * len(data[name_column])
+        for name, state in zip(data[name_column], states):
+            if name:
+                yield {"name": name, "state": state}
+
+class NameRegistry:
+    """Per-state name indexes loaded from local registry dumps."""
+    
+    def __init__(self, threshold: float = 0.8):
+        """
+        Initialize an empty registry.
+        
+        Args:
+            threshold: Default similarity at which names conflict
+        """
+        self.threshold = threshold
+        self._indexes: Dict[str, NameIndex] = {}
+    
+    def has_state(self, state_code: str) -> bool:
+        """Check whether any names are loaded for a state."""
+        return state_code.upper() in self._indexes
+    
+    def get_index(self, state_code: str) -> NameIndex:
+        """Get (creating if needed) the index of a state."""
+        state_code = state_code.upper()
+        if state_code not in self._indexes:
+            self._indexes[state_code] = NameIndex(self.threshold)
+        return self._indexes[state_code]
+    
+    def load(
+        self,
+        path: str,
+        state_code: Optional[str] = None,
+        name_column: str = "name",
+        state_column: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Load (or incrementally update from) a CSV or Parquet registry dump.
+        
+        Names already indexed are skipped, so loading a newer dump only adds
+        the new registrations.
+        
+        Args:
+            path: Path of a .csv or .parquet file
+            state_code: State of every row, when the dump covers one state
+            name_column: Column holding the entity name
+            state_column: Column holding the state code
+            
+        Returns:
+            Number of names added per state
+        """
+        if state_code is None and state_column is None:
+            raise ValueError("Either state_code or state_column is required")
+        
+        if path.lower().endswith(".parquet"):
+            reader = iter_names_from_parquet
+        else:
+            reader = iter_names_from_csv
+        added: Counter = Counter()
+        for row in reader(path, name_column, state_column):
+            row_state = (state_code or row["state"] or "").upper()
+            if row_state and self.get_index(row_state).add(row["name"]):
+                added[row_state] += 1
+        return dict(added)
+    
+    def check_name(self, state_code: str, name: str) -> Dict[str, Any]:
+        """
+        Check a proposed name against the registered names of a state.
+        
+        Args:
+            state_code: Two-letter state code
+            name: Proposed name
+            
+        Returns:
+            Result of NameIndex.check_name()
+        """
+        return self.get_index(state_code).check_name(name)
+
+_registry: Optional[NameRegistry] = None
+
+def get_name_registry() -> NameRegistry:
+    """Get the process-wide name registry."""
+    global _registry
+    if _registry is None:
+        _registry = NameRegistry()
+    return _registry
@@ -0,0 +1,207 @@
+"""
+Compiled per-state LLC name rules and batch name validation.
+"""
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple, Union
+
+from core.state_requirements import STATE_REQUIREMENTS
+from states.state_data import (
+    COMMON_PROHIBITED_TERMS,
+    COMMON_RESTRICTED_TERMS,
+    COMMON_REQUIRED_TERMS
+)
+from states.state_table import STATE_NAMES
+
+def compile_terms(terms: Iterable[str]) -> Optional[Pattern]:
+    """
+    Compile terms into one case-insensitive, word-boundary-aware pattern.
+    
+    Boundaries are lookarounds rather than \\b so terms ending in
+    punctuation ("L.L.C.", "Corp.") still match, while "Trust" does not
+    match inside "Trusty".
+    
+    Args:
+        terms: Terms to match
+        
+    Returns:
+        Compiled pattern, or None if there are no terms
+    """
+    terms = sorted({term.strip() for term in terms if term.strip()}, key=len, reverse=True)
+    if not terms:
+        return None
+    alternation = "|".join(re.escape(term).replace(r"\ ", r"\s+") for term in terms)
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+class NameRules:
+    """Name rules of one state, compiled once."""
+    
+    def __init__(
+        self,
+        required_terms: Iterable[str],
+        prohibited_terms: Iterable[str],
+        restricted_terms: Dict[str, str]
+    ):
+        """
+        Compile the rules.
+        
+        Args:
+            required_terms: Terms of which a name must contain at least one
+            prohibited_terms: Terms a name must not contain
+            restricted_terms: Terms needing approval, mapped to the approving board
+        """
+        self.required_terms = tuple(required_terms)
+        self.prohibited_terms = tuple(prohibited_terms)
+        self.restricted_terms = dict(restricted_terms)
+        
+        # Prohibited wins over restricted for terms listed in both
+        self._classes: Dict[str, Tuple[str, Optional[str]]] = {
+            term.lower(): ("restricted_term", board)
+            for term, board in self.restricted_terms.items()
+        }
+        self._classes.update({
+            term.lower(): ("prohibited_term", None) for term in self.prohibited_terms
+        })
+        self._required = compile_terms(self.required_terms)
+        self._flagged = compile_terms(self._classes)
+    
+    def check(self, name: str) -> Dict[str, Any]:
+        """
+        Check a name against the rules in one pass.
+        
+        Args:
+            name: Proposed LLC name
+            
+        Returns:
+            Dictionary with `valid` and every violation found. Restricted
+            terms are reported but do not make the name invalid.
+        """
+        violations = []
+        
+        if self._required is not None and not self._required.search(name):
+            violations.append({
+                "type": "missing_required_term",
+                "message": f"Name must contain one of: {', '.join(self.required_terms)}"
+            })
+        
+        seen = set()
+        if self._flagged is not None:
+            for match in self._flagged.finditer(name):
+                key = re.sub(r"\s+", " ", match.group().lower())
+                if key in seen:
+                    continue
+                seen.add(key)
+                violation_type, board = self._classes[key]
+                if violation_type == "prohibited_term":
+                    violations.append({
+                        "type": violation_type,
+                        "term": match.group(),
+                        "message": f"Name contains prohibited term: {match.group()}"
+                    })
+                else:
+                    violations.append({
+                        "type": violation_type,
+                        "term": match.group(),
+                        "board": board,
+                        "message": f"Name term '{match.group()}' requires approval from {board}"
+                    })
+        
+        return {
+            "valid": not any(v["type"] != "restricted_term" for v in violations),
+            "violations": violations
+        }
+    
+    def strip_prohibited(self, name: str) -> str:
+        """
+        Remove prohibited terms from a name.
+        
+        Args:
+            name: Proposed LLC name
+            
+        Returns:
+            Name without prohibited terms, whitespace collapsed
+        """
+        if self._flagged is None:
+            return name.strip()
+        
+        def replace(match):
+            key = re.sub(r"\s+", " ", match.group().lower())
+            return " " if self._classes[key][0] == "prohibited_term" else match.group()
+        
+        return " ".join(self._flagged.sub(replace, name).split())
+
+_rules: Dict[str, NameRules] = {}
+_rules_by_terms: Dict[Tuple[Any, ...], NameRules] = {}
+_rules_lock = threading.Lock()
+
+def get_name_rules(state_code: str) -> NameRules:
+    """
+    Get the compiled name rules of a state.
+    
+    States whose term lists are identical share one compiled instance.
+    
+    Args:
+        state_code: Two-letter state code
+        
+    Returns:
+        Compiled name rules
+        
+    Raises:
+        KeyError: If state code is invalid
+    """
+    state_code = state_code.upper()
+    rules = _rules.get(state_code)
+    if rules is not None:
+        return rules
+    
+    if state_code not in STATE_NAMES:
+        raise KeyError(f"Invalid state code: {state_code}")
+    
+    name_requirements = (
+        STATE_REQUIREMENTS.get(state_code, {})
+        .get("formation_requirements", {})
+        .get("name_requirements", {})
+    )
+    required = tuple(name_requirements.get("required_terms", COMMON_REQUIRED_TERMS))
+    prohibited = tuple(name_requirements.get("prohibited_terms", COMMON_PROHIBITED_TERMS))
+    restricted = tuple(sorted(COMMON_RESTRICTED_TERMS.items()))
+    
+    with _rules_lock:
+        signature = (required, prohibited, restricted)
+        if signature not in _rules_by_terms:
+            _rules_by_terms[signature] = NameRules(required, prohibited, dict(restricted))
+        _rules[state_code] = _rules_by_terms[signature]
+        return _rules[state_code]
+
+def validate_names(
+    names: Iterable[str],
+    state_codes: Union[str, Iterable[str]]
+) -> List[Dict[str, Any]]:
+    """
+    Validate many candidate names against one or more states.
+    
+    Each name is checked once per distinct rule set, however many states
+    share it.
+    
+    Args:
+        names: Proposed LLC names
+        state_codes: State code or codes to validate against
+        
+    Returns:
+        One result per (name, state) pair, in input order, each with
+        name, state_code, valid and violations
+    """
+    if isinstance(state_codes, str):
+        state_codes = [state_codes]
+    rules = [(state_code, get_name_rules(state_code)) for state_code in state_codes]
+    
+    results = []
+    for name in names:
+        checked: Dict[int, Dict[str, Any]] = {}
+        for state_code, state_rules in rules:
+            key = id(state_rules)
+            if key not in checked:
+                checked[key] = state_rules.check(name)
+            results.append({"name": name, "state_code": state_code, **checked[key]})
+    return results
@@ -0,0 +1,225 @@
+"""
+Generator of ranked, pre-validated alternative LLC names.
+"""
+
+import itertools
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from core.config import Config
+from core.name_index import get_name_registry, normalize_name
+from core.name_rules import get_name_rules, validate_names
+from states.state_table import STATE_NAMES
+
+AFFIXES = [
+    "Group",
+    "Partners",
+    "Holdings",
+    "Ventures",
+    "Collective",
+    "Works",
+    "Guild",
+    "Enterprises",
+    "Associates",
+    "Alliance",
+    "Studio",
+    "Foundry",
+    "Network",
+    "Exchange",
+    "Resources",
+    "Concepts"
+]
+
+INDUSTRY_WORDS = {
+    "technology": ["Technologies", "Digital", "Systems", "Labs", "Software"],
+    "consulting": ["Advisors", "Consulting", "Strategies", "Solutions"],
+    "retail": ["Goods", "Market", "Supply", "Trading"],
+    "healthcare": ["Health", "Wellness", "Care"],
+    "construction": ["Builders", "Construction", "Contracting"],
+    "real estate": ["Properties", "Realty", "Estates"],
+    "food": ["Kitchen", "Provisions", "Foods"],
+    "finance": ["Capital", "Financial", "Advisory"],
+    "manufacturing": ["Manufacturing", "Industries", "Fabrication"],
+    "default": ["Services", "Solutions", "Enterprises"]
+}
+
+GEOGRAPHIC_MODIFIERS = [
+    "North",
+    "South",
+    "East",
+    "West",
+    "Summit",
+    "Metro",
+    "Coastal",
+    "Capital",
+    "Valley",
+    "Heartland",
+    "Frontier",
+    "Pioneer"
+]
+
+_DESIGNATOR_SUFFIX = re.compile(
+    r"[\s,]*\b(?:limited liability company|ltd\.? liability co(?:mpany|\.)?|l\.?l\.?c\.?|"
+    r"inc\.?|incorporated|corp\.?|corporation|co\.?)\s*$",
+    re.IGNORECASE
+)
+
+def strip_designator(name: str) -> str:
+    """
+    Remove trailing entity designators ("LLC", "Inc.", ...) from a name.
+    
+    Args:
+        name: Business name
+        
+    Returns:
+        Name without trailing designators
+    """
+    previous = None
+    name = name.strip()
+    while previous != name:
+        previous = name
+        name = _DESIGNATOR_SUFFIX.sub("", name).strip()
+    return name
+
+def industry_words(industry: Optional[str]) -> List[str]:
+    """
+    Get the name words associated with an industry.
+    
+    Args:
+        industry: Industry description
+        
+    Returns:
+        Industry words, or generic business words for unknown industries
+    """
+    industry = (industry or "").lower()
+    for key, words in INDUSTRY_WORDS.items():
+        if key != "default" and key in industry:
+            return words
+    return INDUSTRY_WORDS["default"]
+
+def generate_candidates(base_name: str, industry: Optional[str], state_code: str) -> Iterator[str]:
+    """
+    Lazily generate candidate names, most natural forms first.
+    
+    Args:
+        base_name: Name the user wanted
+        industry: Industry of the business
+        state_code: Two-letter state code
+        
+    Returns:
+        Iterator of candidate names without designators
+    """
+    base = strip_designator(base_name)
+    words = industry_words(industry)
+    geo = [STATE_NAMES.get(state_code, "")] + GEOGRAPHIC_MODIFIERS
+    geo = [modifier for modifier in geo if modifier]
+    
+    patterns = [
+        (f"{base} {word}" for word in words),
+        (f"{base} {affix}" for affix in AFFIXES),
+        (f"{modifier} {base}" for modifier in geo),
+        (f"{base} {word} {affix}" for word, affix in itertools.product(words, AFFIXES)),
+        (f"{modifier} {base} {word}" for modifier, word in itertools.product(geo, words)),
+        (f"{modifier} {base} {affix}" for modifier, affix in itertools.product(geo, AFFIXES)),
+        (
+            f"{modifier} {base} {word} {affix}"
+            for modifier, word, affix in itertools.product(geo, words, AFFIXES)
+        )
+    ]
+    for pattern in patterns:
+        for candidate in pattern:
+            if normalize_name(candidate) != normalize_name(base):
+                yield candidate
+
+def _score(candidate: str, base: str, words: Set[str]) -> float:
+    """Rank short names first, preferring names that mention the industry."""
+    tokens = candidate.split()
+    extra_words = len(tokens) - len(base.split()) - 1
+    relevant = any(token.lower() in words for token in tokens)
+    return round(1.0 - 0.1 * extra_words + (0.05 if relevant else 0.0), 4)
+
+def suggest_names(
+    base_name: str,
+    state_code: str,
+    industry: Optional[str] = None,
+    count: Optional[int] = None,
+    budget_ms: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Suggest available alternatives to a rejected LLC name.
+    
+    Candidates are validated in batches through the compiled name rules and,
+    when a registry dump is loaded for the state, the distinguishability
+    index, until enough are found or the latency budget is spent.
+    
+    Args:
+        base_name: Name the user wanted
+        state_code: Two-letter state code
+        industry: Industry of the business
+        count: Number of suggestions to return
+        budget_ms: Latency budget in milliseconds
+        
+    Returns:
+        Dictionary with ranked suggestions and search statistics
+    """
+    settings = Config.NAME_SUGGESTIONS
+    count = count or settings["count"]
+    budget_ms = budget_ms if budget_ms is not None else settings["budget_ms"]
+    deadline = time.perf_counter() + budget_ms / 1000.0
+    
+    rules = get_name_rules(state_code)
+    required_terms = rules.required_terms
+    designator = required_terms[0] if required_terms and "LLC" not in required_terms else "LLC"
+    registry = get_name_registry()
+    index = registry.get_index(state_code) if registry.has_state(state_code) else None
+    base = rules.strip_prohibited(strip_designator(base_name))
+    
+    words = {word.lower() for word in industry_words(industry)}
+    # Nothing left to build on once prohibited terms are removed
+    candidates = generate_candidates(base, industry, state_code) if base else iter(())
+    seen: Set[str] = set()
+    accepted: List[Dict[str, Any]] = []
+    evaluated = 0
+    budget_exhausted = False
+    
+    while len(accepted) < settings["max_pool"] and not budget_exhausted:
+        if time.perf_counter() >= deadline:
+            budget_exhausted = True
+            break
+        
+        batch = []
+        for candidate in itertools.islice(candidates, settings["batch_size"]):
+            key = normalize_name(candidate)
+            if key not in seen:
+                seen.add(key)
+                batch.append(f"{candidate} {designator}")
+        if not batch:
+            break
+        evaluated += len(batch)
+        
+        results = [result for result in validate_names(batch, state_code) if result["valid"]]
+        if index is not None and results:
+            if time.perf_counter() >= deadline:
+                budget_exhausted = True
+                break
+            conflicts = index.find_similar_many([result["name"] for result in results], limit=1)
+            results = [result for result, similar in zip(results, conflicts) if not similar]
+        
+        for result in results:
+            accepted.append({
+                "name": result["name"],
+                "score": _score(result["name"], base, words),
+                "approvals_required": [
+                    {"term": v["term"], "board": v["board"]} for v in result["violations"]
+                ]
+            })
+    
+    accepted.sort(key=lambda suggestion: (-suggestion["score"], suggestion["name"]))
+    return {
+        "base_name": base_name,
+        "state_code": state_code,
+        "suggestions": accepted[:count],
+        "evaluated": evaluated,
+        "budget_exhausted": budget_exhausted
+    }
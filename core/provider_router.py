@@ -0,0 +1,351 @@
+"""
+Provider routing with hedged requests, circuit breakers and latency tracking.
+"""
+
+import asyncio
+import itertools
+import math
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from core.config import Config
+from core.rate_limiter import Priority, RateLimitGovernor, get_governor
+
+class ProviderUnavailableError(Exception):
+    """Raised when no provider could serve a request."""
+    
+    def __init__(self, message: str, errors: Optional[Dict[str, Exception]] = None):
+        super().__init__(message)
+        self.errors = errors or {}
+
+class LatencyTracker:
+    """Rolling window of observed call latencies per provider."""
+    
+    def __init__(self, window: int = 200):
+        """
+        Initialize the tracker.
+        
+        Args:
+            window: Number of most recent samples kept per provider
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+    
+    def record(self, provider: str, seconds: float) -> None:
+        """Record the latency of a successful call."""
+        self._samples.setdefault(provider, deque(maxlen=self.window)).append(seconds)
+    
+    def count(self, provider: str) -> int:
+        """Get the number of samples held for a provider."""
+        return len(self._samples.get(provider, ()))
+    
+    def percentile(self, provider: str, percentile: float) -> Optional[float]:
+        """
+        Get a latency percentile for a provider.
+        
+        Args:
+            provider: Provider name
+            percentile: Percentile between 0 and 100
+            
+        Returns:
+            Latency in seconds, or None if no samples exist
+        """
+        samples = self._samples.get(provider)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(percentile / 100.0 * len(ordered)) - 1))
+        return ordered[index]
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """Stops routing to a provider whose recent error rate spikes."""
+    
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        error_rate_threshold: float = 0.5,
+        cooldown_seconds: float = 30
+    ):
+        """
+        Initialize the breaker.
+        
+        Args:
+            window: Number of most recent call outcomes considered
+            min_calls: Minimum outcomes before the breaker may open
+            error_rate_threshold: Error rate at which the breaker opens
+            cooldown_seconds: Time an open breaker waits before a trial call
+        """
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CircuitState.CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+    
+    def error_rate(self) -> float:
+        """Get the error rate over the outcome window."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+    
+    def is_available(self) -> bool:
+        """Check whether a call could be routed without changing state."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            return time.monotonic() - self._opened_at >= self.cooldown_seconds
+        return not self._probe_in_flight
+    
+    def allow_request(self) -> bool:
+        """Check whether a call may be routed, admitting one trial call after cooldown."""
+        if not self.is_available():
+            return False
+        if self.state != CircuitState.CLOSED:
+            self.state = CircuitState.HALF_OPEN
+            self._probe_in_flight = True
+        return True
+    
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.state == CircuitState.HALF_OPEN:
+            self.state = CircuitState.CLOSED
+            self._outcomes.clear()
+            self._probe_in_flight = False
+        self._outcomes.append(True)
+    
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if the error rate is too high."""
+        if self.state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append(False)
+        if len(self._outcomes) >= self.min_calls and self.error_rate() >= self.error_rate_threshold:
+            self._open()
+    
+    def record_abandoned(self) -> None:
+        """Record a call cancelled before completion (e.g. a losing hedge)."""
+        self._probe_in_flight = False
+    
+    def _open(self) -> None:
+        """Open the breaker."""
+        self.state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+class ProviderRouter:
+    """
+    Routes a request across an ordered list of providers.
+    
+    The first provider is tried first. If it fails the next is tried at once,
+    and if hedging is enabled and it has not answered within the configured
+    percentile of its observed latency, a duplicate is sent to the next
+    provider and whichever answers first wins.
+    """
+    
+    def __init__(
+        self,
+        governor: Optional[RateLimitGovernor] = None,
+        hedging: Optional[Dict[str, Any]] = None,
+        breaker_settings: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the router.
+        
+        Args:
+            governor: Optional rate limit governor each attempt is admitted through
+            hedging: Hedging settings shaped like Config.HEDGING
+            breaker_settings: Circuit breaker settings shaped like Config.CIRCUIT_BREAKER
+        """
+        self.governor = governor
+        self.hedging = {**Config.HEDGING, **(hedging or {})}
+        self.breaker_settings = {**Config.CIRCUIT_BREAKER, **(breaker_settings or {})}
+        self.latency = LatencyTracker(self.hedging["latency_window"])
+        self._breakers: Dict[str, CircuitBreaker] = {}
+    
+    def get_breaker(self, provider: str) -> CircuitBreaker:
+        """Get (creating on first use) the circuit breaker for a provider."""
+        if provider not in self._breakers:
+            self._breakers[provider] = CircuitBreaker(**self.breaker_settings)
+        return self._breakers[provider]
+    
+    def available_providers(self, providers: List[str]) -> List[str]:
+        """Filter out providers whose circuit breaker is open."""
+        return [p for p in providers if self.get_breaker(p).is_available()]
+    
+    def hedge_delay(self, provider: str) -> float:
+        """
+        Get how long to wait on a provider before hedging to the next one.
+        
+        Uses the configured latency percentile once enough samples exist,
+        otherwise the configured default delay.
+        """
+        if self.latency.count(provider) < self.hedging["min_samples"]:
+            return self.hedging["default_delay_seconds"]
+        return self.latency.percentile(provider, self.hedging["percentile"])
+    
+    async def call(
+        self,
+        request: Callable[[str], Awaitable[Any]],
+        providers: List[str],
+        hedge: Optional[bool] = None,
+        tokens: int = 0,
+        priority: Priority = Priority.STANDARD,
+        models: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        Send a request to the first provider able to answer it.
+        
+        The hedge delay of an attempt starts once the governor admits it, so
+        time spent queued for rate limits never triggers a hedge.
+        
+        Args:
+            request: Coroutine function called with the provider name
+            providers: Providers in preference order
+            hedge: Override for Config.HEDGING["enabled"]
+            tokens: Estimated tokens, passed to the governor
+            priority: Scheduling priority, passed to the governor
+            models: Model used with each provider, so per-model rate limits apply
+            
+        Returns:
+            The first successful result
+            
+        Raises:
+            ProviderUnavailableError: If every provider failed or is unavailable
+        """
+        hedge = self.hedging["enabled"] if hedge is None else hedge
+        models = models or {}
+        candidates = iter(providers)
+        pending: Dict[asyncio.Task, str] = {}
+        errors: Dict[str, Exception] = {}
+        hedge_deadline: Optional[float] = None
+        # Set when the most recent attempt has not been admitted yet
+        awaiting_admission = False
+        admitted = asyncio.Event()
+        attempts = itertools.count()
+        latest = -1
+        
+        def start_next() -> bool:
+            nonlocal hedge_deadline, awaiting_admission, latest
+            hedge_deadline = None
+            awaiting_admission = False
+            for provider in candidates:
+                if self.get_breaker(provider).allow_request():
+                    attempt = latest = next(attempts)
+                    
+                    def on_admitted(provider: str = provider, attempt: int = attempt) -> None:
+                        nonlocal hedge_deadline, awaiting_admission
+                        if attempt == latest:
+                            hedge_deadline = time.monotonic() + self.hedge_delay(provider)
+                            awaiting_admission = False
+                            admitted.set()
+                    
+                    admitted.clear()
+                    awaiting_admission = True
+                    task = asyncio.ensure_future(self._attempt(
+                        provider,
+                        models.get(provider, "default"),
+                        request,
+                        tokens,
+                        priority,
+                        on_admitted
+                    ))
+                    pending[task] = provider
+                    return True
+            return False
+        
+        try:
+            start_next()
+            while pending:
+                timeout = None
+                waiters = set(pending)
+                admission = None
+                if hedge and hedge_deadline is not None:
+                    timeout = max(0.0, hedge_deadline - time.monotonic())
+                elif hedge and awaiting_admission:
+                    admission = asyncio.ensure_future(admitted.wait())
+                    waiters.add(admission)
+                done, _ = await asyncio.wait(
+                    waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if admission is not None:
+                    admission.cancel()
+                    done.discard(admission)
+                
+                if not done:
+                    if hedge_deadline is not None and time.monotonic() >= hedge_deadline:
+                        # Primary is slower than its hedge threshold
+                        start_next()
+                    continue
+                
+                for task in done:
+                    provider = pending.pop(task)
+                    if task.exception() is None:
+                        return task.result()
+                    errors[provider] = task.exception()
+                
+                if not pending:
+                    start_next()
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        raise ProviderUnavailableError(
+            f"No provider could serve the request (tried: {', '.join(errors) or 'none'})",
+            errors
+        )
+    
+    async def _attempt(
+        self,
+        provider: str,
+        model: str,
+        request: Callable[[str], Awaitable[Any]],
+        tokens: int,
+        priority: Priority,
+        on_admitted: Callable[[], None]
+    ) -> Any:
+        """Run one attempt against a provider, recording latency and outcome."""
+        breaker = self.get_breaker(provider)
+        try:
+            if self.governor is None:
+                on_admitted()
+                return await self._timed(provider, request)
+            async with self.governor.limit(provider, model, tokens=tokens, priority=priority):
+                on_admitted()
+                return await self._timed(provider, request)
+        except asyncio.CancelledError:
+            breaker.record_abandoned()
+            raise
+        except Exception as e:
+            breaker.record_failure()
+            if self.governor is not None and getattr(e, "status_code", None) == 429:
+                self.governor.report_rate_limited(
+                    provider, model, retry_after=getattr(e, "retry_after", None)
+                )
+            raise
+    
+    async def _timed(self, provider: str, request: Callable[[str], Awaitable[Any]]) -> Any:
+        """Call the provider and record the latency of a successful answer."""
+        start = time.monotonic()
+        result = await request(provider)
+        self.latency.record(provider, time.monotonic() - start)
+        self.get_breaker(provider).record_success()
+        return result
+
+_router: Optional[ProviderRouter] = None
+
+def get_router() -> ProviderRouter:
+    """Get the process-wide provider router."""
+    global _router
+    if _router is None:
+        _router = ProviderRouter(governor=get_governor())
+    return _router
@@ -0,0 +1,404 @@
+"""
+Central rate limiting and concurrency governance for LLM provider calls.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from core.config import Config
+
+class Priority(IntEnum):
+    """Scheduling priority for provider calls (lower values are served first)."""
+    INTERACTIVE = 0
+    STANDARD = 1
+    BATCH = 2
+
+class BackpressureLevel(IntEnum):
+    """Load level reported to callers that can shed or defer work."""
+    NORMAL = 0
+    ELEVATED = 1
+    SATURATED = 2
+
+class TokenBucket:
+    """Continuously refilling token bucket."""
+    
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            refill_per_second: Tokens added back per second
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+    
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+            self._updated = now
+    
+    def time_until_available(self, amount: float, now: float) -> float:
+        """
+        Get the number of seconds until `amount` tokens can be consumed.
+        
+        Requests larger than the bucket are clamped to its capacity so they can
+        still be served once the bucket is full.
+        """
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        if self.refill_per_second <= 0:
+            return math.inf
+        return (amount - self.tokens) / self.refill_per_second
+    
+    def consume(self, amount: float, now: float) -> None:
+        """Consume tokens, clamping oversized requests to the bucket capacity."""
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+    
+    def adjust(self, delta: float) -> None:
+        """Charge (positive) or refund (negative) tokens after the fact."""
+        self.tokens = min(self.capacity, self.tokens - delta)
+    
+    def drain(self, now: float) -> None:
+        """Empty the bucket so no further work is admitted until it refills."""
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+@dataclass
+class Lease:
+    """Admission granted by the governor for a single provider call."""
+    provider: str
+    model: str
+    reserved_tokens: int
+    used_tokens: Optional[int] = None
+    
+    def record_usage(self, tokens: int) -> None:
+        """Record the actual token usage reported by the provider."""
+        self.used_tokens = tokens
+
+class ProviderLimiter:
+    """Token buckets, concurrency cap and wait queue for one provider/model pair."""
+    
+    def __init__(self, provider: str, model: str, limits: Dict[str, Any]):
+        """
+        Initialize the limiter.
+        
+        Args:
+            provider: Provider name (key of Config.API_KEYS)
+            model: Model name
+            limits: Rate limit settings from Config.get_rate_limits
+        """
+        self.provider = provider
+        self.model = model
+        requests_per_minute = limits["requests_per_minute"]
+        tokens_per_minute = limits.get("tokens_per_minute")
+        self.request_bucket = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+            if tokens_per_minute else None
+        )
+        self.max_concurrency = limits.get("max_concurrency", 4)
+        self.queue_high_water = limits.get("queue_high_water", 20)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.level = BackpressureLevel.NORMAL
+        self.queue: List[Tuple[int, int, int, asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.stats = {
+            "admitted": 0,
+            "rate_limited": 0,
+            "max_queue_depth": 0
+        }
+    
+    def time_until_admission(self, tokens: int, now: float) -> float:
+        """Get seconds until a request of `tokens` fits all buckets."""
+        wait = max(
+            self.paused_until - now,
+            self.request_bucket.time_until_available(1, now)
+        )
+        if self.token_bucket is not None and tokens:
+            wait = max(wait, self.token_bucket.time_until_available(tokens, now))
+        return wait
+    
+    def admit(self, tokens: int, now: float) -> None:
+        """Consume budget for an admitted request."""
+        self.request_bucket.consume(1, now)
+        if self.token_bucket is not None and tokens:
+            self.token_bucket.consume(tokens, now)
+        self.in_flight += 1
+        self.stats["admitted"] += 1
+    
+    def compute_level(self, now: float) -> BackpressureLevel:
+        """Derive the current backpressure level from queue depth and pauses."""
+        if self.paused_until > now or len(self.queue) >= self.queue_high_water:
+            return BackpressureLevel.SATURATED
+        if self.queue:
+            return BackpressureLevel.ELEVATED
+        return BackpressureLevel.NORMAL
+
+BackpressureListener = Callable[[str, str, BackpressureLevel], None]
+
+class RateLimitGovernor:
+    """
+    Admits provider calls so that every provider/model pair stays at its
+    request and token ceilings, serving interactive work ahead of batch work.
+    """
+    
+    def __init__(self, limits: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Initialize the governor.
+        
+        Args:
+            limits: Optional rate limit table shaped like Config.RATE_LIMITS
+        """
+        self._limits = limits
+        self._limiters: Dict[Tuple[str, str], ProviderLimiter] = {}
+        self._listeners: List[Callable[[], Optional[BackpressureListener]]] = []
+        self._sequence = itertools.count()
+    
+    def _get_limits(self, provider: str, model: str) -> Dict[str, Any]:
+        """Resolve limits for a provider/model pair."""
+        if self._limits is None:
+            return Config.get_rate_limits(provider, model)
+        provider_limits = self._limits.get(provider, {})
+        limits = {
+            **self._limits.get("default", Config.RATE_LIMITS["default"]),
+            **{k: v for k, v in provider_limits.items() if k != "models"}
+        }
+        limits.update(provider_limits.get("models", {}).get(model, {}))
+        return limits
+    
+    def get_limiter(self, provider: str, model: str = "default") -> ProviderLimiter:
+        """Get (creating on first use) the limiter for a provider/model pair."""
+        key = (provider, model)
+        if key not in self._limiters:
+            self._limiters[key] = ProviderLimiter(
+                provider, model, self._get_limits(provider, model)
+            )
+        return self._limiters[key]
+    
+    async def acquire(
+        self,
+        provider: str,
+        model: str = "default",
+        tokens: int = 0,
+        priority: Priority = Priority.STANDARD
+    ) -> Lease:
+        """
+        Wait until a call may be sent to the provider.
+        
+        Args:
+            provider: Provider name
+            model: Model name
+            tokens: Estimated prompt plus completion tokens
+            priority: Scheduling priority
+            
+        Returns:
+            Lease that must be passed to release() when the call finishes
+        """
+        limiter = self.get_limiter(provider, model)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(limiter.queue, (int(priority), next(self._sequence), tokens, future))
+        limiter.stats["max_queue_depth"] = max(limiter.stats["max_queue_depth"], len(limiter.queue))
+        self._dispatch(limiter)
+        
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just before cancellation: give the slot back
+                self._finish(limiter, tokens, None)
+            raise
+        
+        return Lease(provider=provider, model=model, reserved_tokens=tokens)
+    
+    def release(self, lease: Lease) -> None:
+        """
+        Return a lease once the provider call has completed.
+        
+        Args:
+            lease: Lease returned by acquire()
+        """
+        limiter = self.get_limiter(lease.provider, lease.model)
+        self._finish(limiter, lease.reserved_tokens, lease.used_tokens)
+    
+    @asynccontextmanager
+    async def limit(
+        self,
+        provider: str,
+        model: str = "default",
+        tokens: int = 0,
+        priority: Priority = Priority.STANDARD
+    ) -> AsyncIterator[Lease]:
+        """Context manager wrapping acquire() and release()."""
+        lease = await self.acquire(provider, model, tokens, priority)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+    
+    def report_rate_limited(
+        self,
+        provider: str,
+        model: str = "default",
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Record a 429 from the provider.
+        
+        Drains the buckets and pauses admission for the provider's retry window,
+        so queued calls wait once instead of retrying in a storm.
+        
+        Args:
+            provider: Provider name
+            model: Model name
+            retry_after: Seconds requested by the provider, if supplied
+        """
+        limiter = self.get_limiter(provider, model)
+        now = time.monotonic()
+        limiter.stats["rate_limited"] += 1
+        limiter.request_bucket.drain(now)
+        if limiter.token_bucket is not None:
+            limiter.token_bucket.drain(now)
+        if retry_after is not None:
+            limiter.paused_until = max(limiter.paused_until, now + retry_after)
+        self._dispatch(limiter)
+    
+    def add_backpressure_listener(self, listener: BackpressureListener) -> None:
+        """
+        Register a callback invoked whenever a limiter changes backpressure level.
+        
+        Bound methods are held weakly, so registering does not keep their
+        object alive. The listener is called right away for every limiter
+        that is already under backpressure.
+        
+        Args:
+            listener: Callback taking (provider, model, level)
+        """
+        if hasattr(listener, "__self__"):
+            self._listeners.append(weakref.WeakMethod(listener))
+        else:
+            self._listeners.append(lambda: listener)
+        
+        now = time.monotonic()
+        for limiter in list(self._limiters.values()):
+            level = limiter.compute_level(now)
+            if level != BackpressureLevel.NORMAL:
+                listener(limiter.provider, limiter.model, level)
+    
+    def remove_backpressure_listener(self, listener: BackpressureListener) -> None:
+        """
+        Unregister a callback added with add_backpressure_listener().
+        
+        Args:
+            listener: Callback to remove
+        """
+        self._listeners = [ref for ref in self._listeners if ref() not in (None, listener)]
+    
+    def get_backpressure(self, provider: Optional[str] = None) -> BackpressureLevel:
+        """
+        Get the highest backpressure level across limiters.
+        
+        Args:
+            provider: Optional provider to restrict the check to
+            
+        Returns:
+            Current backpressure level
+        """
+        now = time.monotonic()
+        levels = [
+            limiter.compute_level(now)
+            for (name, _), limiter in self._limiters.items()
+            if provider is None or name == provider
+        ]
+        return max(levels, default=BackpressureLevel.NORMAL)
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get admission statistics per provider/model pair."""
+        return {
+            f"{provider}/{model}": {
+                **limiter.stats,
+                "queued": len(limiter.queue),
+                "in_flight": limiter.in_flight,
+                "level": limiter.level.name
+            }
+            for (provider, model), limiter in self._limiters.items()
+        }
+    
+    def _finish(self, limiter: ProviderLimiter, reserved: int, used: Optional[int]) -> None:
+        """Free a concurrency slot and settle the token estimate."""
+        limiter.in_flight = max(0, limiter.in_flight - 1)
+        if used is not None and limiter.token_bucket is not None:
+            limiter.token_bucket.adjust(used - reserved)
+        self._dispatch(limiter)
+    
+    def _dispatch(self, limiter: ProviderLimiter) -> None:
+        """Admit queued calls in priority order while budget allows."""
+        if limiter.timer is not None:
+            limiter.timer.cancel()
+            limiter.timer = None
+        
+        now = time.monotonic()
+        while limiter.queue:
+            _, _, tokens, future = limiter.queue[0]
+            if future.done():
+                heapq.heappop(limiter.queue)
+                continue
+            if limiter.in_flight >= limiter.max_concurrency:
+                break
+            wait = limiter.time_until_admission(tokens, now)
+            if wait > 0:
+                if math.isfinite(wait):
+                    limiter.timer = asyncio.get_running_loop().call_later(
+                        wait, self._dispatch, limiter
+                    )
+                break
+            heapq.heappop(limiter.queue)
+            limiter.admit(tokens, now)
+            future.set_result(None)
+        
+        if limiter.timer is None and limiter.paused_until > now:
+            # Lift SATURATED when the pause ends, even if nothing is queued
+            try:
+                limiter.timer = asyncio.get_running_loop().call_later(
+                    limiter.paused_until - now, self._dispatch, limiter
+                )
+            except RuntimeError:
+                pass
+        self._update_level(limiter, now)
+    
+    def _update_level(self, limiter: ProviderLimiter, now: float) -> None:
+        """Notify listeners when a limiter crosses a backpressure level."""
+        level = limiter.compute_level(now)
+        if level != limiter.level:
+            limiter.level = level
+            listeners = [ref() for ref in self._listeners]
+            if None in listeners:
+                self._listeners = [ref for ref in self._listeners if ref() is not None]
+            for listener in listeners:
+                if listener is not None:
+                    listener(limiter.provider, limiter.model, level)
+
+_governor: Optional[RateLimitGovernor] = None
+
+def get_governor() -> RateLimitGovernor:
+    """Get the process-wide governor shared by all agents."""
+    global _governor
+    if _governor is None:
+        _governor = RateLimitGovernor()
+    return _governor
@@ -0,0 +1,244 @@
+"""
+Incremental refinement of LLC formation packages that fail validation.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from core.config import Config
+
+@dataclass
+class WorkflowStep:
+    """A single agent step in the formation pipeline."""
+    name: str
+    inputs: Dict[str, str] = field(default_factory=dict)
+    
+    @property
+    def depends_on(self) -> Set[str]:
+        """Names of the steps whose output this step consumes."""
+        return set(self.inputs.values())
+
+StepRunner = Callable[
+    [WorkflowStep, Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]],
+    Awaitable[Dict[str, Any]]
+]
+
+# Formation pipeline in execution order; `inputs` maps the key an agent
+# receives to the upstream step that produces it.
+FORMATION_STEPS: List[WorkflowStep] = [
+    WorkflowStep("legal"),
+    WorkflowStep("hr", {"legal_structure": "legal"}),
+    WorkflowStep("financial", {"legal_structure": "legal", "hr_setup": "hr"}),
+    WorkflowStep("governance", {
+        "legal_structure": "legal",
+        "hr_setup": "hr",
+        "financial_setup": "financial"
+    }),
+    WorkflowStep("pmo", {
+        "legal": "legal",
+        "hr": "hr",
+        "financial": "financial",
+        "governance": "governance"
+    })
+]
+
+# Evaluator issue categories -> step whose output they concern
+ISSUE_CATEGORY_STEPS: Dict[str, str] = {
+    "legal": "legal",
+    "structure": "legal",
+    "state": "legal",
+    "hr": "hr",
+    "employment": "hr",
+    "staffing": "hr",
+    "financial": "financial",
+    "tax": "financial",
+    "cost": "financial",
+    "governance": "governance",
+    "management": "governance",
+    "compliance": "governance",
+    "operational": "pmo",
+    "project": "pmo",
+    "timeline": "pmo"
+}
+
+def build_step_input(
+    step: WorkflowStep,
+    business_details: Dict[str, Any],
+    workflow_state: Dict[str, Any],
+    feedback: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build the input passed to a step's agent.
+    
+    Args:
+        step: Step to build input for
+        business_details: Dictionary containing business information
+        workflow_state: Outputs of the steps completed so far
+        feedback: Evaluator feedback when the step is being re-run
+        
+    Returns:
+        Dictionary passed to the agent's process() method
+    """
+    step_input = {
+        **business_details,
+        **{key: workflow_state[source] for key, source in step.inputs.items()}
+    }
+    if feedback:
+        step_input["refinement_feedback"] = feedback
+    return step_input
+
+def downstream_closure(steps: List[WorkflowStep], invalid: Set[str]) -> List[str]:
+    """
+    Get the invalid steps plus every step that depends on them.
+    
+    Args:
+        steps: Pipeline steps in execution order
+        invalid: Names of steps known to be invalid
+        
+    Returns:
+        Step names to re-run, in execution order
+    """
+    affected = set(invalid)
+    for step in steps:
+        if step.depends_on & affected:
+            affected.add(step.name)
+    return [step.name for step in steps if step.name in affected]
+
+class RefinementEngine:
+    """
+    Re-runs only the parts of a formation package the evaluator rejected.
+    
+    Steps the evaluator flags (or whose output is missing) are invalidated
+    together with their downstream dependents, re-executed with the
+    evaluator's feedback and re-evaluated, up to a bounded number of rounds.
+    """
+    
+    def __init__(
+        self,
+        run_step: StepRunner,
+        evaluate: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+        steps: Optional[List[WorkflowStep]] = None,
+        max_iterations: Optional[int] = None
+    ):
+        """
+        Initialize the refinement engine.
+        
+        Args:
+            run_step: Coroutine running one step given (step, business_details,
+                workflow_state, feedback) and returning its output
+            evaluate: Coroutine evaluating a workflow state
+            steps: Pipeline steps in execution order
+            max_iterations: Maximum number of refinement rounds
+        """
+        self.run_step = run_step
+        self.evaluate = evaluate
+        self.steps = steps or FORMATION_STEPS
+        self.max_iterations = (
+            max_iterations if max_iterations is not None
+            else Config.PROCESSING["max_refinement_iterations"]
+        )
+        self._steps_by_name = {step.name: step for step in self.steps}
+        self._ancestors: Dict[str, Set[str]] = {}
+        for step in self.steps:
+            self._ancestors[step.name] = set(step.depends_on).union(
+                *(self._ancestors.get(name, set()) for name in step.depends_on)
+            )
+    
+    def identify_invalid_steps(
+        self,
+        evaluation_result: Dict[str, Any],
+        workflow_state: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Work out which steps the evaluation result rejects.
+        
+        Steps are flagged by `invalid_steps`, by `issues` entries naming a
+        `step` (or a `category` listed in ISSUE_CATEGORY_STEPS), by keys of a
+        `feedback` mapping, or by a missing output. Only a failure that none
+        of these localize flags every step.
+        
+        Args:
+            evaluation_result: Result returned by the evaluation agent
+            workflow_state: Current step outputs
+            
+        Returns:
+            Mapping of invalid step name to the feedback for that step
+        """
+        invalid: Dict[str, Dict[str, Any]] = {}
+        
+        def flag(step_name: str) -> Dict[str, Any]:
+            return invalid.setdefault(step_name, {"issues": []})
+        
+        for step_name in evaluation_result.get("invalid_steps", []):
+            if step_name in self._steps_by_name:
+                flag(step_name)
+        
+        for issue in evaluation_result.get("issues", []):
+            if not isinstance(issue, dict):
+                continue
+            step_name = issue.get("step")
+            if step_name is None:
+                step_name = ISSUE_CATEGORY_STEPS.get(str(issue.get("category", "")).lower())
+            if step_name in self._steps_by_name:
+                flag(step_name)["issues"].append(issue)
+        
+        for step_name, feedback in evaluation_result.get("feedback", {}).items():
+            if step_name in self._steps_by_name:
+                flag(step_name)["feedback"] = feedback
+        
+        for step in self.steps:
+            if not workflow_state.get(step.name):
+                flag(step.name)["issues"].append({"step": step.name, "issue": "Missing output"})
+        
+        if not invalid:
+            invalid = {step.name: {"issues": []} for step in self.steps}
+        
+        return invalid
+    
+    async def refine(
+        self,
+        business_details: Dict[str, Any],
+        workflow_state: Dict[str, Any],
+        evaluation_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Refine a workflow state until it validates or the budget is spent.
+        
+        Args:
+            business_details: Dictionary containing business information
+            workflow_state: Step outputs; updated in place
+            evaluation_result: Failed evaluation of the current state
+            
+        Returns:
+            Dictionary with the final evaluation, validity and re-run history
+        """
+        history: List[List[str]] = []
+        
+        for iteration in range(1, self.max_iterations + 1):
+            invalid = self.identify_invalid_steps(evaluation_result, workflow_state)
+            rerun = downstream_closure(self.steps, set(invalid))
+            history.append(rerun)
+            
+            for step_name in rerun:
+                feedback = {
+                    "iteration": iteration,
+                    **invalid.get(step_name, {"issues": []}),
+                    "invalidated_by": sorted(self._ancestors[step_name] & set(invalid))
+                }
+                workflow_state[step_name] = await self.run_step(
+                    self._steps_by_name[step_name],
+                    business_details,
+                    workflow_state,
+                    feedback
+                )
+            
+            evaluation_result = await self.evaluate(workflow_state)
+            if evaluation_result.get("is_valid"):
+                break
+        
+        return {
+            "is_valid": bool(evaluation_result.get("is_valid")),
+            "evaluation_result": evaluation_result,
+            "iterations": len(history),
+            "rerun_steps": history
+        }
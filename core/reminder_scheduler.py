@@ -0,0 +1,561 @@
+"""
+Asynchronous reminder scheduler for upcoming filings and renewals.
+
+Usage:
+    python -m core.reminder_scheduler portfolio.jsonl --file reminders.jsonl
+"""
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, time as day_time, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.config import Config
+from states.rule_history import parse_as_of
+
+_ENCODER = json.JSONEncoder(default=str)
+
+@dataclass
+class Reminder:
+    """A notification to send at a point in time."""
+    reminder_id: str
+    due_at: float
+    payload: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    sequence: int = 0
+    delivered: List[str] = field(default_factory=list)
+
+def format_reminder(reminder: Reminder) -> str:
+    """
+    Format a reminder as one line of text.
+    
+    Args:
+        reminder: Reminder to format
+        
+    Returns:
+        Human-readable message
+    """
+    payload = reminder.payload
+    message = f"{payload.get('name', payload.get('entity_id'))}: {payload.get('type')}"
+    if payload.get("due_date"):
+        message += f" due {payload['due_date']}"
+    if payload.get("state_code"):
+        message += f" ({payload['state_code']})"
+    return message
+
+class ReminderSink(ABC):
+    """Destination reminders are delivered to."""
+    
+    @abstractmethod
+    async def send(self, reminder: Reminder) -> None:
+        """
+        Deliver a reminder.
+        
+        Args:
+            reminder: Reminder to deliver
+            
+        Raises:
+            Exception: If delivery failed and should be retried
+        """
+        pass
+    
+    def close(self) -> None:
+        """Release resources held by the sink."""
+        pass
+
+class StdoutSink(ReminderSink):
+    """Prints reminders to a text stream."""
+    
+    def __init__(self, stream: Any = None):
+        """
+        Initialize the sink.
+        
+        Args:
+            stream: Writable text stream (defaults to stdout)
+        """
+        self.stream = stream
+    
+    async def send(self, reminder: Reminder) -> None:
+        print(f"[reminder] {format_reminder(reminder)}", file=self.stream or sys.stdout, flush=True)
+
+class FileSink(ReminderSink):
+    """Appends reminders to a JSONL file."""
+    
+    def __init__(self, path: str):
+        """
+        Initialize the sink.
+        
+        Args:
+            path: Path of the JSONL file
+        """
+        self.path = Path(path)
+        self._file = None
+    
+    async def send(self, reminder: Reminder) -> None:
+        if self._file is None:
+            os.makedirs(self.path.parent, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps({
+            "reminder_id": reminder.reminder_id,
+            "sent_at": datetime.now().isoformat(),
+            "message": format_reminder(reminder),
+            **reminder.payload
+        }, default=str) + "\n")
+        self._file.flush()
+    
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class WebhookSink(ReminderSink):
+    """
+    Posts reminders to a webhook.
+    
+    No HTTP client ships with the project, so requests go through an
+    injected transport; without one the sink records the requests it would
+    have sent.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        transport: Optional[Callable[[str, str], Awaitable[Any]]] = None,
+        history: int = 1000
+    ):
+        """
+        Initialize the sink.
+        
+        Args:
+            url: Webhook URL
+            transport: Async callable taking the URL and the JSON body
+            history: Number of unsent requests to keep without a transport
+        """
+        self.url = url
+        self.transport = transport
+        self.requests: deque = deque(maxlen=history)
+    
+    async def send(self, reminder: Reminder) -> None:
+        body = json.dumps({
+            "id": reminder.reminder_id,
+            "text": format_reminder(reminder),
+            "reminder": reminder.payload
+        }, default=str)
+        if self.transport is None:
+            self.requests.append((self.url, body))
+        else:
+            await self.transport(self.url, body)
+
+class ReminderStore:
+    """SQLite file holding the pending reminder queue."""
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Open (or create) the store.
+        
+        Args:
+            path: Database path (defaults to Config.PATHS["reminders"])
+        """
+        self.path = Path(path or Config.get_path("reminders"))
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS reminders ("
+            "reminder_id TEXT PRIMARY KEY, due_at REAL NOT NULL, "
+            "payload TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+            "delivered TEXT NOT NULL DEFAULT '[]') WITHOUT ROWID"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(reminders)")}
+        if "delivered" not in columns:
+            self._conn.execute(
+                "ALTER TABLE reminders ADD COLUMN delivered TEXT NOT NULL DEFAULT '[]'"
+            )
+        self._conn.commit()
+    
+    def load(self) -> List[Reminder]:
+        """Load every pending reminder."""
+        rows = self._conn.execute(
+            "SELECT reminder_id, due_at, payload, attempts, delivered FROM reminders"
+        )
+        return [
+            Reminder(reminder_id, due_at, json.loads(payload), attempts, 0, json.loads(delivered))
+            for reminder_id, due_at, payload, attempts, delivered in rows
+        ]
+    
+    def save(self, reminders: Iterable[Reminder]) -> None:
+        """Insert or update reminders in one transaction."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO reminders "
+                "(reminder_id, due_at, payload, attempts, delivered) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        r.reminder_id,
+                        r.due_at,
+                        _ENCODER.encode(r.payload),
+                        r.attempts,
+                        _ENCODER.encode(r.delivered)
+                    )
+                    for r in reminders
+                )
+            )
+    
+    def delete(self, reminder_ids: Iterable[str]) -> None:
+        """Delete reminders in one transaction."""
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM reminders WHERE reminder_id = ?",
+                ((reminder_id,) for reminder_id in reminder_ids)
+            )
+    
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+ReminderItem = Tuple[str, float, Dict[str, Any]]
+
+class ReminderScheduler:
+    """
+    Sends reminders through sinks when they fall due.
+    
+    Pending reminders sit in a heap ordered by due time. The run loop sleeps
+    until the earliest one is due (or a new, earlier one is scheduled), so an
+    idle scheduler uses no CPU however many reminders are queued. Replaced
+    and cancelled reminders are dropped lazily when they reach the top of the
+    heap. With a store, every change is written before it takes effect and
+    reminders are deleted only after delivery, so a restart loses nothing;
+    a crash mid-delivery can repeat a reminder.
+    
+    Scheduling methods must be called from the thread running the loop.
+    """
+    
+    def __init__(
+        self,
+        sinks: Optional[List[ReminderSink]] = None,
+        store: Optional[ReminderStore] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the scheduler and load the persisted queue.
+        
+        Args:
+            sinks: Notification sinks (defaults to stdout)
+            store: Persistent queue; None keeps reminders in memory only
+            clock: Function returning the current Unix time
+        """
+        self.sinks = sinks if sinks is not None else [StdoutSink()]
+        self.store = store
+        self.clock = clock
+        self.settings = Config.REMINDERS
+        self.stats = {"scheduled": 0, "sent": 0, "retried": 0, "failed": 0}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._live: Dict[str, Reminder] = {}
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+        
+        if store is not None:
+            for reminder in store.load():
+                self._push(reminder)
+    
+    def __len__(self) -> int:
+        return len(self._live)
+    
+    def __contains__(self, reminder_id: str) -> bool:
+        return reminder_id in self._live
+    
+    def _push(self, reminder: Reminder) -> None:
+        """Make a reminder the live version of its id and queue it."""
+        reminder.sequence = next(self._sequence)
+        self._live[reminder.reminder_id] = reminder
+        heapq.heappush(self._heap, (reminder.due_at, reminder.sequence, reminder.reminder_id))
+    
+    def _peek(self) -> Optional[Reminder]:
+        """Get the earliest live reminder, discarding stale heap entries."""
+        while self._heap:
+            _, sequence, reminder_id = self._heap[0]
+            reminder = self._live.get(reminder_id)
+            if reminder is not None and reminder.sequence == sequence:
+                return reminder
+            heapq.heappop(self._heap)
+        return None
+    
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    def next_due(self) -> Optional[float]:
+        """Get the Unix time of the earliest pending reminder, or None."""
+        reminder = self._peek()
+        return reminder.due_at if reminder else None
+    
+    def schedule(self, reminder_id: str, due_at: float, payload: Dict[str, Any]) -> Reminder:
+        """
+        Schedule (or reschedule) a reminder.
+        
+        Args:
+            reminder_id: Unique id; scheduling an existing id replaces it
+            due_at: Unix time to send the reminder at
+            payload: Data passed to the sinks
+            
+        Returns:
+            Scheduled reminder
+        """
+        self.schedule_many([(reminder_id, due_at, payload)])
+        return self._live[reminder_id]
+    
+    def schedule_many(self, items: Iterable[ReminderItem]) -> int:
+        """
+        Schedule many reminders, persisting them in one transaction.
+        
+        Args:
+            items: Tuples of (reminder_id, due_at, payload)
+            
+        Returns:
+            Number of reminders scheduled
+        """
+        earliest = self.next_due()
+        reminders = [
+            Reminder(reminder_id, float(due_at), payload) for reminder_id, due_at, payload in items
+        ]
+        if self.store is not None:
+            self.store.save(reminders)
+        for reminder in reminders:
+            self._push(reminder)
+        
+        self.stats["scheduled"] += len(reminders)
+        if reminders and (earliest is None or self.next_due() < earliest):
+            self._wake()
+        return len(reminders)
+    
+    def cancel(self, reminder_id: str) -> bool:
+        """
+        Cancel a pending reminder.
+        
+        Args:
+            reminder_id: Id of the reminder
+            
+        Returns:
+            True if the reminder was pending
+        """
+        if self._live.pop(reminder_id, None) is None:
+            return False
+        if self.store is not None:
+            self.store.delete([reminder_id])
+        return True
+    
+    def schedule_deadlines(
+        self,
+        deadlines: Iterable[Dict[str, Any]],
+        lead_days: Optional[List[int]] = None
+    ) -> int:
+        """
+        Schedule reminders ahead of compliance deadlines.
+        
+        Reminder times already in the past are skipped, so calling this again
+        with the same deadlines (e.g. after a restart) only refreshes pending
+        reminders.
+        
+        Args:
+            deadlines: Deadlines with entity_id, type and due_date, such as
+                DeadlineCalendar.iter_due() or calendar_export.iter_events()
+            lead_days: Days before each deadline to remind
+                (defaults to Config.REMINDERS["lead_days"])
+                
+        Returns:
+            Number of reminders scheduled
+        """
+        if lead_days is None:
+            lead_days = self.settings["lead_days"]
+        send_at = day_time(self.settings["send_hour"])
+        now = self.clock()
+        
+        def items() -> Iterable[ReminderItem]:
+            for deadline in deadlines:
+                due_date = parse_as_of(deadline["due_date"])
+                payload = {
+                    key: deadline[key]
+                    for key in ("entity_id", "name", "state_code", "type", "category", "fee")
+                    if deadline.get(key) is not None
+                }
+                payload["due_date"] = due_date.isoformat()
+                key = f"{deadline['entity_id']}:{deadline['type']}:{payload['due_date']}"
+                for lead in lead_days:
+                    due_at = datetime.combine(due_date - timedelta(days=lead), send_at).timestamp()
+                    if due_at > now:
+                        yield f"{key}:{lead}", due_at, {**payload, "lead_days": lead}
+        
+        return self.schedule_many(items())
+    
+    async def run_pending(self) -> int:
+        """
+        Deliver every reminder that is due.
+        
+        Reminders whose delivery fails are retried with exponential backoff
+        up to Config.REMINDERS["max_attempts"] times. A retry goes only to
+        the sinks that have not accepted the reminder yet.
+        
+        Returns:
+            Number of reminders delivered
+        """
+        delivered = 0
+        while True:
+            now = self.clock()
+            batch = []
+            while len(batch) < self.settings["batch_size"]:
+                reminder = self._peek()
+                if reminder is None or reminder.due_at > now:
+                    break
+                heapq.heappop(self._heap)
+                batch.append(reminder)
+            if not batch:
+                return delivered
+            
+            outcomes = await asyncio.gather(*(self._deliver(reminder) for reminder in batch))
+            done, retries = [], []
+            for reminder, ok in zip(batch, outcomes):
+                if self._live.get(reminder.reminder_id) is not reminder:
+                    continue  # Replaced or cancelled during delivery
+                if ok or reminder.attempts + 1 >= self.settings["max_attempts"]:
+                    del self._live[reminder.reminder_id]
+                    done.append(reminder.reminder_id)
+                    self.stats["sent" if ok else "failed"] += 1
+                    delivered += ok
+                else:
+                    reminder.attempts += 1
+                    backoff = self.settings["retry_seconds"] * 2 ** (reminder.attempts - 1)
+                    reminder.due_at = now + backoff
+                    retries.append(reminder)
+                    self.stats["retried"] += 1
+            
+            if self.store is not None:
+                self.store.save(retries)
+                self.store.delete(done)
+            for reminder in retries:
+                self._push(reminder)
+    
+    def _sink_key(self, index: int) -> str:
+        """Identify a sink by its position and type, as recorded in Reminder.delivered."""
+        return f"{index}:{type(self.sinks[index]).__name__}"
+    
+    async def _deliver(self, reminder: Reminder) -> bool:
+        """
+        Send a reminder to every sink that has not accepted it yet.
+        
+        Sinks that succeed are recorded in reminder.delivered, so a retry
+        skips them.
+        
+        Returns:
+            True if every sink has now accepted the reminder
+        """
+        pending = [
+            (key, sink)
+            for key, sink in ((self._sink_key(i), sink) for i, sink in enumerate(self.sinks))
+            if key not in reminder.delivered
+        ]
+        results = await asyncio.gather(
+            *(sink.send(reminder) for _, sink in pending),
+            return_exceptions=True
+        )
+        ok = True
+        for (key, _), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                ok = False
+            else:
+                reminder.delivered.append(key)
+        return ok
+    
+    async def run(self) -> None:
+        """Deliver reminders as they fall due until stop() is called."""
+        self._wakeup = asyncio.Event()
+        self._running = True
+        try:
+            while self._running:
+                await self.run_pending()
+                next_due = self.next_due()
+                timeout = None if next_due is None else max(0.0, next_due - self.clock())
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._running = False
+            self._wakeup = None
+    
+    def stop(self) -> None:
+        """Ask the run loop to exit."""
+        self._running = False
+        self._wake()
+    
+    def close(self) -> None:
+        """Close the sinks and the store."""
+        for sink in self.sinks:
+            sink.close()
+        if self.store is not None:
+            self.store.close()
+
+def main() -> None:
+    """Command-line entry point."""
+    from core.batch_runner import iter_records
+    from core.deadline_engine import DeadlineCalendar
+    
+    parser = argparse.ArgumentParser(description="Send reminders for upcoming LLC deadlines.")
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="Path to a .csv or .jsonl file of entity_id, state_code, formation_date, name"
+    )
+    parser.add_argument("--store", default=None, help="Path of the persistent reminder queue")
+    parser.add_argument("--file", default=None, help="Also append reminders to this JSONL file")
+    parser.add_argument("--webhook", default=None, help="Also record webhook requests to this URL")
+    parser.add_argument(
+        "--lead-days",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Days before each deadline to remind"
+    )
+    args = parser.parse_args()
+    
+    sinks: List[ReminderSink] = [StdoutSink()]
+    if args.file:
+        sinks.append(FileSink(args.file))
+    if args.webhook:
+        sinks.append(WebhookSink(args.webhook))
+    scheduler = ReminderScheduler(sinks, ReminderStore(args.store))
+    
+    if args.input:
+        calendar = DeadlineCalendar()
+        for record in iter_records(args.input):
+            calendar.add_entity(
+                str(record["entity_id"]),
+                str(record["state_code"]).upper(),
+                record["formation_date"],
+                name=record.get("name")
+            )
+        scheduler.schedule_deadlines(calendar.iter_due(), args.lead_days)
+    print(f"{len(scheduler)} reminders pending")
+    
+    try:
+        asyncio.run(scheduler.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.close()
+
+if __name__ == "__main__":
+    main()
@@ -162,37 +162,26 @@ def get_employment_requirements(state_code: str) -> Dict[str, Any]:
     """
     return get_state_compliance_requirements(state_code)["employment_requirements"]
 
-def get_upcoming_deadlines(state_code: str, formation_date: datetime) -> List[Dict[str, Any]]:
+def get_upcoming_deadlines(
+    state_code: str,
+    formation_date: datetime,
+    as_of: Any = None
+) -> List[Dict[str, Any]]:
     """
     Get upcoming compliance deadlines for an LLC.
     
     Args:
         state_code: Two-letter state code
         formation_date: Date LLC was formed
-        
+        as_of: Date from which to look ahead, and whose requirements apply
+            (defaults to today)
+            
     Returns:
-        List of upcoming deadlines and requirements
+        List of upcoming deadlines with concrete due dates, earliest first
     """
-    requirements = get_ongoing_requirements(state_code)
-    deadlines = []
-    
-    # Check annual report deadline
-    if "annual_report" in requirements and requirements["annual_report"]["required"]:
-        deadlines.append({
-            "type": "Annual Report",
-            "due_date": requirements["annual_report"]["due_date"],
-            "fee": requirements["annual_report"].get("fee", "Varies")
-        })
-    
-    # Check license renewal deadlines
-    if "license_renewal" in requirements:
-        deadlines.append({
-            "type": "License Renewal",
-            "frequency": requirements["license_renewal"]["frequency"],
-            "due_date": requirements["license_renewal"].get("due_date", "Varies")
-        })
+    from core.deadline_engine import get_next_deadlines
     
-    return deadlines
+    return get_next_deadlines(state_code, formation_date, as_of)
 
 def validate_compliance(state_code: str, business_details: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -209,22 +198,42 @@ def validate_compliance(state_code: str, business_details: Dict[str, Any]) -> Di
     issues = []
     
     # Check initial requirements
+    completed = business_details.get("completed_requirements", [])
     for req_type, req_details in requirements["initial_requirements"].items():
-        if req_details["required"] is True and req_type not in business_details.get("completed_requirements", []):
+        if req_details.get("required") is True and req_type not in completed:
             issues.append(f"Missing {req_type}")
     
     # Check ongoing requirements
+    maintained = business_details.get("maintained_requirements", [])
     for req_type, req_details in requirements["ongoing_requirements"].items():
-        if req_details["required"] is True and req_type not in business_details.get("maintained_requirements", []):
+        if req_details.get("required") is True and req_type not in maintained:
             issues.append(f"Non-compliant with {req_type}")
     
     # Check employment requirements if applicable
     if business_details.get("has_employees", False):
+        complied = business_details.get("employment_compliance", [])
         for req_type, req_details in requirements["employment_requirements"].items():
-            if req_details["required"] == "All employers" and req_type not in business_details.get("employment_compliance", []):
+            if req_details.get("required") == "All employers" and req_type not in complied:
                 issues.append(f"Missing {req_type}")
     
     return {
         "compliant": len(issues) == 0,
         "issues": issues
     }
+
+def validate_compliance_bulk(entities: Any, as_of: Any = None) -> Any:
+    """
+    Validate the compliance of many businesses at once.
+    
+    Args:
+        entities: DataFrame, Arrow table or list of records with a state_code
+            column plus the business_details fields used by
+            validate_compliance()
+        as_of: Date whose requirements apply (defaults to today)
+        
+    Returns:
+        DataFrame with compliant, issue_count and issues per entity
+    """
+    from core.compliance_matrix import get_compliance_matrix
+    
+    return get_compliance_matrix(as_of).evaluate(entities)
@@ -165,21 +165,9 @@ def validate_llc_name(state_code: str, name: str) -> bool:
     Returns:
         Boolean indicating if name is valid
     """
-    requirements = get_state_requirements(state_code)["formation_requirements"]["name_requirements"]
+    from core.name_rules import get_name_rules
     
-    # Check required terms
-    has_required_term = any(term.lower() in name.lower() 
-                          for term in requirements["required_terms"])
-    if not has_required_term:
-        return False
-    
-    # Check prohibited terms
-    has_prohibited_term = any(term.lower() in name.lower() 
-                            for term in requirements["prohibited_terms"])
-    if has_prohibited_term:
-        return False
-    
-    return True
+    return get_name_rules(state_code).check(name)["valid"]
 
 def get_filing_fees(state_code: str) -> Dict[str, float]:
     """
@@ -5,10 +5,13 @@ Utility functions for the LLC Builder application.
 import os
 import re
 import json
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping
 from datetime import datetime
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from states.state_record import StateRecord
+
 def validate_business_name(name: str, state_code: str) -> Dict[str, Any]:
     """
     Validate a business name against state-specific requirements.
@@ -20,27 +23,34 @@ def validate_business_name(name: str, state_code: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing validation results
     """
-    from core.state_requirements import get_state_requirements
+    from core.name_index import get_name_registry
+    from core.name_rules import get_name_rules
     
-    requirements = get_state_requirements(state_code)
-    name_reqs = requirements["formation_requirements"]["name_requirements"]
+    check = get_name_rules(state_code).check(name)
     
     results = {
-        "valid": True,
-        "issues": []
+        "valid": check["valid"],
+        "issues": [
+            violation["message"] for violation in check["violations"]
+            if violation["type"] != "restricted_term"
+        ],
+        "approvals_required": [
+            {"term": violation["term"], "board": violation["board"]}
+            for violation in check["violations"]
+            if violation["type"] == "restricted_term"
+        ]
     }
     
-    # Check required terms
-    has_required = any(term.lower() in name.lower() for term in name_reqs["required_terms"])
-    if not has_required:
-        results["valid"] = False
-        results["issues"].append(f"Name must contain one of: {', '.join(name_reqs['required_terms'])}")
-    
-    # Check prohibited terms
-    has_prohibited = any(term.lower() in name.lower() for term in name_reqs["prohibited_terms"])
-    if has_prohibited:
-        results["valid"] = False
-        results["issues"].append(f"Name contains prohibited term from: {', '.join(name_reqs['prohibited_terms'])}")
+    # Check distinguishability when a registry dump is loaded for the state
+    registry = get_name_registry()
+    if registry.has_state(state_code):
+        distinguishability = registry.check_name(state_code, name)
+        if not distinguishability["distinguishable"]:
+            results["valid"] = False
+            results["issues"].append(
+                "Name is not distinguishable from existing entities: "
+                + ", ".join(match["name"] for match in distinguishability["similar_names"])
+            )
     
     return results
 
@@ -62,20 +72,21 @@ def generate_document_from_template(template_path: str, context: Dict[str, Any])
     
     return chevron.render(template, context)
 
-def calculate_fees(state_code: str, services: List[str]) -> Dict[str, float]:
+def calculate_fees(state_code: str, services: List[str], as_of: Any = None) -> Dict[str, float]:
     """
     Calculate fees for LLC formation services.
     
     Args:
         state_code: Two-letter state code
         services: List of requested services
+        as_of: Date whose fee schedule applies (defaults to today)
         
     Returns:
         Dictionary containing fee breakdown
     """
-    from core.state_requirements import get_state_requirements
+    from states.rule_history import get_rule_history
     
-    requirements = get_state_requirements(state_code)
+    requirements = get_rule_history().snapshot("state_requirements", state_code, as_of)
     fees = requirements["formation_requirements"]["fees"]
     
     total_fees = {
@@ -99,34 +110,9 @@ def generate_filing_checklist(state_code: str, business_type: str) -> List[Dict[
     Returns:
         List of required filings and their details
     """
-    from core.state_requirements import get_state_requirements
-    from core.state_compliance import get_initial_requirements
-    
-    requirements = get_state_requirements(state_code)
-    compliance = get_initial_requirements(state_code)
-    
-    checklist = []
-    
-    # Add formation documents
-    if requirements["formation_requirements"]["articles_of_organization"]:
-        checklist.append({
-            "item": "Articles of Organization",
-            "required": True,
-            "deadline": "Before operations",
-            "notes": "Must be filed with Secretary of State"
-        })
-    
-    # Add compliance requirements
-    for req_type, details in compliance.items():
-        if details["required"] is True or (isinstance(details["required"], str) and details["required"] != "Varies"):
-            checklist.append({
-                "item": req_type.replace("_", " ").title(),
-                "required": True,
-                "deadline": "Before operations",
-                "notes": f"File with {details.get('agency', 'appropriate agency')}"
-            })
-    
-    return checklist
+    from core.filing_checklist import get_filing_checklist
+    
+    return [dict(item) for item in get_filing_checklist(state_code, business_type)]
 
 def format_address(address: Dict[str, str]) -> str:
     """
@@ -285,24 +271,13 @@ def validate_email(email: str) -> bool:
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     return bool(re.match(pattern, email))
 
-def load_state_data() -> Dict[str, Dict[str, Any]]:
+def load_state_data() -> Mapping[str, "StateRecord"]:
     """
     Load state-specific data from all modules.
     
     Returns:
-        Combined dictionary of state data
+        Shared read-only mapping of state code to merged state record
     """
-    from core.state_requirements import STATE_REQUIREMENTS
-    from core.state_tax_requirements import STATE_TAX_REQUIREMENTS
-    from core.state_compliance import STATE_COMPLIANCE_REQUIREMENTS
-    
-    state_data = {}
-    
-    for state_code in STATE_REQUIREMENTS:
-        state_data[state_code] = {
-            "requirements": STATE_REQUIREMENTS[state_code],
-            "tax": STATE_TAX_REQUIREMENTS[state_code],
-            "compliance": STATE_COMPLIANCE_REQUIREMENTS[state_code]
-        }
+    from states.state_record import get_state_records
     
-    return state_data
+    return get_state_records()
@@ -3,10 +3,13 @@ Base class for state-specific requirements.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import re
 
+if TYPE_CHECKING:
+    from states.state_record import StateRecord
+
 class BaseState(ABC):
     """Base class defining interface for state-specific requirements."""
     
@@ -103,6 +106,56 @@ class BaseState(ABC):
         """Get professional governance requirements."""
         return self._professional_requirements.get("governance", {})
     
+    def get_professional_requirements(self, profession: Optional[str]) -> Dict[str, Any]:
+        """
+        Get professional LLC requirements for a profession.
+        
+        Args:
+            profession: Profession or industry of the LLC
+            
+        Returns:
+            State professional LLC requirements with the profession's
+            category requirements and licensing board
+        """
+        from states.profession_index import get_profession_index
+        
+        entry = get_profession_index().lookup(profession) or {}
+        boards = entry.get("boards") or ["the state professional licensing board"]
+        return {
+            **self._professional_requirements,
+            "name_requirements": {
+                **self._professional_requirements.get("name_requirements", {}),
+                "board": ", ".join(boards)
+            },
+            "profession": entry.get("profession"),
+            "category": entry.get("category"),
+            "profession_requirements": entry.get("requirements", {})
+        }
+    
+    def check_professional_eligibility(
+        self,
+        profession: Optional[str],
+        owner_info: List[Any]
+    ) -> Tuple[bool, List[str]]:
+        """
+        Check whether owners may form a professional LLC in the state.
+        
+        Args:
+            profession: Profession or industry of the LLC
+            owner_info: Owner records
+            
+        Returns:
+            Tuple of eligibility and messages
+        """
+        from states.profession_index import get_profession_index
+        
+        result = get_profession_index().check_eligibility(
+            profession,
+            owner_info,
+            self._get_state_code()
+        )
+        return result["eligible"], result["messages"]
+    
     def get_legal_risks(self) -> List[Dict[str, Any]]:
         """Get legal risks."""
         return self._get_legal_risks()
@@ -123,6 +176,64 @@ class BaseState(ABC):
         """Get governance warnings."""
         return self._get_governance_warnings()
     
+    def get_state_metrics(self) -> Dict[str, float]:
+        """
+        Get values this implementation supplies for the state metrics table.
+        
+        Returns:
+            Mapping of metrics column name to value, overriding the state tables
+        """
+        return {
+            "formation_fee": self._get_base_filing_fee(),
+            "expedited_fee": self._get_expedited_fee(),
+            "annual_report_fee": self._get_annual_report_fee(),
+            "processing_days": float(self._get_standard_processing_time()),
+            "publication_required": float(self._is_publication_required())
+        }
+    
+    def get_state_record(self) -> "StateRecord":
+        """Get the merged read-only record of the state."""
+        from states.state_record import get_state_record
+        return get_state_record(self._get_state_code())
+    
+    def _record_section(self, source: str, section: str) -> Dict[str, Any]:
+        """Get a mutable copy of one section of the state record."""
+        from states.state_record import thaw
+        data = getattr(self.get_state_record(), source) or {}
+        return thaw(data.get(section)) or {}
+    
+    def get_employment_requirements(self) -> Dict[str, Any]:
+        """Get state employment requirements."""
+        return self._record_section("compliance", "employment_requirements")
+    
+    def get_employment_compliance_requirements(self) -> Dict[str, Any]:
+        """Get ongoing compliance requirements that apply to employers."""
+        return self.get_employment_requirements()
+    
+    def get_tax_filing_requirements(self) -> Dict[str, Any]:
+        """Get state tax filing requirements."""
+        return self._record_section("tax", "filing_requirements")
+    
+    def get_tax_deadlines(self) -> Dict[str, Any]:
+        """Get state tax due dates."""
+        return self.get_tax_filing_requirements().get("due_dates", {})
+    
+    def validate_llc_name(self, name: str) -> Tuple[bool, List[str]]:
+        """
+        Validate a proposed LLC name against the state's name rules.
+        
+        Args:
+            name: Proposed LLC name
+            
+        Returns:
+            Tuple of validity and messages; restricted terms produce messages
+            without making the name invalid
+        """
+        from core.name_rules import get_name_rules
+        
+        check = get_name_rules(self._get_state_code()).check(name)
+        return check["valid"], [violation["message"] for violation in check["violations"]]
+    
     def _get_base_filing_fee(self) -> float:
         """Get base filing fee."""
         return 100.0  # Default base fee
@@ -14,6 +14,18 @@ class California(BaseState):
     def _get_state_name(self) -> str:
         return "California"
     
+    def get_state_metrics(self) -> Dict[str, float]:
+        """Get values for the state metrics table."""
+        metrics = super().get_state_metrics()
+        metrics.update({
+            "annual_report_fee": 10.0,  # $20 Statement of Information every two years
+            "annual_report_required": 1.0,
+            "franchise_tax_min": self._get_annual_report_fee(),
+            "franchise_tax_required": 1.0,
+            "foreign_qualification_fee": 70.0
+        })
+        return metrics
+    
     def _get_base_filing_fee(self) -> float:
         """Get base filing fee."""
         return 70.0  # California LLC formation fee
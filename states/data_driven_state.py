@@ -0,0 +1,261 @@
+"""
+State implementation driven by the compiled state data table.
+"""
+
+import re
+from typing import Dict, Any, List, Optional
+from states.base_state import BaseState
+from states.state_data import (
+    COMMON_PROHIBITED_TERMS,
+    COMMON_RESTRICTED_TERMS,
+    COMMON_REQUIRED_TERMS,
+    REGULATED_PROFESSIONS
+)
+
+class DataDrivenState(BaseState):
+    """
+    Generic state requirements implementation backed by a state table row.
+    
+    Facts missing from the row fall back to the BaseState defaults. States
+    with hand-written logic subclass BaseState directly instead.
+    """
+    
+    def __init__(self, record: Dict[str, Any], **requirements: Any):
+        """
+        Initialize state requirements.
+        
+        Args:
+            record: Compiled row from states.state_table.STATE_TABLE
+            **requirements: Requirement tables passed through to BaseState
+        """
+        super().__init__(**requirements)
+        self._record = record
+    
+    def _get_state_code(self) -> str:
+        return self._record["state_code"]
+    
+    def _get_state_name(self) -> str:
+        return self._record["state_name"]
+    
+    def get_state_metrics(self) -> Dict[str, float]:
+        """Get metric overrides; data-driven states are read from the state tables."""
+        return {}
+    
+    def _get_base_filing_fee(self) -> float:
+        """Get base filing fee."""
+        fee = self._record["formation_fee"]
+        return fee if fee is not None else super()._get_base_filing_fee()
+    
+    def _get_expedited_fee(self) -> float:
+        """Get expedited processing fee."""
+        fee = self._record["expedited_fee"]
+        return fee if fee is not None else super()._get_expedited_fee()
+    
+    def _get_publication_fee(self) -> float:
+        """Get publication fee if required."""
+        cost = (self._record["publication_requirements"] or {}).get("estimated_cost")
+        return float(cost) if cost is not None else super()._get_publication_fee()
+    
+    def _get_annual_report_fee(self) -> float:
+        """Get annual report fee."""
+        annual_report = self._record["annual_report"]
+        if annual_report is None:
+            return super()._get_annual_report_fee()
+        return annual_report["fee"] if annual_report["required"] else 0.0
+    
+    def _get_standard_processing_time(self) -> int:
+        """Get standard processing time in days."""
+        processing_time = self._record["processing_time"]
+        if not processing_time:
+            return super()._get_standard_processing_time()
+        return processing_time["standard"]
+    
+    def _is_publication_required(self) -> bool:
+        """Check if publication is required."""
+        return bool(self._record["publication_required"])
+    
+    def _get_publication_period(self) -> int:
+        """Get publication period in days if required."""
+        deadline = (self._record["publication_requirements"] or {}).get("deadline", "")
+        match = re.search(r"\d+", str(deadline))
+        return int(match.group()) if match else 0
+    
+    def _get_annual_requirements(self) -> List[Dict[str, Any]]:
+        """Get annual requirements."""
+        annual_report = self._record["annual_report"]
+        franchise_tax = self._record["franchise_tax"]
+        if annual_report is None and franchise_tax is None:
+            return super()._get_annual_requirements()
+        
+        requirements = []
+        if annual_report and annual_report["required"]:
+            requirements.append({
+                "name": "Annual Report",
+                "deadline": annual_report["due"] or "Anniversary of formation",
+                "fee": annual_report["fee"]
+            })
+        if franchise_tax and franchise_tax["required"]:
+            requirements.append({
+                "name": "Franchise Tax",
+                "deadline": "Based on fiscal year",
+                "fee": franchise_tax["minimum"]
+            })
+        return requirements
+    
+    def get_formation_requirements(self) -> Dict[str, Any]:
+        """Get formation requirements."""
+        return {
+            **super().get_formation_requirements(),
+            "filing_agency": self._record["filing_agency"],
+            "forms_required": ["Articles of Organization", "Operating Agreement"],
+            "minimum_members": 1,
+            "requires_operating_agreement": True,
+            "allows_series_llc": bool(self._record["series_llc_allowed"]),
+            "allows_professional_llc": self._record["professional_llc_allowed"] is not False,
+            "foreign_qualification": {
+                "required": True,
+                "forms": ["Application for Certificate of Authority"]
+            }
+        }
+    
+    def get_fee_schedule(self) -> Dict[str, float]:
+        """Get the itemized filing fee schedule."""
+        formation_fee = self._get_base_filing_fee()
+        return {
+            "formation": formation_fee,
+            "name_reservation": float(self._record["name_reservation_fee"] or 0.0),
+            "expedited": self._get_expedited_fee(),
+            "certified_copy": 25.00,
+            "certificate_of_good_standing": 25.00,
+            "foreign_qualification": formation_fee
+        }
+    
+    def get_processing_times(self) -> Dict[str, Any]:
+        """Get processing times in days by service level."""
+        return dict(self._record["processing_time"] or {
+            "standard": self._get_standard_processing_time()
+        })
+    
+    def get_required_filings(self) -> List[Dict[str, Any]]:
+        """Get required state filings."""
+        filings = [
+            {
+                "name": "Articles of Organization",
+                "form_number": None,
+                "frequency": "One-time",
+                "fee": self._get_base_filing_fee(),
+                "required": True
+            }
+        ]
+        
+        annual_report = self._record["annual_report"]
+        if annual_report and annual_report["required"]:
+            filings.append({
+                "name": "Annual Report",
+                "form_number": None,
+                "frequency": "Annual",
+                "fee": annual_report["fee"],
+                "required": True,
+                "due_date": annual_report["due"]
+            })
+        
+        return filings
+    
+    def get_name_requirements(self) -> Dict[str, Any]:
+        """Get LLC name requirements."""
+        return {
+            "required_terms": list(COMMON_REQUIRED_TERMS),
+            "prohibited_terms": list(COMMON_PROHIBITED_TERMS),
+            "restricted_terms": dict(COMMON_RESTRICTED_TERMS),
+            "reservation_available": True,
+            "reservation_duration": self._record["name_reservation_duration"],
+            "reservation_fee": self._record["name_reservation_fee"],
+            "reservation_renewable": True,
+            "distinguishable": True
+        }
+    
+    def get_registered_agent_requirements(self) -> Dict[str, Any]:
+        """Get registered agent requirements."""
+        return {
+            "required": True,
+            "state_residency_required": True,
+            "business_hours": "9am-5pm",
+            "commercial_allowed": True,
+            "entity_as_agent": True,
+            "office_requirements": {
+                "physical_address": True,
+                "po_box_allowed": False,
+                "business_hours": True
+            },
+            "filing_required": {
+                "change_of_agent": True,
+                "change_of_address": True
+            },
+            "fees": {
+                "change_of_agent": 25.00,
+                "change_of_address": 25.00
+            }
+        }
+    
+    def get_tax_requirements(self) -> Dict[str, Any]:
+        """Get state tax requirements."""
+        franchise_tax = self._record["franchise_tax"] or {"required": False, "minimum": 0.0}
+        return {
+            "income_tax": {
+                "required": False,
+                "type": "Pass-through",
+                "exceptions": None
+            },
+            "franchise_tax": {
+                "required": franchise_tax["required"],
+                "minimum_amount": franchise_tax["minimum"],
+                "due_date": "Based on fiscal year",
+                "filing_requirements": {
+                    "online_filing": True
+                }
+            },
+            "sales_tax": {
+                "required": True,
+                "registration": "Department of Revenue",
+                "exemptions_available": True
+            },
+            "employer_taxes": {
+                "unemployment": {
+                    "required": "If employees",
+                    "registration": "Department of Labor"
+                },
+                "withholding": {
+                    "required": "If employees",
+                    "registration": "Department of Revenue"
+                }
+            }
+        }
+    
+    def get_publication_requirements(self) -> Optional[Dict[str, Any]]:
+        """Get publication requirements, or None if publication is not required."""
+        if not self._is_publication_required():
+            return None
+        return dict(self._record["publication_requirements"] or {})
+    
+    def get_professional_license_requirements(self) -> Dict[str, Any]:
+        """Get professional licensing requirements."""
+        return {
+            "professional_llc": {
+                "allowed": self._record["professional_llc_allowed"] is not False,
+                "regulated_professions": list(REGULATED_PROFESSIONS),
+                "ownership_restrictions": {
+                    "professional_requirements": True,
+                    "licensing_requirements": True
+                },
+                "name_requirements": {
+                    "professional_designation": True,
+                    "licensing_board_approval": True
+                }
+            },
+            "general_business_license": {
+                "required": "Varies by locality",
+                "issuing_agency": "Local government",
+                "fee": "Varies",
+                "renewal": "Annual"
+            }
+        }
@@ -32,19 +32,50 @@ class Delaware(BaseState):
             }
         }
     
-    def get_filing_fees(self) -> Dict[str, float]:
+    def _get_base_filing_fee(self) -> float:
+        """Get base filing fee."""
+        return 90.0  # Delaware Certificate of Formation fee
+    
+    def _get_expedited_fee(self) -> float:
+        """Get expedited processing fee."""
+        return 50.0  # Delaware 24-hour service fee
+    
+    def _get_annual_report_fee(self) -> float:
+        """Get annual report fee."""
+        return 300.0  # Delaware annual LLC tax, due with no separate report fee
+    
+    def _get_standard_processing_time(self) -> int:
+        """Get standard processing time in days."""
+        return 10  # Delaware standard processing time
+    
+    def get_state_metrics(self) -> Dict[str, float]:
+        """Get values for the state metrics table."""
+        metrics = super().get_state_metrics()
+        metrics.update({
+            "annual_report_fee": 0.0,
+            "annual_report_required": 1.0,
+            "franchise_tax_min": self._get_annual_report_fee(),
+            "franchise_tax_required": 1.0,
+            "foreign_qualification_fee": 200.0,
+            "series_llc_allowed": 1.0,
+            "professional_llc_allowed": 1.0
+        })
+        return metrics
+    
+    def get_fee_schedule(self) -> Dict[str, float]:
+        """Get the itemized filing fee schedule."""
         return {
-            "formation": 90.00,
+            "formation": self._get_base_filing_fee(),
             "name_reservation": 0.00,
-            "expedited": 50.00,
+            "expedited": self._get_expedited_fee(),
             "certified_copy": 0.00,
             "certificate_of_good_standing": 0.00,
-            "foreign_qualification": 0.00
+            "foreign_qualification": 200.00
         }
     
     def get_processing_times(self) -> Dict[str, Any]:
         return {
-            "standard": 10,
+            "standard": self._get_standard_processing_time(),
             "expedited": 1
         }
     
@@ -1 +0,0 @@
-"""State module initialization."""
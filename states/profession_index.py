@@ -0,0 +1,272 @@
+"""
+Profession index for professional LLC eligibility checks.
+"""
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.name_rules import compile_terms
+from states.requirements.professional_llc import PROFESSIONAL_LLC_REQUIREMENTS
+from states.requirements.regulated_professions import REGULATED_PROFESSIONS
+from states.state_data import COMMON_RESTRICTED_TERMS
+from states.state_data import REGULATED_PROFESSIONS as LICENSED_PROFESSIONS
+from states.state_table import STATE_TABLE
+
+# Other names under which a profession is described in requests
+PROFESSION_SYNONYMS = {
+    "Physician": ["Doctor", "Medical Doctor", "MD", "Medical Practice", "Medicine"],
+    "Surgeon": ["Surgery", "Surgical Practice"],
+    "Dentist": ["Dental", "Dentistry", "Dental Practice", "Orthodontist"],
+    "Chiropractor": ["Chiropractic"],
+    "Optometrist": ["Optometry"],
+    "Psychologist": ["Psychology"],
+    "Physical Therapist": ["Physical Therapy", "Physiotherapist", "Physiotherapy"],
+    "Attorney": ["Law Firm", "Law Practice", "Legal Services", "Counsel"],
+    "Lawyer": ["Attorney at Law"],
+    "Accountant": ["CPA", "Certified Public Accountant", "Accounting"],
+    "Investment Advisor": ["Investment Adviser", "Financial Advisor", "Wealth Management"],
+    "Insurance Agent": ["Insurance Broker", "Insurance Agency"],
+    "Real Estate Agent": ["Realtor", "Real Estate"],
+    "Real Estate Broker": ["Real Estate Brokerage"],
+    "Property Manager": ["Property Management"],
+    "Professional Engineer": ["Engineer", "Engineering", "PE"],
+    "Structural Engineer": ["Structural Engineering"],
+    "Civil Engineer": ["Civil Engineering"],
+    "Architect": ["Architecture"],
+    "Landscape Architect": ["Landscape Architecture"],
+    "Nurse": ["Nursing", "Nurse Practitioner"],
+    "Pharmacist": ["Pharmacy"],
+    "Veterinarian": ["Veterinary", "Vet"]
+}
+
+# Longest phrase matched when scanning a free-text industry description
+_MAX_PHRASE_WORDS = 4
+
+def normalize_profession(text: str) -> str:
+    """
+    Normalize a profession or industry description for lookup.
+    
+    Args:
+        text: Profession name or free-text description
+        
+    Returns:
+        Lowercase words separated by single spaces
+    """
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text.lower()).split())
+
+def _singular(normalized: str) -> str:
+    """Strip a plural "s" from the last word."""
+    if normalized.endswith("s") and not normalized.endswith("ss") and len(normalized) > 3:
+        return normalized[:-1]
+    return normalized
+
+def _is_licensed(owner: Any) -> bool:
+    """Check whether an owner record shows a professional license."""
+    for key in ("licensed", "license_number", "professional_license"):
+        value = owner.get(key) if isinstance(owner, dict) else getattr(owner, key, None)
+        if value:
+            return True
+    return False
+
+class ProfessionIndex:
+    """
+    Maps normalized profession names and synonyms to their requirements.
+    
+    Each entry joins the profession's category requirements with the
+    licensing boards of the restricted name terms it involves. Lookups are
+    dictionary accesses; free-text descriptions are scanned phrase by phrase.
+    """
+    
+    def __init__(self):
+        """Build the index from the regulated profession tables."""
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, str] = {}
+        board_terms = compile_terms(COMMON_RESTRICTED_TERMS)
+        boards = {term.lower(): board for term, board in COMMON_RESTRICTED_TERMS.items()}
+        
+        categories = {
+            profession: (category, details["requirements"])
+            for category, details in REGULATED_PROFESSIONS.items()
+            for profession in details["professions"]
+        }
+        synonyms = {
+            normalize_profession(name)
+            for profession in categories
+            for name in PROFESSION_SYNONYMS.get(profession, [])
+        }
+        # Licensed professions without a category, unless already a synonym
+        professions = list(categories) + [
+            profession for profession in LICENSED_PROFESSIONS
+            if profession not in categories and normalize_profession(profession) not in synonyms
+        ]
+        
+        for profession in professions:
+            names = [profession] + PROFESSION_SYNONYMS.get(profession, [])
+            category, requirements = categories.get(profession, (None, {}))
+            matched = {
+                boards[re.sub(r"\s+", " ", match.group().lower())]
+                for name in names
+                for match in board_terms.finditer(name)
+            }
+            self._entries[profession] = {
+                "profession": profession,
+                "category": category,
+                "requirements": requirements,
+                "boards": sorted(matched)
+            }
+            for name in names:
+                normalized = normalize_profession(name)
+                # Canonical names win over another profession's synonym
+                self._keys.setdefault(normalized, profession)
+                self._keys.setdefault(_singular(normalized), profession)
+            self._keys[normalize_profession(profession)] = profession
+    
+    def __contains__(self, profession: str) -> bool:
+        return self.lookup(profession) is not None
+    
+    def professions(self) -> List[str]:
+        """Get the canonical names of every indexed profession."""
+        return sorted(self._entries)
+    
+    def lookup(self, profession: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Find the index entry of a profession or industry description.
+        
+        Args:
+            profession: Profession name, synonym or free-text description
+            
+        Returns:
+            Entry with profession, category, requirements and boards, or
+            None if no regulated profession is mentioned
+        """
+        if not profession:
+            return None
+        normalized = normalize_profession(profession)
+        key = self._keys.get(normalized) or self._keys.get(_singular(normalized))
+        if key is not None:
+            return self._entries[key]
+        
+        # Longest matching phrase in a description like "dental practice in Austin"
+        words = normalized.split()
+        for size in range(min(_MAX_PHRASE_WORDS, len(words)), 0, -1):
+            for start in range(len(words) - size + 1):
+                phrase = " ".join(words[start:start + size])
+                key = self._keys.get(phrase) or self._keys.get(_singular(phrase))
+                if key is not None:
+                    return self._entries[key]
+        return None
+    
+    def get_state_requirements(self, state_code: str) -> Dict[str, Any]:
+        """
+        Get the professional LLC requirements of a state.
+        
+        Args:
+            state_code: Two-letter state code
+            
+        Returns:
+            State requirements, or the default requirements
+        """
+        return PROFESSIONAL_LLC_REQUIREMENTS.get(
+            state_code,
+            PROFESSIONAL_LLC_REQUIREMENTS["default"]
+        )
+    
+    def check_eligibility(
+        self,
+        profession: Optional[str],
+        owner_info: Iterable[Any],
+        state_code: str
+    ) -> Dict[str, Any]:
+        """
+        Check whether owners may form a professional LLC in a state.
+        
+        Args:
+            profession: Profession or industry of the LLC
+            owner_info: Owner records; an owner is licensed if it has a truthy
+                licensed, license_number or professional_license field
+            state_code: Two-letter state code
+            
+        Returns:
+            Dictionary with eligible, messages, profession details and the
+            state's professional LLC requirements
+        """
+        return self.check_eligibility_all_states(profession, owner_info, [state_code])[state_code]
+    
+    def check_eligibility_all_states(
+        self,
+        profession: Optional[str],
+        owner_info: Iterable[Any],
+        state_codes: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Check professional LLC eligibility in many states at once.
+        
+        The profession and owners are resolved once; each distinct set of
+        state requirements is then evaluated once.
+        
+        Args:
+            profession: Profession or industry of the LLC
+            owner_info: Owner records (see check_eligibility())
+            state_codes: States to check (defaults to every state)
+            
+        Returns:
+            Mapping of state code to the check_eligibility() result
+        """
+        entry = self.lookup(profession)
+        owners = list(owner_info or [])
+        licensed = sum(1 for owner in owners if _is_licensed(owner))
+        share = licensed / len(owners) if owners else 0.0
+        
+        common_messages = []
+        if entry is None:
+            common_messages.append(f"'{profession}' is not a recognized licensed profession")
+        if not owners:
+            common_messages.append("At least one owner is required")
+        elif not licensed:
+            common_messages.append("At least one owner must hold a professional license")
+        
+        outcomes: Dict[int, List[str]] = {}
+        results = {}
+        for state_code in (state_codes if state_codes is not None else sorted(STATE_TABLE)):
+            requirements = self.get_state_requirements(state_code)
+            if id(requirements) not in outcomes:
+                outcomes[id(requirements)] = self._ownership_messages(requirements, share)
+            messages = list(common_messages)
+            if STATE_TABLE.get(state_code, {}).get("professional_llc_allowed") is False:
+                messages.insert(0, f"{state_code} does not allow professional LLCs")
+            if owners and licensed:
+                messages.extend(outcomes[id(requirements)])
+            
+            results[state_code] = {
+                "eligible": not messages,
+                "messages": messages,
+                "profession": entry["profession"] if entry else None,
+                "category": entry["category"] if entry else None,
+                "boards": entry["boards"] if entry else [],
+                "profession_requirements": entry["requirements"] if entry else {},
+                "state_requirements": requirements
+            }
+        return results
+    
+    @staticmethod
+    def _ownership_messages(requirements: Dict[str, Any], share: float) -> List[str]:
+        """Check the licensed share of owners against a state's ownership rules."""
+        restrictions = requirements.get("ownership_restrictions", {})
+        if restrictions.get("all_members_licensed") and share < 1.0:
+            return ["All members must hold a professional license"]
+        minimum = restrictions.get("minimum_licensed_members", 0.0)
+        if share < minimum:
+            return [f"At least {minimum:.0%} of members must be licensed ({share:.0%} are)"]
+        return []
+
+_index: Optional[ProfessionIndex] = None
+_index_lock = threading.Lock()
+
+def get_profession_index() -> ProfessionIndex:
+    """Get the process-wide profession index."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ProfessionIndex()
+        return _index
@@ -0,0 +1,364 @@
+"""
+Chainable query API over the columnar state metrics table.
+
+Usage:
+    from states.query import where
+    where(series_llc_allowed=True, formation_fee__lt=150).order_by("processing_days").limit(5)
+    
+    python -m states.query "series_llc_allowed = true" "formation_fee < 150" \
+        --order-by processing_days --limit 5
+"""
+
+import argparse
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from states.state_metrics import COLUMNS, OPERATORS, StateMetricsTable, get_metrics_table
+
+# Number of distinct queries whose results are kept
+MAX_CACHED_QUERIES = 1024
+
+# Comparison symbols accepted in condition strings
+SYMBOLS = {
+    "=": "eq",
+    "==": "eq",
+    "!=": "ne",
+    "<": "lt",
+    "<=": "le",
+    ">": "gt",
+    ">=": "ge"
+}
+
+_CONDITION = re.compile(
+    r"^\s*(?P<column>\w+)\s*"
+    r"(?:(?P<symbol>==|!=|<=|>=|=|<|>)\s*(?P<value>.+?)"
+    r"|\s(?P<keyword>in|is\s+not\s+null|is\s+null)\b\s*(?P<values>.*?))\s*$",
+    re.IGNORECASE
+)
+
+Signature = Tuple[Tuple[Tuple[str, Any], ...], Optional[Tuple[str, bool]], Optional[int]]
+
+def _normalize(key: str, value: Any) -> Tuple[str, Any]:
+    """
+    Validate a filter condition and make its value hashable.
+    
+    Args:
+        key: `column` or `column__op`
+        value: Value to compare against
+        
+    Returns:
+        (column__op, value) with bools as floats and collections as sorted tuples
+        
+    Raises:
+        KeyError: If the column does not exist
+        ValueError: If the operator is unknown
+    """
+    column, _, op = key.partition("__")
+    op = op or "eq"
+    if column not in COLUMNS:
+        raise KeyError(f"Unknown column: {column}")
+    if op not in OPERATORS:
+        raise ValueError(f"Unknown filter operator: {op}")
+    if op == "in":
+        value = tuple(sorted({float(item) for item in value}))
+    elif op == "isnull":
+        value = bool(value)
+    elif value is not None:
+        value = float(value)
+    return f"{column}__{op}", value
+
+class StateQuery:
+    """
+    Immutable query over the state metrics table.
+    
+    where(), order_by() and limit() return new queries, so partial queries
+    can be shared and extended. Results are computed against the shared
+    metrics table and cached by query signature until the table is rebuilt.
+    """
+    
+    def __init__(
+        self,
+        conditions: Tuple[Tuple[str, Any], ...] = (),
+        order: Optional[Tuple[str, bool]] = None,
+        count: Optional[int] = None
+    ):
+        """
+        Initialize the query.
+        
+        Args:
+            conditions: Normalized (column__op, value) filter conditions
+            order: (column, descending) to sort by
+            count: Maximum number of rows
+        """
+        self._conditions = conditions
+        self._order = order
+        self._count = count
+    
+    @property
+    def signature(self) -> Signature:
+        """Hashable key identifying the query's results."""
+        return (self._conditions, self._order, self._count)
+    
+    def where(self, **conditions: Any) -> "StateQuery":
+        """
+        Add filter conditions, combined with AND with each other and with
+        the query's existing conditions, including ones on the same column.
+        
+        Conditions are `column=value` for equality or `column__op=value` with
+        op one of eq, ne, lt, le, gt, ge, in, isnull (see StateMetricsTable.mask()).
+        
+        Args:
+            **conditions: Filter conditions
+            
+        Returns:
+            New query
+            
+        Raises:
+            KeyError: If a column does not exist
+            ValueError: If an operator is unknown
+        """
+        merged = set(self._conditions)
+        merged.update(_normalize(key, value) for key, value in conditions.items())
+        # Sorted so equivalent queries share a signature; repeated columns all apply
+        ordered = sorted(merged, key=lambda condition: (condition[0], repr(condition[1])))
+        return StateQuery(tuple(ordered), self._order, self._count)
+    
+    def order_by(self, column: str) -> "StateQuery":
+        """
+        Sort the results; unknown values sort last.
+        
+        Args:
+            column: Column to sort by, prefixed with "-" for descending order
+            
+        Returns:
+            New query
+            
+        Raises:
+            KeyError: If the column does not exist
+        """
+        descending = column.startswith("-")
+        column = column.lstrip("-")
+        if column not in COLUMNS:
+            raise KeyError(f"Unknown column: {column}")
+        return StateQuery(self._conditions, (column, descending), self._count)
+    
+    def limit(self, count: int) -> "StateQuery":
+        """
+        Keep at most a number of rows.
+        
+        Args:
+            count: Maximum number of rows
+            
+        Returns:
+            New query
+            
+        Raises:
+            ValueError: If count is negative
+        """
+        if count < 0:
+            raise ValueError(f"Limit must not be negative: {count}")
+        return StateQuery(self._conditions, self._order, count)
+    
+    def _execute(self, table: StateMetricsTable) -> np.ndarray:
+        """Compute the selected row indices."""
+        mask = np.ones(len(table), dtype=bool)
+        for key, value in self._conditions:
+            mask &= table.mask(**{key: value})
+        rows = np.flatnonzero(mask)
+        count = len(rows) if self._count is None else min(self._count, len(rows))
+        if self._order is not None:
+            column, descending = self._order
+            values = table.column(column)[rows]
+            keys = -values if descending else values
+            if count < len(rows):
+                candidates = np.argpartition(keys, count)[:count]
+                rows = rows[candidates[np.argsort(keys[candidates], kind="stable")]]
+            else:
+                rows = rows[np.argsort(keys, kind="stable")]
+        rows = rows[:count]
+        rows.flags.writeable = False
+        return rows
+    
+    def rows(self) -> np.ndarray:
+        """
+        Get the indices of the selected rows of the shared metrics table.
+        
+        Returns:
+            Read-only integer array in result order
+        """
+        return _cached_rows(self)
+    
+    def table(self) -> StateMetricsTable:
+        """Get the results as a metrics table."""
+        return get_metrics_table().select(self.rows())
+    
+    def all(self) -> List[Dict[str, Any]]:
+        """
+        Get the results as dictionaries.
+        
+        Returns:
+            List of dictionaries as returned by StateMetricsTable.to_records()
+        """
+        return self.table().to_records()
+    
+    def codes(self) -> List[str]:
+        """Get the state codes of the results."""
+        return [str(code) for code in get_metrics_table().state_codes[self.rows()]]
+    
+    def first(self) -> Optional[Dict[str, Any]]:
+        """Get the first result, or None if nothing matches."""
+        count = 1 if self._count is None else min(self._count, 1)
+        records = self.limit(count).all()
+        return records[0] if records else None
+    
+    def count(self) -> int:
+        """Get the number of results."""
+        return len(self.rows())
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.all())
+    
+    def __len__(self) -> int:
+        return self.count()
+    
+    def __repr__(self) -> str:
+        return (
+            f"StateQuery(conditions={self._conditions!r}, order={self._order!r}, "
+            f"limit={self._count!r})"
+        )
+
+_results: "OrderedDict[Signature, np.ndarray]" = OrderedDict()
+_results_table: Optional[StateMetricsTable] = None
+_results_lock = threading.Lock()
+
+def _cached_rows(query: StateQuery) -> np.ndarray:
+    """Get a query's rows from the cache, computing them on first use."""
+    global _results_table
+    table = get_metrics_table()
+    signature = query.signature
+    with _results_lock:
+        if _results_table is not table:
+            _results.clear()
+            _results_table = table
+        rows = _results.get(signature)
+        if rows is not None:
+            _results.move_to_end(signature)
+            return rows
+    
+    rows = query._execute(table)
+    with _results_lock:
+        if _results_table is table:
+            _results[signature] = rows
+            if len(_results) > MAX_CACHED_QUERIES:
+                _results.popitem(last=False)
+    return rows
+
+def where(**conditions: Any) -> StateQuery:
+    """
+    Start a query with filter conditions (see StateQuery.where()).
+    
+    Returns:
+        New query
+    """
+    return StateQuery().where(**conditions)
+
+def _parse_value(text: str) -> Any:
+    lowered = text.strip().lower()
+    if lowered in ("true", "yes"):
+        return True
+    if lowered in ("false", "no"):
+        return False
+    return float(lowered)
+
+def parse_condition(text: str) -> Tuple[str, Any]:
+    """
+    Parse a condition string such as "formation_fee < 150".
+    
+    Accepts =, ==, !=, <, <=, >, >=, "in a, b" and "is [not] null";
+    values are numbers or true/false.
+    
+    Args:
+        text: Condition string
+        
+    Returns:
+        (column__op, value) keyword for StateQuery.where()
+        
+    Raises:
+        ValueError: If the condition cannot be parsed
+    """
+    match = _CONDITION.match(text)
+    if match is None:
+        raise ValueError(f"Invalid condition: {text}")
+    column = match.group("column")
+    try:
+        if match.group("symbol"):
+            return f"{column}__{SYMBOLS[match.group('symbol')]}", _parse_value(match.group("value"))
+        keyword = " ".join(match.group("keyword").lower().split())
+        if keyword == "in":
+            values = [_parse_value(item) for item in match.group("values").split(",")]
+            return f"{column}__in", values
+        return f"{column}__isnull", keyword == "is null"
+    except ValueError:
+        raise ValueError(f"Invalid condition: {text}") from None
+
+def parse_query(
+    conditions: List[str],
+    order_by: Optional[str] = None,
+    limit: Optional[int] = None
+) -> StateQuery:
+    """
+    Build a query from condition strings.
+    
+    Args:
+        conditions: Condition strings accepted by parse_condition()
+        order_by: Column to sort by, prefixed with "-" for descending order
+        limit: Maximum number of rows
+        
+    Returns:
+        New query
+    """
+    query = StateQuery()
+    for text in conditions:
+        key, value = parse_condition(text)
+        query = query.where(**{key: value})
+    if order_by:
+        query = query.order_by(order_by)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Query the state metrics table.")
+    parser.add_argument(
+        "conditions",
+        nargs="*",
+        help='Conditions combined with AND, e.g. "formation_fee < 150" "series_llc_allowed = true"'
+    )
+    parser.add_argument(
+        "--order-by",
+        default=None,
+        help="Sort column (--order-by=-column for descending)"
+    )
+    parser.add_argument("--limit", type=int, default=None, help="Maximum number of states")
+    parser.add_argument("--codes", action="store_true", help="Print state codes only")
+    args = parser.parse_args()
+    
+    try:
+        query = parse_query(args.conditions, args.order_by, args.limit)
+    except (KeyError, ValueError) as e:
+        parser.error(str(e).strip("'\""))
+    
+    if args.codes:
+        print(" ".join(query.codes()))
+    else:
+        for record in query:
+            print(json.dumps(record))
+
+if __name__ == "__main__":
+    main()
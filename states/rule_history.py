@@ -0,0 +1,324 @@
+"""
+Effective-dated state rule versions with as-of-date lookups.
+"""
+
+import threading
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from core.state_compliance import STATE_COMPLIANCE_REQUIREMENTS
+from core.state_requirements import STATE_REQUIREMENTS
+from states.state_data import STATE_DATA
+
+# Versioned tables; their current contents are the baseline version
+RULE_SOURCES = {
+    "state_data": STATE_DATA,
+    "state_requirements": STATE_REQUIREMENTS,
+    "state_compliance": STATE_COMPLIANCE_REQUIREMENTS
+}
+
+# Effective date of the baseline, i.e. the tables as shipped
+BASELINE_DATE = date.min
+
+# Rule changes applied on top of the baseline. Each entry is
+# {"source": ..., "state": ..., "effective": "YYYY-MM-DD",
+#  "changes": {"dotted.field.path": new_value, ...}}; a value of None
+# removes the field from that date on.
+RULE_CHANGES: List[Dict[str, Any]] = []
+
+AsOf = Union[date, datetime, str, None]
+
+def parse_as_of(value: AsOf) -> date:
+    """
+    Convert an as-of value to a date.
+    
+    Args:
+        value: Date, datetime, ISO date string, or None for today
+        
+    Returns:
+        Date
+    """
+    if value is None:
+        return date.today()
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten nested dictionaries into dotted field paths.
+    
+    Args:
+        data: Nested dictionary
+        prefix: Path prefix
+        
+    Returns:
+        Mapping of dotted path to leaf value
+    """
+    fields = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            fields.update(flatten(value, f"{path}."))
+        else:
+            fields[path] = value
+    return fields
+
+def unflatten(fields: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    """
+    Rebuild nested dictionaries from dotted field paths.
+    
+    Args:
+        fields: (path, value) pairs
+        
+    Returns:
+        Nested dictionary
+    """
+    data: Dict[str, Any] = {}
+    for path, value in sorted(fields):
+        keys = path.split(".")
+        node = data
+        for key in keys[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[keys[-1]] = value
+    return data
+
+class RuleHistory:
+    """
+    Effective-dated versions of the state rule tables.
+    
+    Every field keeps parallel sorted lists of effective dates and values,
+    so an as-of lookup is one bisect. Snapshots are cached per version and
+    a diff only compares the fields changed between the two dates.
+    """
+    
+    def __init__(self, sources: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None):
+        """
+        Initialize the history with the baseline tables.
+        
+        Args:
+            sources: Mapping of source name to {state_code: data}
+                (defaults to RULE_SOURCES)
+        """
+        self._fields: Dict[Tuple[str, str], Dict[str, Tuple[List[date], List[Any]]]] = {}
+        self._versions: Dict[Tuple[str, str], List[date]] = {}
+        self._changed: Dict[Tuple[str, str], Dict[date, Set[str]]] = {}
+        self._snapshots: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
+        self._effective_dates: List[date] = []
+        self.revision = 0
+        self._lock = threading.RLock()
+        
+        for source, table in (sources or RULE_SOURCES).items():
+            for state_code, data in table.items():
+                self.add_version(source, state_code, BASELINE_DATE, flatten(data))
+    
+    def add_version(
+        self,
+        source: str,
+        state_code: str,
+        effective: AsOf,
+        changes: Dict[str, Any]
+    ) -> None:
+        """
+        Record rule changes taking effect on a date.
+        
+        Args:
+            source: Source table name (e.g. "state_data")
+            state_code: Two-letter state code
+            effective: Date the changes take effect
+            changes: Mapping of dotted field path to new value (None removes
+                the field); dictionary values replace the whole subtree
+        """
+        effective = parse_as_of(effective)
+        key = (source, state_code)
+        with self._lock:
+            fields = self._fields.setdefault(key, {})
+            updates: Dict[str, Any] = {}
+            for path, value in changes.items():
+                # Replacing a subtree (or a leaf with a subtree) removes what was there
+                for existing in fields:
+                    nested = existing.startswith(f"{path}.") or path.startswith(f"{existing}.")
+                    if existing == path or nested:
+                        updates[existing] = None
+                if isinstance(value, dict) and value:
+                    updates.update(flatten(value, f"{path}."))
+                else:
+                    updates[path] = value
+            
+            for path, value in updates.items():
+                dates, values = fields.setdefault(path, ([], []))
+                position = bisect_right(dates, effective)
+                if position and dates[position - 1] == effective:
+                    values[position - 1] = value
+                else:
+                    dates.insert(position, effective)
+                    values.insert(position, value)
+            
+            versions = self._versions.setdefault(key, [])
+            position = bisect_right(versions, effective)
+            if not (position and versions[position - 1] == effective):
+                versions.insert(position, effective)
+            self._changed.setdefault(key, {}).setdefault(effective, set()).update(updates)
+            
+            position = bisect_right(self._effective_dates, effective)
+            if not (position and self._effective_dates[position - 1] == effective):
+                self._effective_dates.insert(position, effective)
+            self.revision += 1
+            
+            # Version numbers from this date on have shifted
+            self._snapshots = {
+                cached: snapshot for cached, snapshot in self._snapshots.items()
+                if cached[:2] != key
+            }
+    
+    def epoch(self, as_of: AsOf = None) -> Tuple[int, int]:
+        """
+        Identify the rule set in effect on a date, across all states.
+        
+        Dates with equal epochs see identical rules, so derived tables can
+        be cached per epoch.
+        
+        Args:
+            as_of: Date to evaluate (defaults to today)
+            
+        Returns:
+            Tuple of the history revision and the number of effective dates
+            on or before as_of
+        """
+        return self.revision, bisect_right(self._effective_dates, parse_as_of(as_of))
+    
+    def has_rules(self, source: str, state_code: str) -> bool:
+        """Check whether a state has rules in a source."""
+        return (source, state_code) in self._fields
+    
+    def _require(self, source: str, state_code: str) -> Tuple[str, str]:
+        """Get the history key of a state, raising KeyError if there is none."""
+        key = (source, state_code)
+        if key not in self._fields:
+            if source not in RULE_SOURCES and not any(k[0] == source for k in self._fields):
+                raise KeyError(f"Unknown rule source: {source}")
+            raise KeyError(f"Invalid state code: {state_code}")
+        return key
+    
+    def versions(self, source: str, state_code: str) -> List[date]:
+        """
+        Get the effective dates of every version of a state's rules.
+        
+        Args:
+            source: Source table name
+            state_code: Two-letter state code
+            
+        Returns:
+            Sorted effective dates (the baseline is date.min)
+        """
+        return list(self._versions[self._require(source, state_code)])
+    
+    def value(self, source: str, state_code: str, path: str, as_of: AsOf = None) -> Any:
+        """
+        Get one field as of a date.
+        
+        Args:
+            source: Source table name
+            state_code: Two-letter state code
+            path: Dotted field path (e.g. "formation_requirements.fees.formation")
+            as_of: Date to evaluate (defaults to today)
+            
+        Returns:
+            Field value, or None if the field is not in effect on that date
+        """
+        field = self._fields[self._require(source, state_code)].get(path)
+        if field is None:
+            return None
+        dates, values = field
+        position = bisect_right(dates, parse_as_of(as_of))
+        return values[position - 1] if position else None
+    
+    def snapshot(self, source: str, state_code: str, as_of: AsOf = None) -> Dict[str, Any]:
+        """
+        Get a state's rules as of a date.
+        
+        The returned dictionary is cached and shared; do not modify it.
+        
+        Args:
+            source: Source table name
+            state_code: Two-letter state code
+            as_of: Date to evaluate (defaults to today)
+            
+        Returns:
+            Nested dictionary shaped like the source table entry
+            
+        Raises:
+            KeyError: If the state has no rules in the source
+        """
+        key = self._require(source, state_code)
+        as_of = parse_as_of(as_of)
+        with self._lock:
+            version = bisect_right(self._versions[key], as_of)
+            cached = self._snapshots.get((*key, version))
+            if cached is None:
+                fields = []
+                for path, (dates, values) in self._fields[key].items():
+                    position = bisect_right(dates, as_of)
+                    if position and values[position - 1] is not None:
+                        fields.append((path, values[position - 1]))
+                cached = self._snapshots[(*key, version)] = unflatten(fields)
+            return cached
+    
+    def diff(
+        self,
+        source: str,
+        state_code: str,
+        from_date: AsOf,
+        to_date: AsOf = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the fields whose values differ between two dates.
+        
+        Args:
+            source: Source table name
+            state_code: Two-letter state code
+            from_date: Earlier date
+            to_date: Later date (defaults to today)
+            
+        Returns:
+            Mapping of dotted field path to {"from": old, "to": new}
+        """
+        key = self._require(source, state_code)
+        start, end = sorted((parse_as_of(from_date), parse_as_of(to_date)))
+        versions = self._versions[key]
+        
+        # Only fields changed by versions in (start, end] can differ
+        paths: Set[str] = set()
+        for effective in versions[bisect_right(versions, start):bisect_right(versions, end)]:
+            paths |= self._changed[key][effective]
+        
+        changes = {}
+        for path in sorted(paths):
+            before = self.value(source, state_code, path, start)
+            after = self.value(source, state_code, path, end)
+            if before != after:
+                changes[path] = {"from": before, "to": after}
+        return changes
+
+_history: Optional[RuleHistory] = None
+_history_lock = threading.Lock()
+
+def get_rule_history() -> RuleHistory:
+    """Get the process-wide rule history, loading RULE_CHANGES on first use."""
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = RuleHistory()
+            for change in RULE_CHANGES:
+                _history.add_version(
+                    change["source"],
+                    change["state"],
+                    change["effective"],
+                    change["changes"]
+                )
+        return _history
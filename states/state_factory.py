@@ -3,19 +3,44 @@ Factory for creating state-specific instances.
 """
 
 import importlib
-from typing import Dict, Any, Type
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Type
 from states.base_state import BaseState
-from states.state_data import STATE_DATA
-from states.requirements.professional_llc import PROFESSIONAL_LLC_REQUIREMENTS
-from states.requirements.foreign_llc import FOREIGN_LLC_REQUIREMENTS
-from states.requirements.tax import TAX_REGISTRATION_REQUIREMENTS
+from states.data_driven_state import DataDrivenState
+from states.state_record import (
+    StateRecord,
+    get_state_records,
+    invalidate_state_records,
+    thaw
+)
 from states.requirements.regulated_professions import REGULATED_PROFESSIONS
 
+# States with hand-written implementations; all others are data-driven
+STATE_OVERRIDES = {
+    "CA": "states.ca.state",
+    "DE": "states.de.state"
+}
+
 class StateFactory:
-    """Factory for creating state-specific instances."""
+    """
+    Factory for creating state-specific instances.
     
-    @staticmethod
-    def get_state(state_code: str) -> BaseState:
+    State objects are built once per state code and shared from a
+    thread-safe registry, so repeated lookups are a dictionary access.
+    States are built from the merged state records and are data-driven
+    unless listed in STATE_OVERRIDES.
+    """
+    
+    _registry: Dict[str, BaseState] = {}
+    _lock = threading.RLock()
+    _stats = {
+        "hits": 0,
+        "misses": 0,
+        "invalidations": 0
+    }
+    
+    @classmethod
+    def get_state(cls, state_code: str) -> BaseState:
         """
         Get state-specific implementation.
         
@@ -23,40 +48,118 @@ class StateFactory:
             state_code: Two-letter state code (e.g., 'CA' for California)
             
         Returns:
-            Instance of state-specific implementation
+            Shared instance of state-specific implementation
         """
-        try:
-            # Import state-specific module
-            module = importlib.import_module(f"states.{state_code.lower()}.state")
-            
-            # Get state class (assumed to be named after the state)
-            state_name = STATE_DATA[state_code].get("name", state_code)
-            state_class: Type[BaseState] = getattr(module, state_name)
-            
-            # Create instance with requirements
-            return state_class(
-                professional_requirements=PROFESSIONAL_LLC_REQUIREMENTS.get(
-                    state_code,
-                    PROFESSIONAL_LLC_REQUIREMENTS["default"]
-                ),
-                foreign_requirements=FOREIGN_LLC_REQUIREMENTS.get(
-                    state_code,
-                    FOREIGN_LLC_REQUIREMENTS["default"]
-                ),
-                tax_requirements=TAX_REGISTRATION_REQUIREMENTS.get(
-                    state_code,
-                    TAX_REGISTRATION_REQUIREMENTS["default"]
-                ),
-                regulated_professions=REGULATED_PROFESSIONS
-            )
+        state_code = state_code.upper()
+        state = cls._registry.get(state_code)
+        if state is not None:
+            # Counted without the lock; approximate under heavy contention
+            cls._stats["hits"] += 1
+            return state
+        
+        with cls._lock:
+            state = cls._registry.get(state_code)
+            if state is None:
+                state = cls._build_state(state_code)
+                cls._registry[state_code] = state
+                cls._stats["misses"] += 1
+            else:
+                cls._stats["hits"] += 1
+            return state
+    
+    @classmethod
+    def preload(cls, state_codes: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Eagerly build state instances, e.g. at application startup.
+        
+        Args:
+            state_codes: State codes to build (defaults to every implemented state)
             
-        except ImportError:
+        Returns:
+            List of state codes now held in the registry
+        """
+        for state_code in state_codes or cls.get_available_states():
+            cls.get_state(state_code)
+        return sorted(cls._registry)
+    
+    @classmethod
+    def invalidate(cls, state_code: Optional[str] = None) -> None:
+        """
+        Drop cached state instances after a data reload.
+        
+        The state record index is rebuilt on next use as well, since records
+        are built for every state at once.
+        
+        Args:
+            state_code: State code to drop (defaults to every state)
+        """
+        with cls._lock:
+            if state_code is None:
+                cls._registry.clear()
+            else:
+                cls._registry.pop(state_code.upper(), None)
+            invalidate_state_records()
+            cls._stats["invalidations"] += 1
+    
+    @classmethod
+    def get_registry_stats(cls) -> Dict[str, int]:
+        """
+        Get registry instrumentation.
+        
+        Returns:
+            Dictionary with hit, miss and invalidation counts and registry size
+        """
+        return {**cls._stats, "size": len(cls._registry)}
+    
+    @staticmethod
+    def get_available_states() -> List[str]:
+        """
+        Get the codes of all supported states.
+        
+        Returns:
+            Sorted list of two-letter state codes
+        """
+        return list(get_state_records())
+    
+    @staticmethod
+    def _requirements(record: StateRecord) -> Dict[str, Any]:
+        """Get the requirement tables passed to a state implementation."""
+        return {
+            "professional_requirements": thaw(record.professional),
+            "foreign_requirements": thaw(record.foreign),
+            "tax_requirements": thaw(record.tax_registration),
+            "regulated_professions": REGULATED_PROFESSIONS
+        }
+    
+    @classmethod
+    def _build_state(cls, state_code: str) -> BaseState:
+        """Construct the implementation for a state."""
+        record = get_state_records().get(state_code)
+        if record is None:
             raise ValueError(f"No implementation found for state code: {state_code}")
-        except AttributeError:
+        
+        requirements = cls._requirements(record)
+        if state_code not in STATE_OVERRIDES:
+            return DataDrivenState(thaw(record.table), **requirements)
+        
+        module = importlib.import_module(STATE_OVERRIDES[state_code])
+        
+        # Get the state class defined in the module
+        state_class: Optional[Type[BaseState]] = next(
+            (
+                obj for obj in vars(module).values()
+                if isinstance(obj, type) and issubclass(obj, BaseState)
+                and obj.__module__ == module.__name__
+            ),
+            None
+        )
+        if state_class is None:
             raise ValueError(f"Invalid state implementation for state code: {state_code}")
-
-    @staticmethod
-    def get_requirements(state_code: str) -> Dict[str, Any]:
+        
+        return state_class(**requirements)
+    
+    @classmethod
+    def get_requirements(cls, state_code: str) -> Dict[str, Any]:
         """
         Get comprehensive requirements for a state.
         
@@ -65,20 +168,14 @@ class StateFactory:
             
         Returns:
             Dictionary containing all requirements for the state
+            
+        Raises:
+            KeyError: If state code is invalid
         """
+        record = get_state_records().get(state_code.upper())
+        if record is None:
+            raise KeyError(f"Invalid state code: {state_code}")
         return {
-            "state_data": STATE_DATA.get(state_code, {}),
-            "professional_requirements": PROFESSIONAL_LLC_REQUIREMENTS.get(
-                state_code,
-                PROFESSIONAL_LLC_REQUIREMENTS["default"]
-            ),
-            "foreign_requirements": FOREIGN_LLC_REQUIREMENTS.get(
-                state_code,
-                FOREIGN_LLC_REQUIREMENTS["default"]
-            ),
-            "tax_requirements": TAX_REGISTRATION_REQUIREMENTS.get(
-                state_code,
-                TAX_REGISTRATION_REQUIREMENTS["default"]
-            ),
-            "regulated_professions": REGULATED_PROFESSIONS
+            "state_data": thaw(record.state_data) or {},
+            **cls._requirements(record)
         }
@@ -0,0 +1,351 @@
+"""
+Columnar state metrics table for vectorized cross-state queries.
+"""
+
+import math
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.state_requirements import STATE_REQUIREMENTS
+from core.state_tax_requirements import STATE_TAX_REQUIREMENTS
+from states.requirements.tax import TAX_REGISTRATION_REQUIREMENTS
+from states.state_factory import StateFactory
+from states.state_table import STATE_TABLE
+
+# Numeric columns; NaN marks a value no state table provides
+NUMERIC_COLUMNS = [
+    "formation_fee",
+    "expedited_fee",
+    "name_reservation_fee",
+    "annual_report_fee",
+    "processing_days",
+    "franchise_tax_min",
+    "franchise_tax_threshold",
+    "sales_tax_rate",
+    "foreign_qualification_fee"
+]
+
+# Flag columns, stored as 1.0/0.0 with NaN for unknown
+FLAG_COLUMNS = [
+    "annual_report_required",
+    "publication_required",
+    "series_llc_allowed",
+    "professional_llc_allowed",
+    "franchise_tax_required",
+    "has_data"
+]
+
+COLUMNS = NUMERIC_COLUMNS + FLAG_COLUMNS
+
+# Filter operators accepted as `<column>__<op>` keyword suffixes
+OPERATORS: Dict[str, Callable[[np.ndarray, Any], np.ndarray]] = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: (column != value) & ~np.isnan(column),
+    "lt": lambda column, value: column < value,
+    "le": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "ge": lambda column, value: column >= value,
+    "in": lambda column, value: np.isin(column, list(value)),
+    "isnull": lambda column, value: np.isnan(column) == bool(value)
+}
+
+def _first_number(*values: Any) -> float:
+    """Get the first numeric value, or NaN if there is none."""
+    for value in values:
+        if isinstance(value, bool) or value is None:
+            continue
+        if isinstance(value, (int, float)):
+            return float(value)
+    return math.nan
+
+def _first_flag(*values: Any) -> float:
+    """Get the first boolean value as 1.0/0.0, or NaN if there is none."""
+    for value in values:
+        if isinstance(value, bool):
+            return float(value)
+    return math.nan
+
+def _get(data: Dict[str, Any], *path: str) -> Any:
+    """Follow a key path through nested dicts, returning None if any step is missing."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+def derive_state_metrics(state_code: str) -> Dict[str, float]:
+    """
+    Derive the metric values of one state from all state tables.
+    
+    Values supplied by a hand-written state implementation (see
+    BaseState.get_state_metrics()) take precedence over the tables.
+    
+    Args:
+        state_code: Two-letter state code
+        
+    Returns:
+        Dictionary with one float per column; has_data is 0.0 when no state
+        table provides any metric for the state
+        
+    Raises:
+        KeyError: If a state implementation supplies an unknown column
+    """
+    record = STATE_TABLE[state_code]
+    requirements = STATE_REQUIREMENTS.get(state_code, {})
+    fees = _get(requirements, "formation_requirements", "fees") or {}
+    tax = STATE_TAX_REQUIREMENTS.get(state_code, {})
+    registration = TAX_REGISTRATION_REQUIREMENTS.get(state_code, {})
+    annual_report = record["annual_report"]
+    franchise_tax = record["franchise_tax"]
+    
+    annual_report_fee = math.nan
+    if annual_report is not None:
+        annual_report_fee = annual_report["fee"] if annual_report["required"] else 0.0
+    
+    franchise_tax_min = math.nan
+    if franchise_tax is not None:
+        franchise_tax_min = franchise_tax["minimum"] if franchise_tax["required"] else 0.0
+    
+    sales_tax_required = _get(tax, "tax_structure", "sales_tax", "required")
+    sales_tax_rate = _first_number(
+        _get(registration, "tax_rates", "sales_tax", "state_rate"),
+        _get(tax, "tax_structure", "sales_tax", "base_rate"),
+        0.0 if sales_tax_required is False else None
+    )
+    
+    metrics = {
+        "formation_fee": _first_number(record["formation_fee"], fees.get("formation")),
+        "expedited_fee": _first_number(record["expedited_fee"], fees.get("expedited")),
+        "name_reservation_fee": _first_number(record["name_reservation_fee"]),
+        "annual_report_fee": _first_number(
+            annual_report_fee,
+            fees.get("annual_report"),
+            _get(tax, "filing_requirements", "annual_report", "fee")
+        ),
+        "processing_days": _first_number(_get(record, "processing_time", "standard")),
+        "franchise_tax_min": _first_number(
+            franchise_tax_min,
+            _get(tax, "tax_structure", "business_privilege_tax", "minimum"),
+            _get(registration, "tax_rates", "franchise_tax", "minimum"),
+            _get(registration, "tax_rates", "franchise_tax", "flat_fee")
+        ),
+        "franchise_tax_threshold": _first_number(
+            _get(registration, "tax_rates", "franchise_tax", "threshold")
+        ),
+        "sales_tax_rate": sales_tax_rate,
+        "annual_report_required": _first_flag(
+            annual_report and annual_report["required"],
+            _get(tax, "filing_requirements", "annual_report", "required"),
+            _get(tax, "filing_requirements", "annual_report")
+        ),
+        "publication_required": _first_flag(
+            record["publication_required"],
+            _get(requirements, "formation_requirements", "filing_requirements", "publication")
+        ),
+        "series_llc_allowed": _first_flag(record["series_llc_allowed"]),
+        "professional_llc_allowed": _first_flag(record["professional_llc_allowed"]),
+        "franchise_tax_required": _first_flag(
+            franchise_tax and franchise_tax["required"],
+            _get(tax, "tax_structure", "business_privilege_tax", "required")
+        ),
+        "foreign_qualification_fee": math.nan
+    }
+    for name, value in StateFactory.get_state(state_code).get_state_metrics().items():
+        if name not in metrics:
+            raise KeyError(f"Unknown column: {name}")
+        metrics[name] = float(value)
+    metrics["has_data"] = float(any(not math.isnan(value) for value in metrics.values()))
+    return metrics
+
+class StateMetricsTable:
+    """
+    One row per state, one NumPy array per metric.
+    
+    Filters, sorts and top-k selections are array operations and return a
+    new table over the selected rows, so they can be chained.
+    """
+    
+    def __init__(self, state_codes: np.ndarray, columns: Dict[str, np.ndarray]):
+        """
+        Initialize the table.
+        
+        Args:
+            state_codes: Array of state codes, one per row
+            columns: Mapping of column name to float array aligned with state_codes
+        """
+        self.state_codes = state_codes
+        self.columns = columns
+    
+    @classmethod
+    def build(cls, state_codes: Optional[Iterable[str]] = None) -> "StateMetricsTable":
+        """
+        Build the table from the state tables.
+        
+        Args:
+            state_codes: States to include (defaults to every state)
+            
+        Returns:
+            New metrics table
+        """
+        codes = sorted(state_codes or STATE_TABLE)
+        rows = [derive_state_metrics(code) for code in codes]
+        return cls(
+            np.array(codes),
+            {name: np.array([row[name] for row in rows], dtype=float) for name in COLUMNS}
+        )
+    
+    def __len__(self) -> int:
+        return len(self.state_codes)
+    
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get a column array.
+        
+        Args:
+            name: Column name
+            
+        Returns:
+            Float array aligned with state_codes
+            
+        Raises:
+            KeyError: If the column does not exist
+        """
+        if name not in self.columns:
+            raise KeyError(f"Unknown column: {name}")
+        return self.columns[name]
+    
+    def mask(self, **conditions: Any) -> np.ndarray:
+        """
+        Evaluate filter conditions into a boolean row mask.
+        
+        Conditions are `column=value` for equality or `column__op=value` with
+        op one of eq, ne, lt, le, gt, ge, in, isnull. Rows with an unknown
+        (NaN) value never match a comparison.
+        
+        Args:
+            **conditions: Filter conditions, combined with AND
+            
+        Returns:
+            Boolean array aligned with state_codes
+        """
+        result = np.ones(len(self), dtype=bool)
+        for key, value in conditions.items():
+            name, _, op = key.partition("__")
+            op = op or "eq"
+            if op not in OPERATORS:
+                raise ValueError(f"Unknown filter operator: {op}")
+            if isinstance(value, bool):
+                value = float(value)
+            result &= OPERATORS[op](self.column(name), value)
+        return result
+    
+    def select(self, rows: np.ndarray) -> "StateMetricsTable":
+        """
+        Get a table over a subset of rows.
+        
+        Args:
+            rows: Boolean mask or integer index array
+            
+        Returns:
+            New metrics table
+        """
+        return StateMetricsTable(
+            self.state_codes[rows],
+            {name: values[rows] for name, values in self.columns.items()}
+        )
+    
+    def filter(self, **conditions: Any) -> "StateMetricsTable":
+        """
+        Get the rows matching all conditions (see mask()).
+        
+        Returns:
+            New metrics table
+        """
+        return self.select(self.mask(**conditions))
+    
+    def sort(self, column: str, descending: bool = False) -> "StateMetricsTable":
+        """
+        Sort rows by a column; unknown values sort last.
+        
+        Args:
+            column: Column to sort by
+            descending: Sort largest first
+            
+        Returns:
+            New metrics table
+        """
+        values = self.column(column)
+        keys = -values if descending else values
+        return self.select(np.argsort(keys, kind="stable"))
+    
+    def top_k(self, column: str, k: int, largest: bool = False) -> "StateMetricsTable":
+        """
+        Get the k rows with the smallest (or largest) values of a column.
+        
+        Args:
+            column: Column to rank by
+            k: Number of rows to keep
+            largest: Keep the largest values instead of the smallest
+            
+        Returns:
+            New metrics table, ordered by the column
+        """
+        values = self.column(column)
+        keys = -values if largest else values
+        if k < len(self):
+            candidates = np.argpartition(keys, k)[:k]
+            return self.select(candidates[np.argsort(keys[candidates], kind="stable")])
+        return self.select(np.argsort(keys, kind="stable"))
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Get the rows as dictionaries.
+        
+        Returns:
+            List of dictionaries with a state_code key and one key per column;
+            unknown values are None
+        """
+        records = []
+        for index, state_code in enumerate(self.state_codes):
+            record = {"state_code": str(state_code)}
+            for name, values in self.columns.items():
+                value = values[index]
+                if np.isnan(value):
+                    record[name] = None
+                elif name in FLAG_COLUMNS:
+                    record[name] = bool(value)
+                else:
+                    record[name] = float(value)
+            records.append(record)
+        return records
+    
+    def to_dataframe(self):
+        """
+        Get the table as a pandas DataFrame indexed by state code.
+        
+        Returns:
+            pandas.DataFrame
+        """
+        import pandas as pd
+        return pd.DataFrame(self.columns, index=pd.Index(self.state_codes, name="state_code"))
+
+_table: Optional[StateMetricsTable] = None
+_table_lock = threading.Lock()
+
+def get_metrics_table(rebuild: bool = False) -> StateMetricsTable:
+    """
+    Get the process-wide state metrics table, building it on first use.
+    
+    Args:
+        rebuild: Rebuild the table, e.g. after the state data changed
+        
+    Returns:
+        Metrics table covering every state
+    """
+    global _table
+    with _table_lock:
+        if _table is None or rebuild:
+            _table = StateMetricsTable.build()
+        return _table
@@ -0,0 +1,228 @@
+"""
+Merged, read-only state records built once per process.
+"""
+
+import math
+import threading
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from core.state_compliance import STATE_COMPLIANCE_REQUIREMENTS
+from core.state_requirements import STATE_REQUIREMENTS
+from core.state_tax_requirements import STATE_TAX_REQUIREMENTS
+from states.requirements.foreign_llc import FOREIGN_LLC_REQUIREMENTS
+from states.requirements.professional_llc import PROFESSIONAL_LLC_REQUIREMENTS
+from states.requirements.tax import TAX_REGISTRATION_REQUIREMENTS
+from states.state_data import STATE_DATA
+from states.state_table import STATE_NAMES, STATE_TABLE
+
+# Source table -> (data, sections every entry must provide as dictionaries)
+RECORD_SOURCES: Dict[str, Tuple[Dict[str, Any], Tuple[str, ...]]] = {
+    "state_data": (STATE_DATA, ()),
+    "requirements": (STATE_REQUIREMENTS, ("formation_requirements",)),
+    "tax": (STATE_TAX_REQUIREMENTS, ("tax_structure", "filing_requirements")),
+    "compliance": (
+        STATE_COMPLIANCE_REQUIREMENTS,
+        ("initial_requirements", "ongoing_requirements", "employment_requirements")
+    ),
+    "professional": (PROFESSIONAL_LLC_REQUIREMENTS, ()),
+    "foreign": (FOREIGN_LLC_REQUIREMENTS, ()),
+    "tax_registration": (TAX_REGISTRATION_REQUIREMENTS, ())
+}
+
+# Sources that fall back to their "default" entry for states without one
+DEFAULTED_SOURCES = ("professional", "foreign", "tax_registration")
+
+def freeze(value: Any) -> Any:
+    """
+    Make a nested value read-only.
+    
+    Args:
+        value: Value built from dicts, lists and scalars
+        
+    Returns:
+        Same value with dicts as read-only mappings and lists as tuples
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """
+    Copy a frozen value back into plain dicts and lists.
+    
+    Args:
+        value: Value returned by freeze()
+        
+    Returns:
+        Mutable copy
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+@dataclass(frozen=True)
+class StateRecord:
+    """
+    Everything known about one state, merged from every state table.
+    
+    Sections a table does not provide for the state are None; the
+    professional, foreign and tax registration sections fall back to the
+    tables' defaults. All nested values are read-only.
+    """
+    __slots__ = (
+        "state_code",
+        "state_name",
+        "table",
+        "state_data",
+        "requirements",
+        "tax",
+        "compliance",
+        "professional",
+        "foreign",
+        "tax_registration",
+        "sources"
+    )
+    
+    state_code: str
+    state_name: str
+    table: Mapping[str, Any]
+    state_data: Optional[Mapping[str, Any]]
+    requirements: Optional[Mapping[str, Any]]
+    tax: Optional[Mapping[str, Any]]
+    compliance: Optional[Mapping[str, Any]]
+    professional: Mapping[str, Any]
+    foreign: Mapping[str, Any]
+    tax_registration: Mapping[str, Any]
+    sources: Tuple[str, ...]
+    
+    def has(self, source: str) -> bool:
+        """Check whether a table provides the state's own entry."""
+        return source in self.sources
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Get a mutable copy of the record."""
+        return {field.name: thaw(getattr(self, field.name)) for field in fields(self)}
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+def check_state_sources() -> List[str]:
+    """
+    Check the state tables against each other.
+    
+    Verifies that every entry belongs to a known state, that state names
+    agree, that required sections are present and that formation fees in
+    STATE_DATA and STATE_REQUIREMENTS match.
+    
+    Returns:
+        Description of each problem found (empty if the tables agree)
+    """
+    problems = []
+    for source, (data, sections) in RECORD_SOURCES.items():
+        for state_code, entry in data.items():
+            if state_code == "default" and source in DEFAULTED_SOURCES:
+                continue
+            if state_code not in STATE_NAMES:
+                problems.append(f"{source}: unknown state code {state_code}")
+                continue
+            if not isinstance(entry, dict):
+                problems.append(f"{source}.{state_code}: entry is not a dictionary")
+                continue
+            name = entry.get("name")
+            if name is not None and name != STATE_NAMES[state_code]:
+                problems.append(
+                    f"{source}.{state_code}: name {name!r} does not match "
+                    f"{STATE_NAMES[state_code]!r}"
+                )
+            for section in sections:
+                if not isinstance(entry.get(section), dict):
+                    problems.append(f"{source}.{state_code}: missing section {section}")
+    
+    for state_code, entry in STATE_REQUIREMENTS.items():
+        fees = entry.get("formation_requirements", {}).get("fees", {})
+        listed = _number(fees.get("formation")) if isinstance(fees, dict) else None
+        compiled = _number(STATE_DATA.get(state_code, {}).get("formation_fee"))
+        if listed is not None and compiled is not None and not math.isclose(listed, compiled):
+            problems.append(
+                f"{state_code}: formation fee {compiled} in state_data differs from "
+                f"{listed} in requirements"
+            )
+    return problems
+
+def build_state_records() -> Mapping[str, StateRecord]:
+    """
+    Merge every state table into one record per state.
+    
+    Returns:
+        Read-only mapping of state code to record
+        
+    Raises:
+        ValueError: If the state tables are inconsistent
+    """
+    problems = check_state_sources()
+    if problems:
+        raise ValueError("Inconsistent state data:\n- " + "\n- ".join(problems))
+    
+    records = {}
+    for state_code in sorted(STATE_NAMES):
+        sections = {}
+        for source, (data, _) in RECORD_SOURCES.items():
+            entry = data.get(state_code)
+            if entry is None and source in DEFAULTED_SOURCES:
+                entry = data["default"]
+            sections[source] = freeze(entry)
+        records[state_code] = StateRecord(
+            state_code=state_code,
+            state_name=STATE_NAMES[state_code],
+            table=freeze(STATE_TABLE[state_code]),
+            sources=tuple(
+                source for source, (data, _) in RECORD_SOURCES.items() if state_code in data
+            ),
+            **sections
+        )
+    return MappingProxyType(records)
+
+_records: Optional[Mapping[str, StateRecord]] = None
+_records_lock = threading.Lock()
+
+def get_state_records() -> Mapping[str, StateRecord]:
+    """Get the process-wide state records, building them on first use."""
+    global _records
+    if _records is not None:
+        return _records
+    with _records_lock:
+        if _records is None:
+            _records = build_state_records()
+        return _records
+
+def invalidate_state_records() -> None:
+    """Drop the state records so the next lookup rebuilds them from the source data."""
+    global _records
+    with _records_lock:
+        _records = None
+
+def get_state_record(state_code: str) -> StateRecord:
+    """
+    Get the merged record of one state.
+    
+    Args:
+        state_code: Two-letter state code
+        
+    Returns:
+        State record
+        
+    Raises:
+        KeyError: If state code is invalid
+    """
+    record = get_state_records().get(state_code.upper())
+    if record is None:
+        raise KeyError(f"Invalid state code: {state_code}")
+    return record
@@ -0,0 +1,132 @@
+"""
+Compiled state data table used by the data-driven state implementation.
+"""
+
+from typing import Dict, Any, Optional
+from states.state_data import STATE_DATA
+
+STATE_NAMES = {
+    "AL": "Alabama",
+    "AK": "Alaska",
+    "AZ": "Arizona",
+    "AR": "Arkansas",
+    "CA": "California",
+    "CO": "Colorado",
+    "CT": "Connecticut",
+    "DE": "Delaware",
+    "FL": "Florida",
+    "GA": "Georgia",
+    "HI": "Hawaii",
+    "ID": "Idaho",
+    "IL": "Illinois",
+    "IN": "Indiana",
+    "IA": "Iowa",
+    "KS": "Kansas",
+    "KY": "Kentucky",
+    "LA": "Louisiana",
+    "ME": "Maine",
+    "MD": "Maryland",
+    "MA": "Massachusetts",
+    "MI": "Michigan",
+    "MN": "Minnesota",
+    "MS": "Mississippi",
+    "MO": "Missouri",
+    "MT": "Montana",
+    "NE": "Nebraska",
+    "NV": "Nevada",
+    "NH": "New Hampshire",
+    "NJ": "New Jersey",
+    "NM": "New Mexico",
+    "NY": "New York",
+    "NC": "North Carolina",
+    "ND": "North Dakota",
+    "OH": "Ohio",
+    "OK": "Oklahoma",
+    "OR": "Oregon",
+    "PA": "Pennsylvania",
+    "RI": "Rhode Island",
+    "SC": "South Carolina",
+    "SD": "South Dakota",
+    "TN": "Tennessee",
+    "TX": "Texas",
+    "UT": "Utah",
+    "VT": "Vermont",
+    "VA": "Virginia",
+    "WA": "Washington",
+    "WV": "West Virginia",
+    "WI": "Wisconsin",
+    "WY": "Wyoming"
+}
+
+def _compile_annual_report(value: Any) -> Optional[Dict[str, Any]]:
+    """Normalize the annual report entry (a flag or a detail dict)."""
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return {
+            "required": value.get("required", True),
+            "fee": float(value.get("fee", 0.0)),
+            "due": value.get("due", "")
+        }
+    return {"required": bool(value), "fee": 0.0, "due": ""}
+
+def _compile_franchise_tax(value: Any) -> Optional[Dict[str, Any]]:
+    """Normalize the franchise tax entry (a flag or a detail dict)."""
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return {
+            "required": value.get("required", False),
+            "minimum": float(value.get("minimum", 0.0)),
+            "notes": value.get("notes")
+        }
+    return {"required": bool(value), "minimum": 0.0, "notes": None}
+
+def compile_state_record(state_code: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Compile raw state data into a normalized table row.
+    
+    Fields the source data does not provide are None, so consumers can tell
+    missing data apart from a real zero.
+    
+    Args:
+        state_code: Two-letter state code
+        data: Raw entry from STATE_DATA, if any
+        
+    Returns:
+        Dictionary with one normalized field per state fact
+    """
+    data = data or {}
+    formation_fee = data.get("formation_fee")
+    
+    return {
+        "state_code": state_code,
+        "state_name": STATE_NAMES[state_code],
+        "has_data": bool(data),
+        "filing_agency": data.get("filing_agency"),
+        "formation_fee": float(formation_fee) if formation_fee is not None else None,
+        "expedited_fee": data.get("processing_time", {}).get("expedited_fee"),
+        "name_reservation_fee": data.get("name_reservation_fee"),
+        "name_reservation_duration": data.get("name_reservation_duration"),
+        "processing_time": dict(data["processing_time"]) if "processing_time" in data else None,
+        "annual_report": _compile_annual_report(data.get("annual_report")),
+        "publication_required": data.get("publication_required"),
+        "publication_requirements": data.get("publication_requirements"),
+        "series_llc_allowed": data.get("series_llc_allowed"),
+        "professional_llc_allowed": data.get("professional_llc_allowed"),
+        "franchise_tax": _compile_franchise_tax(data.get("franchise_tax"))
+    }
+
+def compile_state_table() -> Dict[str, Dict[str, Any]]:
+    """
+    Compile a table row for every state.
+    
+    Returns:
+        Mapping of state code to normalized state record
+    """
+    return {
+        state_code: compile_state_record(state_code, STATE_DATA.get(state_code))
+        for state_code in STATE_NAMES
+    }
+
+STATE_TABLE = compile_state_table()
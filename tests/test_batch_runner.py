@@ -0,0 +1,30 @@
+"""
+Tests for the process-pool batch runner.
+"""
+
+import multiprocessing
+import os
+
+import pytest
+
+from core.application import LLCBuilder
+from core.batch_runner import run_batch
+
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="workers inherit the patched builder only when forked"
+)
+
+def test_crashed_worker_fails_only_its_record(tmp_path, monkeypatch):
+    def create_llc(self, record):
+        if record.get("crash"):
+            os._exit(1)
+        return {"success": True, "issues": []}
+    
+    monkeypatch.setattr(LLCBuilder, "create_llc", create_llc)
+    records = [{"business_name": f"LLC {i}", "crash": i == 5} for i in range(20)]
+    
+    results = list(run_batch(records, str(tmp_path), workers=2, max_in_flight=4))
+    
+    assert sorted(result["index"] for result in results) == list(range(20))
+    assert [result["index"] for result in results if not result["success"]] == [5]
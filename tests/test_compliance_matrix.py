@@ -0,0 +1,79 @@
+"""
+Tests for the vectorized compliance matrix.
+"""
+
+import random
+
+from core.compliance_matrix import get_compliance_matrix
+from core.state_compliance import STATE_COMPLIANCE_REQUIREMENTS, validate_compliance
+
+SECTION_COLUMNS = {
+    "initial_requirements": "completed_requirements",
+    "ongoing_requirements": "maintained_requirements",
+    "employment_requirements": "employment_compliance"
+}
+
+def _random_entities(count: int) -> list:
+    rng = random.Random(7)
+    entities = []
+    for _ in range(count):
+        state_code = rng.choice(sorted(STATE_COMPLIANCE_REQUIREMENTS))
+        entity = {"state_code": state_code, "has_employees": rng.random() < 0.5}
+        for section, column in SECTION_COLUMNS.items():
+            names = list(STATE_COMPLIANCE_REQUIREMENTS[state_code].get(section, {}))
+            entity[column] = [name for name in names if rng.random() < 0.5]
+        entities.append(entity)
+    return entities
+
+def test_matches_validate_compliance_including_issue_order():
+    entities = _random_entities(300)
+    result = get_compliance_matrix().evaluate(entities)
+    
+    for entity, (_, row) in zip(entities, result.iterrows()):
+        expected = validate_compliance(entity["state_code"], entity)
+        assert row["compliant"] == expected["compliant"]
+        assert row["issues"] == expected["issues"]
+        assert row["issue_count"] == len(expected["issues"])
+
+def test_issues_follow_section_then_source_order():
+    result = get_compliance_matrix().evaluate([
+        {"state_code": "WY", "has_employees": True},
+        {"state_code": "AL", "has_employees": True}
+    ])
+    
+    assert result["issues"].tolist() == [
+        ["Non-compliant with annual_report", "Missing workers_comp"],
+        [
+            "Missing business_license",
+            "Missing tax_registration",
+            "Non-compliant with business_privilege_tax"
+        ]
+    ]
+
+def test_has_employees_strings_are_parsed():
+    result = get_compliance_matrix().evaluate([
+        {"state_code": "WY", "has_employees": "no"},
+        {"state_code": "WY", "has_employees": "yes"},
+        {"state_code": "WY", "has_employees": None}
+    ])
+    employment = [
+        [issue for issue in issues if "workers_comp" in issue] for issues in result["issues"]
+    ]
+    
+    assert employment == [[], ["Missing workers_comp"], []]
+
+def test_unknown_state_is_reported():
+    result = get_compliance_matrix().evaluate([{"state_code": "ZZ"}])
+    
+    assert not result["compliant"].iat[0]
+    assert result["issues"].iat[0] == ["Invalid state code: ZZ"]
+
+def test_null_state_codes_are_reported():
+    result = get_compliance_matrix().evaluate([{"state_code": None}, {"state_code": None}])
+    
+    assert not result["compliant"].any()
+    assert result["issues"].tolist() == [["Invalid state code: None"]] * 2
+    
+    mixed = get_compliance_matrix().evaluate([{"state_code": None}, {"state_code": "wy"}])
+    assert mixed["issues"].iat[0] == ["Invalid state code: None"]
+    assert mixed["issues"].iat[1] == ["Non-compliant with annual_report"]
@@ -0,0 +1,47 @@
+"""
+Tests for the multi-year cost optimizer.
+"""
+
+from core.cost_optimizer import BusinessProfile, CostOptimizer
+from core.fee_engine import get_fee_engine
+
+def _rankings(profile: BusinessProfile) -> list:
+    optimizer = CostOptimizer()
+    return optimizer.rank(profile, top_k=len(optimizer.state_codes))
+
+def test_override_states_use_their_own_costs():
+    rankings = {entry["state_code"]: entry for entry in _rankings(BusinessProfile(horizon_years=3))}
+    
+    assert rankings["CA"]["breakdown"]["franchise_tax"] == 2400.0
+    assert rankings["CA"]["breakdown"]["filing"] == 70.0
+    assert rankings["DE"]["breakdown"]["franchise_tax"] == 900.0
+    assert not rankings["CA"]["estimated"]
+    assert not rankings["DE"]["estimated"]
+
+def test_sourced_states_rank_ahead_of_estimated_ones():
+    rankings = _rankings(BusinessProfile())
+    flags = [entry["estimated"] for entry in rankings]
+    
+    assert flags == sorted(flags)
+    sourced = [entry["total"] for entry in rankings if not entry["estimated"]]
+    assert sourced == sorted(sourced)
+    assert rankings[0]["state_code"] == "TX"
+
+def test_foreign_qualification_uses_registration_fee():
+    rankings = {
+        entry["state_code"]: entry
+        for entry in _rankings(BusinessProfile(home_state="TX", operating_states=["DE"]))
+    }
+    
+    # Delaware registration ($200) plus three years of registered agent fees
+    assert rankings["TX"]["breakdown"]["foreign_qualification"] == 200.0 + 360.0
+    assert rankings["DE"]["breakdown"]["foreign_qualification"] > 0
+    assert not rankings["TX"]["estimated"]
+
+def test_foreign_fee_matches_fee_engine():
+    optimizer = CostOptimizer()
+    engine = get_fee_engine()
+    
+    for code, fee in zip(optimizer.state_codes, optimizer._foreign_fee):
+        quote = engine.quote_state(str(code), ["foreign_qualification"])
+        assert fee == quote["foreign_qualification"]
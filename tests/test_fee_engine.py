@@ -0,0 +1,51 @@
+"""
+Tests for the precompiled fee engine.
+"""
+
+from datetime import date
+
+import pytest
+
+from core import fee_engine
+from core.application import LLCBuilder
+from core.fee_engine import FEE_COMPONENTS, get_fee_engine
+
+def test_publication_estimate_from_numeric_string():
+    quote = get_fee_engine().quote_state("NY", [])
+    
+    assert quote["publication"] == 1000.0
+    assert quote["total"] == quote["formation"] + 1000.0
+
+def test_quote_prices_combinations_across_states():
+    engine = get_fee_engine()
+    quote = engine.quote(["TX", "DE", "NY"], [[], ["expedited", "certified_copy"]])
+    
+    assert quote["breakdown"].shape == (2, 3, len(FEE_COMPONENTS))
+    assert quote["totals"].shape == (2, 3)
+    assert quote["totals"][1, 1] == 90.0 + 50.0
+    assert (quote["totals"][1] >= quote["totals"][0]).all()
+
+def test_quote_rejects_unknown_services_and_states():
+    engine = get_fee_engine()
+    
+    with pytest.raises(ValueError):
+        engine.quote(["TX"], ["teleport"])
+    with pytest.raises(KeyError):
+        engine.quote(["ZZ"], [])
+
+def test_estimate_costs_keeps_breakdown_contract():
+    builder = LLCBuilder.__new__(LLCBuilder)
+    costs = builder.estimate_costs("NY", ["expedited", "teleport"])
+    
+    assert list(costs) == [
+        "formation", "expedited", "registered_agent", "additional_services", "total"
+    ]
+    assert costs["additional_services"] == 1000.0
+    assert costs["total"] == sum(value for key, value in costs.items() if key != "total")
+
+def test_engine_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(fee_engine, "MAX_CACHED_ENGINES", 2)
+    for year in (1990, 2000, 2010, date.today().year):
+        get_fee_engine(date(year, 1, 1))
+    
+    assert len(fee_engine._engines) <= 2
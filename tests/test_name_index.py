@@ -0,0 +1,41 @@
+"""
+Tests for the name distinguishability index.
+"""
+
+from core.name_index import NameIndex
+
+NAMES = [
+    "Acme Holdings LLC",
+    "Acme Holding Co",
+    "The Acme Group, Inc.",
+    "Blue River Partners LLC",
+    "Blue Rivers Partners",
+    "Northwind Traders LLC"
+]
+
+def _index() -> NameIndex:
+    index = NameIndex()
+    index.add_many(NAMES)
+    index.remove("Acme Holding Co")
+    return index
+
+def test_find_similar_many_matches_single_lookups():
+    index = _index()
+    queries = ["Acme Holdings", "Blue River Partners", "Northwind", "", "Zephyr Labs LLC"]
+    
+    for threshold in (0.5, 0.8):
+        batched = index.find_similar_many(queries, threshold)
+        assert batched == [index.find_similar(query, threshold) for query in queries]
+    assert [match["name"] for match in batched[1]] == [
+        "Blue River Partners LLC", "Blue Rivers Partners"
+    ]
+
+def test_removed_and_exact_names():
+    index = _index()
+    
+    assert index.check_name("ACME holdings, l.l.c.")["exact_match"] == "Acme Holdings LLC"
+    assert "Acme Holding Co" not in index
+    assert all(
+        match["name"] != "Acme Holding Co" for match in index.find_similar("Acme Holding", 0.5)
+    )
+    assert index.find_similar_many([]) == []
@@ -0,0 +1,61 @@
+"""
+Tests for the chainable state query API.
+"""
+
+import pytest
+
+from states.query import parse_condition, parse_query, where
+from states.state_metrics import get_metrics_table
+
+def _expected(predicate) -> list:
+    return sorted(
+        record["state_code"] for record in get_metrics_table().to_records() if predicate(record)
+    )
+
+def test_repeated_conditions_on_a_column_all_apply():
+    query = where(formation_fee__lt=100).where(formation_fee__lt=200)
+    
+    assert sorted(query.codes()) == _expected(
+        lambda record: record["formation_fee"] is not None and record["formation_fee"] < 100
+    )
+    assert query.signature == where(formation_fee__lt=200).where(formation_fee__lt=100).signature
+
+def test_range_filter_matches_python_filter():
+    query = where(formation_fee__ge=100, formation_fee__le=200, series_llc_allowed=True)
+    
+    assert sorted(query.codes()) == _expected(
+        lambda record: record["formation_fee"] is not None
+        and 100 <= record["formation_fee"] <= 200
+        and record["series_llc_allowed"] is True
+    )
+
+def test_order_by_and_limit():
+    codes = where(formation_fee__isnull=False).order_by("-formation_fee").limit(3).codes()
+    fees = {
+        record["state_code"]: record["formation_fee"]
+        for record in get_metrics_table().to_records()
+    }
+    
+    assert len(codes) == 3
+    assert [fees[code] for code in codes] == sorted(
+        (fee for fee in fees.values() if fee is not None), reverse=True
+    )[:3]
+
+def test_first_respects_limit():
+    query = where(formation_fee__isnull=False).order_by("formation_fee")
+    
+    assert query.first()["state_code"] == query.codes()[0]
+    assert query.limit(0).first() is None
+
+def test_parse_query_keeps_every_condition():
+    query = parse_query(["formation_fee < 200", "formation_fee < 100"])
+    
+    assert query.codes() == where(formation_fee__lt=100).codes()
+
+def test_invalid_input_is_rejected():
+    with pytest.raises(KeyError):
+        where(no_such_column=1)
+    with pytest.raises(ValueError):
+        where(formation_fee__between=1)
+    with pytest.raises(ValueError):
+        parse_condition("formation_fee ~ 3")
@@ -0,0 +1,99 @@
+"""
+Tests for incremental refinement of formation packages.
+"""
+
+import asyncio
+
+from agents.evaluation_analyst.agent import EvaluationAnalystAgent
+from core.agent_manager import AgentManager
+from core.refinement import FORMATION_STEPS, RefinementEngine
+
+def _ready() -> dict:
+    return {"status": "ready", "errors": []}
+
+def _run(engine: RefinementEngine, workflow_state: dict, evaluation_result: dict) -> dict:
+    return asyncio.run(engine.refine({"state_code": "AL"}, workflow_state, evaluation_result))
+
+def test_single_step_defect_reruns_only_that_step_and_dependents():
+    evaluator = EvaluationAnalystAgent()
+    workflow_state = {step.name: _ready() for step in FORMATION_STEPS}
+    workflow_state["financial"] = {"status": "error", "errors": ["No bank account plan"]}
+    calls = []
+    
+    async def run_step(step, business_details, state, feedback):
+        calls.append(step.name)
+        return _ready()
+    
+    async def evaluate(state):
+        return evaluator.evaluate_package(state)
+    
+    engine = RefinementEngine(run_step, evaluate, max_iterations=3)
+    result = _run(engine, workflow_state, evaluator.evaluate_package(workflow_state))
+    
+    assert result["is_valid"]
+    assert result["rerun_steps"] == [["financial", "governance", "pmo"]]
+    assert calls == ["financial", "governance", "pmo"]
+
+def test_evaluator_localizes_failures_to_steps():
+    workflow_state = {step.name: _ready() for step in FORMATION_STEPS}
+    workflow_state["hr"] = {"status": "error", "errors": ["Missing handbook"]}
+    del workflow_state["pmo"]
+    
+    result = EvaluationAnalystAgent().evaluate_package(workflow_state)
+    
+    assert not result["is_valid"]
+    assert result["invalid_steps"] == ["hr", "pmo"]
+    assert {"step": "hr", "issue": "Missing handbook"} in result["issues"]
+
+def test_issue_categories_map_to_steps():
+    engine = RefinementEngine(None, None)
+    workflow_state = {step.name: _ready() for step in FORMATION_STEPS}
+    
+    invalid = engine.identify_invalid_steps(
+        {"issues": [{"category": "Financial", "issue": "Budget missing"}]},
+        workflow_state
+    )
+    
+    assert list(invalid) == ["financial"]
+
+def test_unlocalized_failure_flags_every_step():
+    engine = RefinementEngine(None, None)
+    workflow_state = {step.name: _ready() for step in FORMATION_STEPS}
+    
+    invalid = engine.identify_invalid_steps({"is_valid": False}, workflow_state)
+    
+    assert list(invalid) == [step.name for step in FORMATION_STEPS]
+
+def test_validation_failure_reruns_only_failing_steps():
+    outputs = {
+        "legal": "documents", "hr": "package", "financial": "setup",
+        "governance": "framework", "pmo": "setup"
+    }
+    
+    def output(step_name: str) -> dict:
+        return {**_ready(), outputs[step_name]: {"step": step_name}}
+    
+    class Evaluator(EvaluationAnalystAgent):
+        async def process(self, workflow_state):
+            return {"is_valid": True, "report": {"summary": "ok"}}
+    
+    calls = []
+    
+    async def run_step(step, business_details, state, feedback):
+        calls.append(step.name)
+        return output(step.name)
+    
+    manager = AgentManager.__new__(AgentManager)
+    manager.agents = {"evaluation": Evaluator()}
+    workflow_state = {step.name: output(step.name) for step in FORMATION_STEPS}
+    workflow_state["governance"] = {"status": "error", "errors": ["No operating agreement"]}
+    evaluation_result = asyncio.run(manager._evaluate_package(workflow_state))
+    
+    package = asyncio.run(manager._handle_validation_failure(
+        {"state_code": "AL"}, workflow_state, evaluation_result, run_step
+    ))
+    
+    assert evaluation_result["invalid_steps"] == ["governance"]
+    assert calls == ["governance", "pmo"]
+    assert package["evaluation_report"] == {"summary": "ok"}
+    assert package["governance_framework"] == {"step": "governance"}